@@ -0,0 +1,1119 @@
+## Benchmarks do núcleo do sistema bancário (pacote sistema_bancario).
+## Roda sem terminal interativo e grava os resultados em JSON para comparação entre versões.
+## Uso:
+##   python benchmark_sistema_bancario.py --saida resultados.json
+##   python benchmark_sistema_bancario.py --cenarios nucleo --tamanhos 10000 100000 1000000 10000000
+
+import argparse
+import contextlib
+import copy
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from sistema_bancario.carga import PerfilCarga, gerar_cadastro, gerar_operacoes, reproduzir
+from sistema_bancario.conciliacao import conciliar
+from sistema_bancario.concorrente import BancoConcorrente
+from sistema_bancario.eventos import SinkArquivoBufferizado, SinkAssincrono, SinkConsole, SinkNulo
+from sistema_bancario.journal import abrir_banco
+from sistema_bancario.mapeado import BancoMapeado
+from sistema_bancario.nucleo import (
+    Banco, CacheExtratos, ContaCorrente, Deposito, Historico, PessoaFisica, Transferencia_Origem, atributos,
+)
+from sistema_bancario.numeracao import AlocadorNumeros
+from sistema_bancario.razao import ARQUIVO_CADASTRO, BancoRazao, caminho_particao, reconstruir
+from sistema_bancario.shards import BancoParticionado
+from sistema_bancario.sqlite import BancoSQLite
+from sistema_bancario.validacao import validar_cnpjs, validar_cpfs
+from sistema_bancario.validadores import validar_cnpj, validar_cpf
+from sistema_bancario.velocidade import MotorVelocidade, RegraVelocidade
+
+AGENCIAS = ("0001", "0002", "0003")
+
+
+def popular_banco(quantidade):
+    banco = Banco(sink=SinkNulo())
+    for numero in range(1, quantidade + 1):
+        cpf = f"{numero:011d}"
+        banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(cpf, numero, AGENCIAS[numero % len(AGENCIAS)])
+    return banco
+
+
+def benchmark_busca(tamanhos=(1_000, 10_000, 100_000, 1_000_000), consultas=100_000, semente=42):
+    resultados = []
+
+    for quantidade in tamanhos:
+        banco = popular_banco(quantidade)
+        gerador = random.Random(semente)
+        chaves = []
+        for _ in range(consultas):
+            numero = gerador.randint(1, quantidade)
+            chaves.append((numero, AGENCIAS[numero % len(AGENCIAS)], f"{numero:011d}"))
+
+        inicio = time.perf_counter()
+        for numero, agencia, _ in chaves:
+            banco.filtrar_conta(numero, agencia)
+        tempo_conta = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for _, _, cpf in chaves:
+            banco.buscar_cliente(cpf)
+        tempo_cliente = time.perf_counter() - inicio
+
+        resultados.append({
+            "contas": quantidade,
+            "filtrar_conta_ns": tempo_conta / consultas * 1e9,
+            "buscar_cliente_ns": tempo_cliente / consultas * 1e9,
+        })
+
+    return resultados
+
+
+def medir_memoria(funcao):
+    tracemalloc.start()
+    resultado = funcao()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return memoria
+
+
+def medir_tempo(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def benchmark_historico(transacoes=200_000):
+    # Referência: um dicionário por transação com data/hora formatada na escrita
+    def historico_dict():
+        lista = []
+        for valor in range(transacoes):
+            lista.append({
+                "tipo": "Deposito",
+                "valor": float(valor),
+                "data_hora": datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+            })
+        return lista
+
+    def historico_colunar():
+        deposito = Deposito(10.0)
+        historico = Historico()
+        for _ in range(transacoes):
+            historico.adicionar_transacao(deposito)
+        return historico
+
+    return {
+        "transacoes": transacoes,
+        "dict_bytes_por_transacao": medir_memoria(historico_dict) / transacoes,
+        "dict_ns_por_insercao": medir_tempo(historico_dict) / transacoes * 1e9,
+        "colunar_bytes_por_transacao": medir_memoria(historico_colunar) / transacoes,
+        "colunar_ns_por_insercao": medir_tempo(historico_colunar) / transacoes * 1e9,
+    }
+
+
+def benchmark_journal(contas=10_000, transacoes=1_000_000, cauda=50_000, semente=42, sincronas=20_000):
+    # Escrita em massa e recuperação com commit assíncrono; vazão do group commit (cada operação
+    # espera o seu fsync) com uma thread e com várias threads compartilhando os fsyncs
+    diretorio = tempfile.mkdtemp(prefix="journal-")
+    gerador = random.Random(semente)
+
+    try:
+        banco, journal = abrir_banco(diretorio, SinkNulo(), registros_por_snapshot=transacoes + contas * 2,
+                                     confirmacao_assincrona=True)
+        for numero in range(1, contas + 1):
+            banco.adicionar_cliente(f"{numero:011d}", f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+            banco.criar_conta(f"{numero:011d}", numero, "0001")
+
+        inicio = time.perf_counter()
+        for _ in range(transacoes):
+            banco.registrar_deposito(gerador.randint(1, contas), "0001", 10.0)
+        tempo_escrita = time.perf_counter() - inicio
+
+        journal.tirar_snapshot()
+        for _ in range(cauda):
+            banco.registrar_deposito(gerador.randint(1, contas), "0001", 10.0)
+        journal.fechar()
+
+        inicio = time.perf_counter()
+        banco_recuperado, journal = abrir_banco(diretorio, SinkNulo())
+        tempo_recuperacao = time.perf_counter() - inicio
+        journal.fechar()
+
+        assert sum(conta.saldo for conta in banco_recuperado.contas) == sum(conta.saldo for conta in banco.contas)
+    finally:
+        shutil.rmtree(diretorio)
+
+    group_commit = {}
+    for trabalhadores in (1, 8):
+        diretorio = tempfile.mkdtemp(prefix="journal-")
+        try:
+            banco, journal = abrir_banco(diretorio, SinkNulo())
+            for numero in range(1, 101):
+                banco.adicionar_cliente(f"{numero:011d}", f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+                banco.criar_conta(f"{numero:011d}", numero, "0001")
+            lote = [("depositar", (gerador.randint(1, 100), "0001", 10.0)) for _ in range(sincronas)]
+
+            with BancoConcorrente(banco, trabalhadores) as concorrente:
+                inicio = time.perf_counter()
+                concorrente.executar(lote)
+                group_commit[f"{trabalhadores}_threads_transacoes_por_segundo"] = sincronas / (time.perf_counter() - inicio)
+            journal.fechar()
+        finally:
+            shutil.rmtree(diretorio)
+
+    return {
+        "transacoes": transacoes,
+        "cauda": cauda,
+        "escrita_assincrona_transacoes_por_segundo": transacoes / tempo_escrita,
+        "recuperacao_segundos": tempo_recuperacao,
+        "group_commit": group_commit,
+    }
+
+
+def saldo_pelo_historico(conta):
+    tipos, valores, _ = conta.historico.colunas()
+    return sum(Historico.SINAIS[tipo] * valor for tipo, valor in zip(tipos, valores)) / 100
+
+
+def benchmark_concorrencia(contas_ativas=(1, 10, 100, 1_000), operacoes=100_000, trabalhadores=8, semente=42):
+    resultados = []
+
+    for quantidade in contas_ativas:
+        banco = popular_banco(quantidade)
+        gerador = random.Random(semente)
+        lote = []
+        for _ in range(operacoes):
+            numero = gerador.randint(1, quantidade)
+            metodo = "depositar" if gerador.random() < 0.7 else "sacar"
+            lote.append((metodo, (numero, AGENCIAS[numero % len(AGENCIAS)], float(gerador.randint(1, 100)))))
+
+        with BancoConcorrente(banco, trabalhadores) as concorrente:
+            inicio = time.perf_counter()
+            concorrente.executar(lote)
+            segundos = time.perf_counter() - inicio
+
+        # Sem atualizações perdidas: o saldo de cada conta é exatamente a soma do seu histórico
+        for conta in banco.contas:
+            assert abs(conta.saldo - saldo_pelo_historico(conta)) < 1e-6, conta.numero
+
+        resultados.append({
+            "contas_ativas": quantidade,
+            "trabalhadores": trabalhadores,
+            "operacoes_por_segundo": operacoes / segundos,
+        })
+
+    return resultados
+
+
+def gerar_documentos(quantidade, digitos, semente=42):
+    # Mistura documentos com dígitos verificadores corretos, alterados, pontuados e curtos
+    gerador = random.Random(semente)
+    pesos = list(range(digitos - 1, 1, -1)) if digitos == 11 else [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+    documentos = []
+    for _ in range(quantidade):
+        base = [gerador.randint(0, 9) for _ in range(digitos - 2)]
+        if digitos == 11:
+            dv1 = (sum(p * d for p, d in zip(pesos, base)) * 10) % 11 % 10
+            dv2 = (sum(p * d for p, d in zip(range(11, 1, -1), base + [dv1])) * 10) % 11 % 10
+        else:
+            resto = sum(p * d for p, d in zip(pesos, base)) % 11
+            dv1 = 0 if resto < 2 else 11 - resto
+            resto = sum(p * d for p, d in zip([6] + pesos, base + [dv1])) % 11
+            dv2 = 0 if resto < 2 else 11 - resto
+        documento = "".join(map(str, base + [dv1, dv2]))
+
+        sorteio = gerador.random()
+        if sorteio < 0.2:
+            documento = documento[:-1] + str((int(documento[-1]) + 1) % 10)
+        elif sorteio < 0.3:
+            documento = documento[:3] + "." + documento[3:6] + "." + documento[6:9] + "-" + documento[9:]
+        elif sorteio < 0.35:
+            documento = documento[:-1]
+        documentos.append(documento)
+    return documentos
+
+
+def benchmark_validacao(quantidade=1_000_000):
+    resultados = []
+
+    for nome, digitos, escalar, vetorizado in (("cpf", 11, validar_cpf, validar_cpfs),
+                                                ("cnpj", 14, validar_cnpj, validar_cnpjs)):
+        documentos = gerar_documentos(quantidade, digitos)
+
+        inicio = time.perf_counter()
+        esperado = [escalar(documento) for documento in documentos]
+        tempo_escalar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        mascara = vetorizado(documentos)
+        tempo_vetorizado = time.perf_counter() - inicio
+
+        assert mascara.tolist() == esperado, f"validação vetorizada de {nome} diverge da escalar"
+
+        resultados.append({
+            "documento": nome,
+            "quantidade": quantidade,
+            "validos": int(mascara.sum()),
+            "escalar_segundos": tempo_escalar,
+            "vetorizado_segundos": tempo_vetorizado,
+        })
+
+    return resultados
+
+
+def benchmark_chaves_pix(tamanhos=(1_000, 10_000, 100_000, 1_000_000), consultas=100_000, semente=42):
+    resultados = []
+
+    for quantidade in tamanhos:
+        banco = popular_banco(quantidade)
+        chaves = [
+            (numero, AGENCIAS[numero % len(AGENCIAS)], "email", f"cliente{numero}@banco.com")
+            for numero in range(1, quantidade + 1)
+        ]
+
+        inicio = time.perf_counter()
+        banco.registrar_chaves_pix(chaves)
+        tempo_cadastro = time.perf_counter() - inicio
+
+        gerador = random.Random(semente)
+        amostra = [f"Cliente{gerador.randint(1, quantidade)}@banco.com" for _ in range(consultas)]
+        diretorio = banco.diretorio_pix
+
+        inicio = time.perf_counter()
+        for chave in amostra:
+            diretorio.resolver(chave, "email")
+        tempo_consulta = time.perf_counter() - inicio
+
+        resultados.append({
+            "chaves": quantidade,
+            "cadastro_chaves_por_segundo": quantidade / tempo_cadastro,
+            "resolver_ns": tempo_consulta / consultas * 1e9,
+        })
+
+    return resultados
+
+
+def benchmark_extrato_periodo(transacoes=1_000_000, dias=365, semente=42):
+    # Uma conta com `transacoes` entradas espalhadas por `dias` dias; consulta a última semana
+    banco = popular_banco(1)
+    conta = banco.contas[0]
+    gerador = random.Random(semente)
+    agora = float(int(time.time()))  # Segundos inteiros, a mesma resolução de data_hora
+    inicio_historico = agora - dias * 86_400
+    passo = dias * 86_400 / transacoes
+    for indice in range(transacoes):
+        conta.historico.adicionar_registro(gerador.randint(0, 3), gerador.randint(1, 100_000), inicio_historico + indice * passo)
+
+    inicio_semana = datetime.datetime.fromtimestamp(agora - 7 * 86_400)
+
+    inicio = time.perf_counter()
+    semana = sum(1 for _ in banco.consultar_extrato(conta.numero, conta.agencia, inicio=inicio_semana))
+    tempo_indexado = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    limite = inicio_semana.strftime('%Y%m%d%H%M%S')
+    varredura = sum(
+        1 for transacao in conta.historico.transacoes
+        if datetime.datetime.strptime(transacao["data_hora"], '%d/%m/%Y %H:%M:%S').strftime('%Y%m%d%H%M%S') >= limite
+    )
+    tempo_varredura = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    pagina, cursor = banco.pagina_extrato(conta.numero, conta.agencia, inicio=inicio_semana, limite=50)
+    while cursor is not None:
+        pagina, cursor = banco.pagina_extrato(conta.numero, conta.agencia, inicio=inicio_semana, cursor=cursor, limite=50)
+    tempo_paginado = time.perf_counter() - inicio
+
+    return {
+        "transacoes": transacoes,
+        "transacoes_na_semana": semana,
+        "varredura_completa_segundos": tempo_varredura,
+        "consulta_indexada_segundos": tempo_indexado,
+        "paginacao_completa_segundos": tempo_paginado,
+        "coincide_com_varredura": semana == varredura,
+    }
+
+
+def benchmark_extrato_cache(transacoes=10_000, consultas=200, novas_por_consulta=5):
+    # Consultas repetidas ao extrato de uma conta que continua recebendo transações: sem cache
+    # (capacidade 0, todas as linhas formatadas a cada consulta) e com o cache incremental
+    resultados = {}
+    for nome, capacidade in (("sem_cache", 0), ("com_cache", 1_024)):
+        banco = Banco(sink=SinkNulo(), extratos=CacheExtratos(capacidade))
+        banco.adicionar_cliente("00000000001", "Cliente 1", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta("00000000001", 1, "0001")
+        conta = banco.contas[0]
+        registros = itertools.count(1_700_000_000)  # Mesmas datas/horas nas duas execuções
+        for instante in itertools.islice(registros, transacoes):
+            conta.historico.adicionar_registro(Historico.CODIGOS["Deposito"], 100, instante)
+
+        saida = io.StringIO()
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(saida):
+            for _ in range(consultas):
+                for instante in itertools.islice(registros, novas_por_consulta):
+                    conta.historico.adicionar_registro(Historico.CODIGOS["Deposito"], 100, instante)
+                banco.exibir_extrato(1, "0001")
+        segundos = time.perf_counter() - inicio
+        resultados[nome] = {"segundos": segundos, "consultas_por_segundo": consultas / segundos, "saida": saida.getvalue()}
+
+    saida = resultados["sem_cache"].pop("saida")
+    return {
+        "transacoes_iniciais": transacoes,
+        "consultas": consultas,
+        "novas_transacoes_por_consulta": novas_por_consulta,
+        **resultados,
+        "aceleracao": resultados["sem_cache"]["segundos"] / resultados["com_cache"]["segundos"],
+        "saidas_identicas": resultados["com_cache"].pop("saida") == saida,
+    }
+
+
+class ObjetoComDict:
+    # Réplica com __dict__ de um objeto com __slots__, usada como referência de memória
+    pass
+
+
+def replica_com_dict(objeto):
+    replica = ObjetoComDict()
+    for nome, valor in atributos(objeto):
+        setattr(replica, nome, valor)
+    return replica
+
+
+def benchmark_memoria_objetos(quantidade=1_000_000):
+    # Memória total de `quantidade` clientes com uma conta corrente cada
+    def carregar():
+        clientes = []
+        for numero in range(quantidade):
+            cliente = PessoaFisica(f"{numero:011d}", "Cliente", "01/01/1990", "Rua Teste, 1")
+            cliente.adicionar_conta(ContaCorrente(cliente, numero, "0001"))
+            clientes.append(cliente)
+        return clientes
+
+    memoria_total = medir_memoria(carregar)
+
+    # Custo só do objeto em si (os valores dos atributos são compartilhados): __slots__ x __dict__
+    amostra = min(quantidade, 100_000)
+    cliente = PessoaFisica("00000000000", "Cliente", "01/01/1990", "Rua Teste, 1")
+    conta = ContaCorrente(cliente, 1, "0001")
+    resultado = {"quantidade": quantidade, "bytes_por_cliente_e_conta": memoria_total / quantidade}
+
+    for nome, objeto in (("cliente", cliente), ("conta", conta)):
+        resultado[f"{nome}_slots_bytes"] = medir_memoria(lambda: [copy.copy(objeto) for _ in range(amostra)]) / amostra
+        resultado[f"{nome}_dict_bytes"] = medir_memoria(lambda: [replica_com_dict(objeto) for _ in range(amostra)]) / amostra
+
+    return resultado
+
+
+def benchmark_nucleo(tamanhos=(10_000, 100_000, 1_000_000), operacoes=100_000, extratos=1_000, semente=42):
+    # Populações sintéticas de `tamanho` contas; cada operação é medida em uma fase separada
+    resultados = []
+
+    for quantidade in tamanhos:
+        gerador = random.Random(semente)
+        contas = [gerador.randint(1, quantidade) for _ in range(operacoes)]
+        valores = [float(gerador.randint(1, 500)) for _ in range(operacoes)]
+        chaves = [f"cliente{gerador.randint(1, quantidade)}@banco.com" for _ in range(operacoes)]
+        banco = Banco(sink=SinkNulo())
+        tempos = {}
+
+        def fase(nome, funcao, quantidade_operacoes):
+            # O extrato e a listagem de contas continuam impressos por definição
+            with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+                segundos = medir_tempo(funcao)
+            tempos[nome] = {
+                "operacoes": quantidade_operacoes,
+                "segundos": segundos,
+                "operacoes_por_segundo": quantidade_operacoes / segundos if segundos else None,
+            }
+
+        def criar_contas():
+            for numero in range(1, quantidade + 1):
+                cpf = f"{numero:011d}"
+                banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+                banco.criar_conta(cpf, numero, AGENCIAS[numero % len(AGENCIAS)])
+            banco.registrar_chaves_pix(
+                ((numero, AGENCIAS[numero % len(AGENCIAS)], "email", f"cliente{numero}@banco.com")
+                 for numero in range(1, quantidade + 1)),
+                validar=False,
+            )
+
+        def depositar():
+            for numero, valor in zip(contas, valores):
+                banco.registrar_deposito(numero, AGENCIAS[numero % len(AGENCIAS)], valor * 10)
+
+        def sacar():
+            for numero, valor in zip(contas, valores):
+                banco.registrar_saque(numero, AGENCIAS[numero % len(AGENCIAS)], valor)
+
+        def pix():
+            for numero, valor, chave in zip(contas, valores, chaves):
+                banco.realizar_pix(numero, AGENCIAS[numero % len(AGENCIAS)], valor, chave, "email")
+
+        def extrato():
+            for numero in contas[:extratos]:
+                banco.exibir_extrato(numero, AGENCIAS[numero % len(AGENCIAS)])
+
+        fase("criacao_contas", criar_contas, quantidade)
+        fase("deposito", depositar, operacoes)
+        fase("saque", sacar, operacoes)
+        fase("pix", pix, operacoes)
+        fase("extrato", extrato, min(extratos, operacoes))
+        fase("listagem_contas", banco.listar_contas, quantidade)
+
+        resultados.append({"contas": quantidade, "fases": tempos})
+
+    return resultados
+
+
+def benchmark_metricas(quantidade=10_000, operacoes=200_000, semente=42):
+    # Custo das métricas: a mesma sequência de depósitos e saques com a instrumentação
+    # desativada, ativada e novamente desativada
+    banco = popular_banco(quantidade)
+    gerador = random.Random(semente)
+    contas = [gerador.randint(1, quantidade) for _ in range(operacoes)]
+
+    def operar():
+        for numero in contas:
+            agencia = AGENCIAS[numero % len(AGENCIAS)]
+            banco.registrar_deposito(numero, agencia, 100.0)
+            banco.registrar_saque(numero, agencia, 50.0)
+
+    resultados = {}
+    resultados["desativadas_segundos"] = medir_tempo(operar)
+    metricas = banco.ativar_metricas()
+    resultados["ativadas_segundos"] = medir_tempo(operar)
+    banco.desativar_metricas()
+    resultados["desativadas_novamente_segundos"] = medir_tempo(operar)
+
+    resultados["sobrecusto_por_operacao_ns"] = (
+        (resultados["ativadas_segundos"] - resultados["desativadas_segundos"]) / (2 * operacoes) * 1e9
+    )
+    resultados["snapshot"] = metricas.snapshot()
+    return resultados
+
+
+def benchmark_velocidade(quantidade=10_000, operacoes=200_000, semente=42):
+    # Custo das regras de velocidade: a mesma sequência de depósitos, saques e PIX sem regras e
+    # com regras por conta e por chave de destino (limites altos, para que nada seja recusado);
+    # e o custo isolado de uma verificação com três janelas
+    banco = popular_banco(quantidade)
+    for numero in range(1, quantidade + 1):
+        banco.registrar_chave_pix(numero, AGENCIAS[numero % len(AGENCIAS)], "cpf", f"{numero:011d}")
+    gerador = random.Random(semente)
+    pares = [(gerador.randint(1, quantidade), gerador.randint(1, quantidade)) for _ in range(operacoes)]
+    regras = [
+        RegraVelocidade("saques_conta", ("saque",), "conta", 600, max_quantidade=10 ** 9),
+        RegraVelocidade("pix_conta", ("pix",), "conta", 600, max_quantidade=10 ** 9, max_valor=10 ** 9),
+        RegraVelocidade("pix_destino", ("pix",), "chave_destino", 600, max_quantidade=10 ** 9),
+        RegraVelocidade("saques_pix_conta", ("saque", "pix"), "conta", 3_600, max_valor=10 ** 9),
+    ]
+
+    def operar():
+        for numero, destino in pares:
+            agencia = AGENCIAS[numero % len(AGENCIAS)]
+            banco.registrar_deposito(numero, agencia, 100.0)
+            banco.registrar_saque(numero, agencia, 10.0)
+            banco.realizar_pix(numero, agencia, 10.0, f"{destino:011d}", "cpf")
+
+    resultados = {"sem_regras_segundos": medir_tempo(operar)}
+    banco.velocidade = MotorVelocidade(regras)
+    resultados["com_regras_segundos"] = medir_tempo(operar)
+    resultados["sobrecusto_por_operacao_us"] = (
+        (resultados["com_regras_segundos"] - resultados["sem_regras_segundos"]) / (3 * operacoes) * 1e6
+    )
+
+    motor = MotorVelocidade(regras)
+    conta = banco.contas[0]
+    pix = Transferencia_Origem(10.0)
+    chaves = [("cpf", f"{destino:011d}") for _, destino in pares]
+
+    def verificar():
+        for chave in chaves:
+            motor.autorizar(conta, pix, chave)
+
+    segundos = medir_tempo(verificar)
+    resultados["verificacao_pix_us"] = segundos / operacoes * 1e6
+    return resultados
+
+
+def benchmark_eventos(quantidade=1_000, operacoes=200_000, semente=42):
+    # Depósitos com cada sink; o console escreve em /dev/null, o que mede só o custo do print()
+    banco = popular_banco(quantidade)
+    gerador = random.Random(semente)
+    contas = [gerador.randint(1, quantidade) for _ in range(operacoes)]
+    diretorio = tempfile.mkdtemp(prefix="eventos-")
+
+    def depositar():
+        for numero in contas:
+            banco.registrar_deposito(numero, AGENCIAS[numero % len(AGENCIAS)], 10.0)
+
+    resultados = {}
+    try:
+        with open(os.devnull, "w") as nulo:
+            sinks = {
+                "console": lambda: SinkConsole(nulo),
+                "nulo": SinkNulo,
+                "arquivo_bufferizado": lambda: SinkArquivoBufferizado(os.path.join(diretorio, "eventos.jsonl")),
+                "assincrono": lambda: SinkAssincrono(SinkArquivoBufferizado(os.path.join(diretorio, "fila.jsonl"))),
+            }
+            for nome, criar_sink in sinks.items():
+                banco.sink = sink = criar_sink()
+                segundos = medir_tempo(depositar)
+                if hasattr(sink, "fechar"):
+                    sink.fechar()
+                resultados[nome] = {"segundos": segundos, "operacoes_por_segundo": operacoes / segundos}
+    finally:
+        shutil.rmtree(diretorio)
+
+    return resultados
+
+
+def operacoes_particionadas(contas, operacoes, fracao_pix, semente):
+    gerador = random.Random(semente)
+    preparacao = []
+    for numero in range(1, contas + 1):
+        cpf = f"{numero:011d}"
+        agencia = AGENCIAS[numero % len(AGENCIAS)]
+        preparacao.append(("adicionar_cliente", (cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")))
+        preparacao.append(("criar_conta", (cpf, numero, agencia)))
+        preparacao.append(("registrar_chave_pix", (numero, agencia, "email", f"cliente{numero}@banco.com")))
+        preparacao.append(("registrar_deposito", (numero, agencia, 1_000.0)))
+
+    carga = []
+    for _ in range(operacoes):
+        numero = gerador.randint(1, contas)
+        agencia = AGENCIAS[numero % len(AGENCIAS)]
+        sorteio = gerador.random()
+        if sorteio < fracao_pix:
+            chave = f"cliente{gerador.randint(1, contas)}@banco.com"
+            carga.append(("realizar_pix", (numero, agencia, 10.0, chave, "email")))
+        elif sorteio < 0.7:
+            carga.append(("registrar_deposito", (numero, agencia, float(gerador.randint(1, 100)))))
+        else:
+            carga.append(("registrar_saque", (numero, agencia, float(gerador.randint(1, 100)))))
+    return preparacao, carga
+
+
+def benchmark_shards(shards=(1, 2, 3), contas=3_000, operacoes=200_000, tamanho_lote=20_000, fracao_pix=0.01,
+                     semente=42):
+    # Vazão do modo particionado com 1 a 3 processos; a mesma carga aplicada a um único Banco em
+    # processo serve de referência e de verificação (o saldo total deve ser idêntico)
+    preparacao, carga = operacoes_particionadas(contas, operacoes, fracao_pix, semente)
+
+    referencia = Banco(sink=SinkNulo())
+    for nome, argumentos in preparacao:
+        getattr(referencia, nome)(*argumentos)
+    inicio = time.perf_counter()
+    esperado = [bool(getattr(referencia, nome)(*argumentos)) for nome, argumentos in carga]
+    segundos_referencia = time.perf_counter() - inicio
+    saldo_esperado = sum(conta.saldo for conta in referencia.contas)
+
+    resultados = {"em_processo_operacoes_por_segundo": operacoes / segundos_referencia, "particionado": []}
+
+    for quantidade in shards:
+        with BancoParticionado(AGENCIAS, quantidade) as banco:
+            banco.executar(preparacao)
+
+            obtido = []
+            inicio = time.perf_counter()
+            for posicao in range(0, operacoes, tamanho_lote):
+                obtido += banco.executar(carga[posicao:posicao + tamanho_lote])
+            segundos = time.perf_counter() - inicio
+
+            assert obtido == esperado
+            assert abs(banco.saldo_total() - saldo_esperado) < 1e-6
+
+        resultados["particionado"].append({
+            "shards": quantidade,
+            "segundos": segundos,
+            "operacoes_por_segundo": operacoes / segundos,
+        })
+
+    return resultados
+
+
+def benchmark_numeracao(threads=(1, 4, 8), numeros_por_thread=100_000):
+    # Números alocados por várias threads ao mesmo tempo, em memória e com arquivo de arrendamento;
+    # nenhum número pode se repetir dentro da mesma agência
+    resultados = []
+    diretorio = tempfile.mkdtemp(prefix="numeracao-")
+
+    try:
+        for persistente in (False, True):
+            for quantidade in threads:
+                arquivo = os.path.join(diretorio, f"numeracao-{quantidade}.json") if persistente else None
+                alocador = AlocadorNumeros(arquivo, tamanho_bloco=1_000)
+                alocados = [[] for _ in range(quantidade)]
+
+                def alocar(numeros, indice):
+                    for posicao in range(numeros_por_thread):
+                        agencia = AGENCIAS[(indice + posicao) % len(AGENCIAS)]
+                        numeros.append((agencia, alocador.proximo(agencia)))
+
+                trabalhadores = [threading.Thread(target=alocar, args=(alocados[indice], indice))
+                                 for indice in range(quantidade)]
+                inicio = time.perf_counter()
+                for trabalhador in trabalhadores:
+                    trabalhador.start()
+                for trabalhador in trabalhadores:
+                    trabalhador.join()
+                segundos = time.perf_counter() - inicio
+
+                total = quantidade * numeros_por_thread
+                assert len({numero for numeros in alocados for numero in numeros}) == total
+
+                resultados.append({
+                    "arquivo": persistente,
+                    "threads": quantidade,
+                    "numeros": total,
+                    "ns_por_numero": segundos / total * 1e9,
+                })
+    finally:
+        shutil.rmtree(diretorio)
+
+    return resultados
+
+
+def benchmark_mmap(tamanhos=(10_000, 100_000, 1_000_000), operacoes=100_000, semente=42):
+    # Depósitos com os saldos no arquivo mapeado, reabertura do arquivo e soma dos saldos
+    # percorrendo os registros, comparados ao Banco em memória
+    resultados = []
+    diretorio = tempfile.mkdtemp(prefix="mmap-")
+
+    try:
+        for quantidade in tamanhos:
+            caminho = os.path.join(diretorio, f"saldos-{quantidade}.dat")
+            gerador = random.Random(semente)
+            contas = [gerador.randint(1, quantidade) for _ in range(operacoes)]
+            medidas = {"contas": quantidade}
+
+            for nome, banco in (("memoria", Banco(sink=SinkNulo())), ("mmap", BancoMapeado(caminho, sink=SinkNulo()))):
+                for numero in range(1, quantidade + 1):
+                    cpf = f"{numero:011d}"
+                    banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+                    banco.criar_conta(cpf, numero, AGENCIAS[numero % len(AGENCIAS)])
+
+                def depositar():
+                    for numero in contas:
+                        banco.registrar_deposito(numero, AGENCIAS[numero % len(AGENCIAS)], 10.0)
+
+                medidas[f"{nome}_depositos_por_segundo"] = operacoes / medir_tempo(depositar)
+                medidas[f"{nome}_soma_saldos_segundos"] = medir_tempo(
+                    lambda: sum(conta.saldo for conta in banco.contas) if nome == "memoria" else banco.saldo_total()
+                )
+
+            banco.fechar()
+            inicio = time.perf_counter()
+            reaberto = BancoMapeado(caminho)
+            medidas["mmap_abertura_segundos"] = time.perf_counter() - inicio
+            assert abs(reaberto.saldo_total() - 10.0 * operacoes) < 1e-6
+            reaberto.fechar()
+
+            resultados.append(medidas)
+    finally:
+        shutil.rmtree(diretorio)
+
+    return resultados
+
+
+def benchmark_sqlite(contas=10_000, operacoes=200_000, tamanhos_lote=(100, 1_000, 10_000), consultas=10_000,
+                     semente=42):
+    # Gravação sustentada de depósitos em memória e em SQLite (incluindo a gravação do último
+    # lote), e busca de contas após reabrir o banco de dados: primeira consulta e cache
+    gerador = random.Random(semente)
+    numeros = [gerador.randint(1, contas) for _ in range(operacoes)]
+    diretorio = tempfile.mkdtemp(prefix="sqlite-")
+
+    def preparar(banco):
+        for numero in range(1, contas + 1):
+            cpf = f"{numero:011d}"
+            banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+            banco.criar_conta(cpf, numero, AGENCIAS[numero % len(AGENCIAS)])
+
+    def depositar(banco):
+        for numero in numeros:
+            banco.registrar_deposito(numero, AGENCIAS[numero % len(AGENCIAS)], 10.0)
+
+    try:
+        banco = Banco(sink=SinkNulo())
+        preparar(banco)
+        resultados = {"memoria_depositos_por_segundo": operacoes / medir_tempo(lambda: depositar(banco)), "sqlite": []}
+
+        for tamanho_lote in tamanhos_lote:
+            caminho = os.path.join(diretorio, f"banco-{tamanho_lote}.db")
+            banco = BancoSQLite(caminho, tamanho_lote, sink=SinkNulo())
+            preparar(banco)
+            banco.sincronizar()
+
+            def gravar():
+                depositar(banco)
+                banco.fechar()
+
+            segundos = medir_tempo(gravar)
+
+            reaberto = BancoSQLite(caminho, tamanho_lote, sink=SinkNulo())
+            amostra = numeros[:consultas]
+            primeira = medir_tempo(lambda: [reaberto.filtrar_conta(numero, AGENCIAS[numero % len(AGENCIAS)]) for numero in amostra])
+            cache = medir_tempo(lambda: [reaberto.filtrar_conta(numero, AGENCIAS[numero % len(AGENCIAS)]) for numero in amostra])
+            assert reaberto.persistencia.consultar("SELECT SUM(saldo_centavos), COUNT(*) FROM contas")[0] == (1_000 * operacoes, contas)
+            assert reaberto.persistencia.consultar("SELECT COUNT(*) FROM transacoes")[0][0] == operacoes
+            reaberto.fechar()
+
+            resultados["sqlite"].append({
+                "tamanho_lote": tamanho_lote,
+                "depositos_por_segundo": operacoes / segundos,
+                "busca_banco_de_dados_us": primeira / consultas * 1e6,
+                "busca_cache_us": cache / consultas * 1e6,
+            })
+    finally:
+        shutil.rmtree(diretorio)
+
+    return resultados
+
+
+def benchmark_conciliacao(contas=100_000, transacoes=10_000_000, dias=30, divergentes=10, semente=42):
+    # Conciliação de fim de dia sobre históricos sintéticos (restaurados direto nas colunas),
+    # comparada à conferência histórico x saldo feita conta a conta em Python
+    import numpy as np
+
+    gerador = np.random.default_rng(semente)
+    banco = popular_banco(contas)
+    indices = np.sort(gerador.integers(0, contas, transacoes))
+    tipos = gerador.integers(0, len(Historico.TIPOS), transacoes).astype(np.int8)
+    valores = gerador.integers(1, 100_000, transacoes)
+    instantes = time.time() - gerador.random(transacoes) * dias * 86_400
+    limites = np.searchsorted(indices, np.arange(contas + 1))
+    sinais = np.array(Historico.SINAIS)[tipos] * valores
+
+    for posicao, conta in enumerate(banco.contas):
+        inicio, fim = limites[posicao], limites[posicao + 1]
+        conta.historico.restaurar_colunas(tipos[inicio:fim].tobytes(), valores[inicio:fim].tobytes(),
+                                          instantes[inicio:fim].tobytes())
+        centavos = int(sinais[inicio:fim].sum()) + (1 if posicao < divergentes else 0)
+        conta.restaurar(centavos / 100, "ativo")
+
+    def conferir_em_python():
+        return [conta for conta in banco.contas
+                if sum(Historico.SINAIS[tipo] * valor for tipo, valor, _ in zip(*conta.historico.colunas()))
+                != round(conta.saldo * 100)]
+
+    inicio = time.perf_counter()
+    relatorio = conciliar(banco)
+    segundos = time.perf_counter() - inicio
+    python = medir_tempo(conferir_em_python)
+
+    assert relatorio["transacoes"] == transacoes
+    assert len(relatorio["divergencias"]) == divergentes
+    assert relatorio["banco"]["Deposito"]["quantidade"] == int((tipos == 1).sum())
+
+    return {
+        "contas": contas,
+        "transacoes": transacoes,
+        "dias": len(relatorio["dias"]),
+        "segundos": segundos,
+        "conferencia_python_segundos": python,
+        "transacoes_por_segundo": transacoes / segundos,
+    }
+
+
+def gravar_razao_sintetico(diretorio, contas, eventos, particoes, dias=30, semente=42, bloco=1_000_000):
+    # Cadastro e log de eventos gerados direto no formato do livro-razão, em blocos
+    import numpy as np
+    from sistema_bancario.razao import TIPO_EVENTO
+
+    gerador = np.random.default_rng(semente)
+    with open(os.path.join(diretorio, ARQUIVO_CADASTRO), "w", encoding="utf-8") as cadastro:
+        for numero in range(1, contas + 1):
+            cpf = f"{numero:011d}"
+            cadastro.write(json.dumps(["cliente", cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1"]) + "\n")
+            cadastro.write(json.dumps(["conta", cpf, AGENCIAS[numero % len(AGENCIAS)], numero]) + "\n")
+
+    arquivos = [open(caminho_particao(diretorio, particao), "wb") for particao in range(particoes)]
+    esperado = np.zeros(contas, dtype=np.int64)
+    agora = time.time()
+    for inicio in range(0, eventos, bloco):
+        registros = np.empty(min(bloco, eventos - inicio), dtype=TIPO_EVENTO)
+        registros["conta"] = gerador.integers(0, contas, len(registros))
+        registros["codigo"] = gerador.integers(0, len(Historico.TIPOS), len(registros))
+        registros["centavos"] = gerador.integers(1, 100_000, len(registros))
+        registros["instante"] = np.sort(agora - gerador.random(len(registros)) * dias * 86_400)
+        sinais = np.array(Historico.SINAIS)[registros["codigo"]] * registros["centavos"]
+        esperado += np.bincount(registros["conta"], weights=sinais, minlength=contas).round().astype(np.int64)
+        for particao, arquivo in enumerate(arquivos):
+            arquivo.write(registros[registros["conta"] % particoes == particao].tobytes())
+    for arquivo in arquivos:
+        arquivo.close()
+    return esperado.tolist()
+
+
+def estado_conta_razao(conta):
+    # Contagens do dia por tipo: a conta ao vivo guarda tipos com contagem zero (ex.: PIX estornado)
+    # que a conta restaurada não tem, e os dois estados devem ser considerados iguais
+    contagens = tuple(conta.contadores.contagem(tipo) for tipo in Historico.TIPOS)
+    return conta.saldo, contagens, [coluna.tobytes() for coluna in conta.historico.colunas()]
+
+
+def benchmark_razao(contas=100_000, eventos=10_000_000, particoes=8, operacoes=20_000, semente=42):
+    # Reconstrução das projeções (saldos, contadores do dia, posições por cliente) a partir de um
+    # log sintético, com um processo e com um processo por CPU; e a reabertura de um BancoRazao
+    # alimentado por operações reais, que deve voltar exatamente ao mesmo estado
+    resultado = {"contas": contas, "eventos": eventos, "particoes": particoes, "reconstrucao": []}
+    with tempfile.TemporaryDirectory() as diretorio:
+        esperado = gravar_razao_sintetico(diretorio, contas, eventos, particoes, semente=semente)
+        for processos in sorted({1, os.cpu_count()}):
+            inicio = time.perf_counter()
+            projecoes = reconstruir(diretorio, processos)
+            segundos = time.perf_counter() - inicio
+            assert projecoes.eventos == eventos and projecoes.saldos == esperado
+            resultado["reconstrucao"].append({
+                "processos": processos,
+                "segundos": segundos,
+                "eventos_por_segundo": eventos / segundos,
+                "estimativa_100m_eventos_segundos": segundos * 100_000_000 / eventos,
+            })
+
+    gerador = random.Random(semente)
+    with tempfile.TemporaryDirectory() as diretorio:
+        banco = BancoRazao(diretorio, sink=SinkNulo())
+        for numero in range(1, 1_001):
+            cpf = f"{numero:011d}"
+            banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+            banco.criar_conta(cpf, numero, AGENCIAS[numero % len(AGENCIAS)])
+        banco.registrar_chaves_pix(
+            ((numero, AGENCIAS[numero % len(AGENCIAS)], "email", f"cliente{numero}@banco.com") for numero in range(1, 1_001)),
+            validar=False,
+        )
+
+        inicio = time.perf_counter()
+        for _ in range(operacoes):
+            numero = gerador.randint(1, 1_000)
+            agencia = AGENCIAS[numero % len(AGENCIAS)]
+            operacao = gerador.random()
+            if operacao < 0.5:
+                banco.registrar_deposito(numero, agencia, float(gerador.randint(1, 500)))
+            elif operacao < 0.8:
+                banco.registrar_saque(numero, agencia, float(gerador.randint(1, 300)))
+            else:
+                banco.realizar_pix(numero, agencia, float(gerador.randint(1, 300)),
+                                   f"cliente{gerador.randint(1, 1_000)}@banco.com", "email")
+        segundos_operacoes = time.perf_counter() - inicio
+
+        estado = [estado_conta_razao(conta) for conta in banco.contas]
+        banco.fechar()
+
+        inicio = time.perf_counter()
+        reaberto = BancoRazao(diretorio, sink=SinkNulo())
+        segundos_reabertura = time.perf_counter() - inicio
+        reaberto_estado = [estado_conta_razao(conta) for conta in reaberto.contas]
+        reaberto.fechar()
+
+    resultado["banco"] = {
+        "operacoes": operacoes,
+        "operacoes_por_segundo": operacoes / segundos_operacoes,
+        "reabertura_segundos": segundos_reabertura,
+        "reabertura_coincide": reaberto_estado == estado,
+    }
+    return resultado
+
+
+class BancoSemLimitesPix(Banco):
+    # Contas sem limite diário de PIX, para cargas longas de transferências
+    def _nova_conta(self, cliente, numero, agencia):
+        return ContaCorrente(cliente, numero, agencia, limite_pix=10 ** 9, limite_valor_pix=10 ** 9)
+
+
+def benchmark_instantaneo(contas=100_000, segundos=2.0, semente=42):
+    # Vazão de PIX de uma thread escritora sozinha e durante listagens completas de contas
+    # (instantâneos) em outra thread. Os PIX conservam a soma dos saldos: a soma de cada listagem
+    # pelo instantâneo deve ser exata. A leitura direta dos saldos ao vivo, sem travas, serve de
+    # referência para a vazão (a leitora disputa o GIL do mesmo jeito) e para a consistência
+    banco = BancoSemLimitesPix(sink=SinkNulo())
+    for numero in range(1, contas + 1):
+        cpf = f"{numero:011d}"
+        agencia = AGENCIAS[numero % len(AGENCIAS)]
+        banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(cpf, numero, agencia)
+        banco.registrar_deposito(numero, agencia, 1_000.0)
+    banco.registrar_chaves_pix(((numero, AGENCIAS[numero % len(AGENCIAS)], "cpf", f"{numero:011d}")
+                                for numero in range(1, contas + 1)), validar=False)
+    total = 1_000.0 * contas
+
+    gerador = random.Random(semente)
+    pares = [(gerador.randint(1, contas), f"{gerador.randint(1, contas):011d}") for _ in range(100_000)]
+
+    def escrever(parar, contador):
+        while not parar.is_set():
+            for numero, chave in pares:
+                banco.realizar_pix(numero, AGENCIAS[numero % len(AGENCIAS)], 10.0, chave, "cpf")
+                contador[0] += 1
+                if parar.is_set():
+                    break
+
+    def com_escritora(leitura):
+        parar, contador = threading.Event(), [0]
+        escritora = threading.Thread(target=escrever, args=(parar, contador))
+        inicio = time.perf_counter()
+        escritora.start()
+        leituras = leitura(inicio)
+        parar.set()
+        escritora.join()
+        return contador[0] / (time.perf_counter() - inicio), leituras
+
+    def ocioso(inicio):
+        time.sleep(segundos)
+        return []
+
+    def listar(inicio):
+        somas = []
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            while time.perf_counter() - inicio < segundos:
+                banco.listar_contas()
+                with banco.instantaneo() as instantaneo:
+                    somas.append(sum(instantaneo.estado(conta)[0] for conta in instantaneo.contas()))
+        return somas
+
+    def ao_vivo(inicio):
+        somas = []
+        while time.perf_counter() - inicio < segundos:
+            somas.append(sum(conta.saldo for conta in banco.contas))
+        return somas
+
+    sozinha, _ = com_escritora(ocioso)
+    com_listagens, somas = com_escritora(listar)
+    com_leituras_ao_vivo, somas_ao_vivo = com_escritora(ao_vivo)
+    assert all(soma == total for soma in somas), "instantâneo inconsistente"
+
+    return {
+        "contas": contas,
+        "pix_por_segundo_sozinha": sozinha,
+        "pix_por_segundo_com_listagens": com_listagens,
+        "pix_por_segundo_com_leituras_ao_vivo": com_leituras_ao_vivo,
+        "listagens": len(somas),
+        "leituras_ao_vivo": len(somas_ao_vivo),
+        "leituras_ao_vivo_inconsistentes": sum(soma != total for soma in somas_ao_vivo),
+    }
+
+
+def medir_importacao(modulo, repeticoes):
+    # Tempo cumulativo de importação do módulo (python -X importtime), em um processo novo a cada
+    # repetição; devolve a mediana em microssegundos
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"], capture_output=True, text=True,
+            check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stderr
+        for linha in saida.splitlines():
+            _, _, cumulativo, nome = (parte.strip() for parte in linha.replace("|", ":").split(":"))
+            if nome == modulo:
+                tempos.append(int(cumulativo))
+    tempos.sort()
+    return tempos[len(tempos) // 2]
+
+
+def benchmark_importacao(repeticoes=7):
+    # Custo de importar o pacote e os seus módulos principais em um interpretador novo
+    modulos = ("sistema_bancario", "sistema_bancario.validadores", "sistema_bancario.nucleo",
+               "sistema_bancario.interface", "sistema_bancario.journal", "sistema_bancario.servidor")
+    return {modulo: medir_importacao(modulo, repeticoes) for modulo in modulos}
+
+
+def benchmark_carga(segundos=3.0, taxas=(1_000, 4_000), trabalhadores=8, semente=42):
+    # Reprodução em malha aberta de cargas sintéticas (Zipf, rajadas de 5x a cada segundo) a taxas
+    # base crescentes: vazão alcançada e latência desde o instante agendado
+    resultados = []
+    for taxa in taxas:
+        perfil = PerfilCarga(taxa=taxa, duracao_rajada=0.2, intervalo_rajada=1.0)
+        taxa_media = taxa * (1 + (perfil.fator_rajada - 1) * perfil.duracao_rajada / perfil.intervalo_rajada)
+        operacoes = list(gerar_operacoes(perfil, int(taxa_media * segundos), semente))
+        carga = itertools.chain(gerar_cadastro(perfil), operacoes)
+        resultados.append({"taxa_base": taxa, **reproduzir(carga, trabalhadores=trabalhadores)})
+    return resultados
+
+
+def metadados():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "data_hora": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "processadores": os.cpu_count(),
+    }
+
+
+def main(argumentos=None):
+    cenarios = {
+        "nucleo": lambda opcoes: benchmark_nucleo(opcoes.tamanhos, opcoes.operacoes),
+        "busca": lambda opcoes: benchmark_busca(opcoes.tamanhos),
+        "historico": lambda opcoes: benchmark_historico(),
+        "journal": lambda opcoes: benchmark_journal(),
+        "concorrencia": lambda opcoes: benchmark_concorrencia(),
+        "validacao": lambda opcoes: benchmark_validacao(),
+        "chaves_pix": lambda opcoes: benchmark_chaves_pix(opcoes.tamanhos),
+        "extrato_periodo": lambda opcoes: benchmark_extrato_periodo(),
+        "extrato_cache": lambda opcoes: benchmark_extrato_cache(),
+        "memoria_objetos": lambda opcoes: benchmark_memoria_objetos(),
+        "metricas": lambda opcoes: benchmark_metricas(operacoes=opcoes.operacoes),
+        "eventos": lambda opcoes: benchmark_eventos(operacoes=opcoes.operacoes),
+        "shards": lambda opcoes: benchmark_shards(operacoes=opcoes.operacoes),
+        "numeracao": lambda opcoes: benchmark_numeracao(),
+        "mmap": lambda opcoes: benchmark_mmap(opcoes.tamanhos, opcoes.operacoes),
+        "sqlite": lambda opcoes: benchmark_sqlite(operacoes=opcoes.operacoes),
+        "conciliacao": lambda opcoes: benchmark_conciliacao(),
+        "velocidade": lambda opcoes: benchmark_velocidade(operacoes=opcoes.operacoes),
+        "instantaneo": lambda opcoes: benchmark_instantaneo(),
+        "importacao": lambda opcoes: benchmark_importacao(),
+        "carga": lambda opcoes: benchmark_carga(),
+        "razao": lambda opcoes: benchmark_razao(operacoes=opcoes.operacoes),
+    }
+
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo do sistema bancário.")
+    parser.add_argument("--cenarios", nargs="+", choices=sorted(cenarios), default=sorted(cenarios))
+    parser.add_argument("--tamanhos", nargs="+", type=int, default=[10_000, 100_000, 1_000_000],
+                        help="quantidades de contas das populações sintéticas (ex.: 10000 ... 10000000)")
+    parser.add_argument("--operacoes", type=int, default=100_000, help="operações por fase no cenário nucleo")
+    parser.add_argument("--saida", help="arquivo JSON de resultados (padrão: saída padrão)")
+    opcoes = parser.parse_args(argumentos)
+
+    relatorio = {"metadados": metadados(), "resultados": {}}
+
+    for nome in opcoes.cenarios:
+        print(f"Executando {nome}...", file=sys.stderr)
+        try:
+            relatorio["resultados"][nome] = cenarios[nome](opcoes)
+        except ImportError as erro:
+            relatorio["resultados"][nome] = {"ignorado": str(erro)}
+
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if opcoes.saida:
+        with open(opcoes.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto + "\n")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
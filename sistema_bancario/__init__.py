@@ -0,0 +1,57 @@
+## Sistema bancário: biblioteca (Banco, contas, histórico, validadores) e interface de console.
+## A importação do pacote não tem efeitos colaterais nem carrega os submódulos: os nomes abaixo
+## são importados no primeiro acesso. Os demais recursos (journal, lote, servidor, shards, sqlite,
+## mapeado, conciliacao, velocidade, razao...) são importados diretamente dos seus submódulos.
+## Uso:
+##   from sistema_bancario import Banco
+##   python -m sistema_bancario   (interface interativa)
+
+import importlib
+
+_EXPORTACOES = {
+    "Banco": "nucleo",
+    "Cliente": "nucleo",
+    "PessoaFisica": "nucleo",
+    "Conta": "nucleo",
+    "ContaCorrente": "nucleo",
+    "ContadorDiario": "nucleo",
+    "Historico": "nucleo",
+    "Instantaneo": "nucleo",
+    "CacheExtratos": "nucleo",
+    "DiretorioPix": "nucleo",
+    "Transacao": "nucleo",
+    "Saque": "nucleo",
+    "Deposito": "nucleo",
+    "Transferencia_Origem": "nucleo",
+    "Transferencia_Destino": "nucleo",
+    "validar_cpf": "validadores",
+    "validar_cnpj": "validadores",
+    "validar_email": "validadores",
+    "validar_telefone": "validadores",
+    "validar_chave": "validadores",
+    "TIPOS_CHAVE_PIX": "validadores",
+    "VALIDADORES_CHAVE_PIX": "validadores",
+    "Evento": "eventos",
+    "SinkConsole": "eventos",
+    "SinkNulo": "eventos",
+    "SinkArquivoBufferizado": "eventos",
+    "SinkAssincrono": "eventos",
+    "MetricasBanco": "metricas",
+    "InterfaceBancaria": "interface",
+}
+
+__all__ = sorted(_EXPORTACOES)
+
+
+def __getattr__(nome):
+    modulo = _EXPORTACOES.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nome)
+    globals()[nome] = valor  # Os próximos acessos não passam mais por aqui
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,3 @@
+from .interface import main
+
+main()
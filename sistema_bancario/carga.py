@@ -0,0 +1,195 @@
+## Gerador de carga sintética e reprodução das operações no Banco a uma taxa alvo.
+## O gerador produz, a partir de uma semente, o cadastro (clientes, contas, chaves PIX e depósito
+## inicial) e um fluxo de operações no formato do processamento em lote, cada uma com o instante
+## (em segundos desde o início) em que deve ser enviada:
+##   - popularidade das contas com distribuição de Zipf (poucas contas concentram as operações),
+##     tanto para a conta de origem quanto para a chave PIX de destino
+##   - mistura de depósitos, saques e PIX em proporções configuráveis, valores log-normais
+##   - chegadas de Poisson à taxa base, com rajadas periódicas a um múltiplo dessa taxa
+## A reprodução aplica o cadastro e então envia cada operação no seu instante a um pool de threads
+## (BancoConcorrente), em malha aberta: a latência é medida desde o instante agendado, de modo que
+## a espera na fila quando o banco não acompanha a taxa também é contada.
+## Uso:
+##   python -m sistema_bancario.carga gerar --operacoes 100000 --taxa 5000 > carga.jsonl
+##   python -m sistema_bancario.carga reproduzir carga.jsonl --trabalhadores 8
+##   python -m sistema_bancario.carga reproduzir --operacoes 100000 --taxa 5000   (gera e reproduz)
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from .concorrente import BancoConcorrente
+from .eventos import SinkNulo
+from .lote import ProcessadorLote
+from .metricas import HistogramaLatencia
+from .nucleo import Banco
+
+PerfilCarga = namedtuple(
+    "PerfilCarga",
+    "contas agencias mistura expoente_zipf taxa fator_rajada duracao_rajada intervalo_rajada saldo_inicial",
+    defaults=(
+        1_000, ("0001", "0002", "0003"), (("deposito", 60), ("saque", 25), ("pix", 15)), 1.1,
+        1_000.0, 5.0, 1.0, 10.0, 10_000.0,
+    ),
+)
+
+# Parâmetros (mu, sigma) da distribuição log-normal e valor máximo de cada operação
+VALORES = {"deposito": (4.5, 1.0, 5_000.0), "saque": (4.0, 0.8, 500.0), "pix": (4.0, 1.0, 1_000.0)}
+
+
+def _conta(perfil, numero):
+    return perfil.agencias[numero % len(perfil.agencias)], numero
+
+
+def _chave(numero):
+    return f"cliente{numero}@banco.com"
+
+
+def gerar_cadastro(perfil):
+    for numero in range(1, perfil.contas + 1):
+        cpf = f"{numero:011d}"
+        agencia, _ = _conta(perfil, numero)
+        yield {"operacao": "cliente", "cpf": cpf, "nome": f"Cliente {numero}",
+               "data_nascimento": "01/01/1990", "endereco": "Rua Teste, 1"}
+        yield {"operacao": "conta", "cpf": cpf, "agencia": agencia, "numero": numero}
+        yield {"operacao": "chave", "agencia": agencia, "numero": numero, "tipo": "email", "chave": _chave(numero)}
+        yield {"operacao": "deposito", "agencia": agencia, "numero": numero, "valor": perfil.saldo_inicial}
+
+
+def gerar_operacoes(perfil, quantidade, semente=42):
+    gerador = random.Random(semente)
+
+    # Posição na ordem de popularidade -> número da conta, embaralhada para que as contas mais
+    # usadas não sejam sempre as primeiras
+    numeros = list(range(1, perfil.contas + 1))
+    gerador.shuffle(numeros)
+    pesos_acumulados = list(itertools.accumulate(1 / posicao ** perfil.expoente_zipf
+                                                 for posicao in range(1, perfil.contas + 1)))
+    operacoes, pesos = zip(*perfil.mistura)
+    pesos_operacoes = list(itertools.accumulate(pesos))
+
+    instante = 0.0
+    for _ in range(quantidade):
+        em_rajada = instante % perfil.intervalo_rajada < perfil.duracao_rajada
+        instante += gerador.expovariate(perfil.taxa * (perfil.fator_rajada if em_rajada else 1.0))
+
+        operacao = gerador.choices(operacoes, cum_weights=pesos_operacoes)[0]
+        origem, destino = gerador.choices(numeros, cum_weights=pesos_acumulados, k=2)
+        mu, sigma, maximo = VALORES[operacao]
+        agencia, numero = _conta(perfil, origem)
+
+        dados = {"operacao": operacao, "instante": round(instante, 6), "agencia": agencia, "numero": numero,
+                 "valor": round(min(gerador.lognormvariate(mu, sigma), maximo), 2)}
+        if operacao == "pix":
+            dados["chave"] = _chave(destino)
+            dados["tipo_chave"] = "email"
+        yield dados
+
+
+def reproduzir(operacoes, banco=None, trabalhadores=8, aceleracao=1.0):
+    # Operações sem "instante" (cadastro) são aplicadas em ordem antes de o relógio começar; as
+    # demais são enviadas ao pool no instante agendado, dividido por `aceleracao`
+    banco = banco if banco is not None else Banco(sink=SinkNulo())
+    processador = ProcessadorLote(banco)
+    histograma = HistogramaLatencia()
+    trava = threading.Lock()
+    resultados = [0, 0]  # Falhas, sucessos
+
+    def executar(dados, agendado):
+        sucesso, _ = processador.aplicar(dados)
+        latencia = time.perf_counter() - agendado
+        with trava:
+            resultados[bool(sucesso)] += 1
+            histograma.registrar(int(latencia * 1e9))
+
+    operacoes = iter(operacoes)
+    primeira = None
+    for dados in operacoes:
+        if "instante" in dados:
+            primeira = dados
+            break
+        processador.aplicar(dados)
+
+    atraso_maximo = 0.0
+    with BancoConcorrente(banco, trabalhadores) as pool:
+        inicio = time.perf_counter()
+        for dados in itertools.chain(() if primeira is None else (primeira,), operacoes):
+            agendado = inicio + dados["instante"] / aceleracao
+            espera = agendado - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            else:
+                atraso_maximo = max(atraso_maximo, -espera)
+            pool.submeter(executar, dados, agendado)
+    segundos = time.perf_counter() - inicio
+
+    total = histograma.total
+    return {
+        "operacoes": total,
+        "sucessos": resultados[1],
+        "falhas": resultados[0],
+        "segundos": segundos,
+        "operacoes_por_segundo": total / segundos if segundos else 0.0,
+        "atraso_maximo_envio_ms": atraso_maximo * 1e3,
+        "latencia_media_us": histograma.soma / total / 1e3 if total else 0.0,
+        "latencia_p50_us": histograma.percentil(0.50) / 1e3,
+        "latencia_p90_us": histograma.percentil(0.90) / 1e3,
+        "latencia_p99_us": histograma.percentil(0.99) / 1e3,
+        "latencia_p99.9_us": histograma.percentil(0.999) / 1e3,
+        "latencia_maxima_us": histograma.maximo / 1e3,
+    }
+
+
+def _perfil(argumentos):
+    return PerfilCarga(
+        contas=argumentos.contas, expoente_zipf=argumentos.zipf, taxa=argumentos.taxa,
+        fator_rajada=argumentos.fator_rajada, duracao_rajada=argumentos.duracao_rajada,
+        intervalo_rajada=argumentos.intervalo_rajada,
+    )
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Gera e reproduz cargas sintéticas de operações bancárias.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    gerar = subcomandos.add_parser("gerar", help="grava o cadastro e as operações em JSONL na saída padrão")
+    reproducao = subcomandos.add_parser("reproduzir", help="aplica uma carga no banco e mede latência e vazão")
+    reproducao.add_argument("arquivo", nargs="?", help="carga em JSONL (padrão: gerada com as opções abaixo)")
+    reproducao.add_argument("--trabalhadores", type=int, default=8)
+    reproducao.add_argument("--aceleracao", type=float, default=1.0, help="multiplica a taxa da carga")
+
+    for subcomando in (gerar, reproducao):
+        subcomando.add_argument("--operacoes", type=int, default=100_000)
+        subcomando.add_argument("--contas", type=int, default=1_000)
+        subcomando.add_argument("--taxa", type=float, default=1_000.0, help="operações por segundo fora das rajadas")
+        subcomando.add_argument("--zipf", type=float, default=1.1, help="expoente da popularidade das contas")
+        subcomando.add_argument("--fator-rajada", type=float, default=5.0)
+        subcomando.add_argument("--duracao-rajada", type=float, default=1.0, help="segundos")
+        subcomando.add_argument("--intervalo-rajada", type=float, default=10.0, help="segundos entre inícios de rajadas")
+        subcomando.add_argument("--semente", type=int, default=42)
+
+    argumentos = parser.parse_args(argumentos)
+    perfil = _perfil(argumentos)
+    carga = itertools.chain(gerar_cadastro(perfil), gerar_operacoes(perfil, argumentos.operacoes, argumentos.semente))
+
+    if argumentos.comando == "gerar":
+        for dados in carga:
+            sys.stdout.write(json.dumps(dados, ensure_ascii=False) + "\n")
+        return
+
+    if argumentos.arquivo:
+        with open(argumentos.arquivo, encoding="utf-8") as arquivo:
+            resultado = reproduzir((json.loads(linha) for linha in arquivo if linha.strip()),
+                                   trabalhadores=argumentos.trabalhadores, aceleracao=argumentos.aceleracao)
+    else:
+        resultado = reproduzir(carga, trabalhadores=argumentos.trabalhadores, aceleracao=argumentos.aceleracao)
+    print(json.dumps(resultado, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
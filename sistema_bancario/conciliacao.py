@@ -0,0 +1,155 @@
+## Conciliação de fim de dia com NumPy.
+## Os históricos de todas as contas são copiados para colunas contíguas, como estavam em um mesmo
+## instante (Banco.instantaneo), e os agregados saem de reduções agrupadas (bincount):
+##   - quantidade e valor por tipo de transação, no banco, por agência e por dia
+##   - fluxo líquido (entradas menos saídas) no banco, por agência e por dia
+##   - saldo total por agência
+##   - contas cujo histórico não soma exatamente o saldo (divergências)
+## Os dias seguem o fuso horário local atual. Os valores são somados em centavos.
+## Requer numpy (pip install numpy).
+## Uso: python -m sistema_bancario.conciliacao dados [--saida relatorio.json]
+##      (dados é o diretório do journal, ver sistema_bancario.journal)
+
+import argparse
+import datetime
+import json
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .nucleo import Historico
+
+SEGUNDOS_POR_DIA = 86_400
+ORDINAL_EPOCA = datetime.date(1970, 1, 1).toordinal()
+
+
+def _exigir_numpy():
+    if np is None:
+        raise ImportError("A conciliação requer o pacote numpy (pip install numpy).")
+
+
+def carregar_colunas(instantaneo, contas):
+    # Copia os históricos, até a última transação anterior ao instantâneo, para colunas contíguas;
+    # devolve também, por conta, o saldo em centavos e a quantidade de transações no instantâneo
+    tipos, valores, instantes, tamanhos, saldos = [], [], [], [], []
+
+    for conta in contas:
+        saldo, _, quantidade = instantaneo.estado(conta)
+        with conta.trava:
+            # O histórico só cresce: as transações do instantâneo são as `quantidade` primeiras
+            for destino, coluna in zip((tipos, valores, instantes), conta.historico.colunas()):
+                destino.append((coluna if len(coluna) == quantidade else coluna[:quantidade]).tobytes())
+        tamanhos.append(quantidade)
+        saldos.append(round(saldo * 100))
+
+    return (
+        np.frombuffer(b"".join(tipos), dtype=np.int8),
+        np.frombuffer(b"".join(valores), dtype=np.int64),
+        np.frombuffer(b"".join(instantes), dtype=np.float64),
+        np.array(tamanhos, dtype=np.int64),
+        np.array(saldos, dtype=np.int64),
+    )
+
+
+def _por_tipo(grupos, quantidade_grupos, tipos, valores):
+    # Matrizes (grupo, tipo) de quantidades e valores; sem grupos (banco sem agências ou sem
+    # transações), matrizes vazias com uma coluna por tipo
+    forma = (quantidade_grupos, len(Historico.TIPOS))
+    chave = grupos * len(Historico.TIPOS) + tipos
+    quantidades = np.bincount(chave, minlength=forma[0] * forma[1]).reshape(forma)
+    somas = np.bincount(chave, weights=valores, minlength=forma[0] * forma[1]).reshape(forma)
+    return quantidades, somas
+
+
+def _resumo(quantidades, somas):
+    resumo = {
+        tipo: {"quantidade": int(quantidades[codigo]), "valor": somas[codigo] / 100}
+        for codigo, tipo in enumerate(Historico.TIPOS)
+    }
+    resumo["fluxo_liquido"] = float(np.dot(somas, Historico.SINAIS)) / 100
+    return resumo
+
+
+def conciliar(banco):
+    _exigir_numpy()
+    inicio = time.perf_counter()
+
+    with banco.instantaneo() as instantaneo:
+        contas = list(instantaneo.contas())
+        tipos, valores, instantes, tamanhos, saldos = carregar_colunas(instantaneo, contas)
+
+    # Conta e agência de cada transação
+    indice_conta = np.repeat(np.arange(len(contas)), tamanhos)
+    agencias = sorted({conta.agencia for conta in contas})
+    codigo_agencia = {agencia: codigo for codigo, agencia in enumerate(agencias)}
+    agencia_da_conta = np.array([codigo_agencia[conta.agencia] for conta in contas], dtype=np.int64)
+    agencia_da_transacao = agencia_da_conta[indice_conta]
+
+    # Histórico x saldo, em centavos (bincount soma em float64, exato até 2**53 centavos)
+    sinais = np.array(Historico.SINAIS, dtype=np.int64)
+    assinados = sinais[tipos] * valores
+    soma_historico = np.bincount(indice_conta, weights=assinados, minlength=len(contas)).round().astype(np.int64)
+    divergentes = np.flatnonzero(soma_historico != saldos)
+
+    # Agregados do banco, por agência e por dia
+    quantidades_banco = np.bincount(tipos, minlength=len(Historico.TIPOS))
+    somas_banco = np.bincount(tipos, weights=valores, minlength=len(Historico.TIPOS))
+    quantidades_agencia, somas_agencia = _por_tipo(agencia_da_transacao, len(agencias), tipos, valores)
+    saldo_agencia = np.bincount(agencia_da_conta, weights=saldos, minlength=len(agencias))
+
+    deslocamento = datetime.datetime.now().astimezone().utcoffset().total_seconds()
+    dia_absoluto = np.floor((instantes + deslocamento) / SEGUNDOS_POR_DIA).astype(np.int64)
+    primeiro_dia = int(dia_absoluto.min()) if len(dia_absoluto) else 0
+    dia_relativo = dia_absoluto - primeiro_dia
+    quantidade_dias = int(dia_relativo.max()) + 1 if len(dia_relativo) else 0
+    quantidades_dia, somas_dia = _por_tipo(dia_relativo, quantidade_dias, tipos, valores)
+
+    return {
+        "contas": len(contas),
+        "transacoes": int(len(tipos)),
+        "banco": _resumo(quantidades_banco, somas_banco),
+        "agencias": {
+            agencia: {"saldo": saldo_agencia[codigo] / 100, **_resumo(quantidades_agencia[codigo], somas_agencia[codigo])}
+            for codigo, agencia in enumerate(agencias)
+        },
+        "dias": {
+            datetime.date.fromordinal(ORDINAL_EPOCA + primeiro_dia + dia).isoformat():
+                _resumo(quantidades_dia[dia], somas_dia[dia])
+            for dia in np.flatnonzero(quantidades_dia.sum(axis=1)).tolist()
+        },
+        "divergencias": [
+            {
+                "agencia": contas[posicao].agencia,
+                "numero": contas[posicao].numero,
+                "saldo": saldos[posicao] / 100,
+                "soma_historico": soma_historico[posicao] / 100,
+            }
+            for posicao in divergentes
+        ],
+        "segundos": time.perf_counter() - inicio,
+    }
+
+
+def main(argumentos=None):
+    from .journal import carregar
+
+    parser = argparse.ArgumentParser(description="Conciliação de fim de dia a partir do journal do banco.")
+    parser.add_argument("diretorio", help="diretório do journal")
+    parser.add_argument("--saida", help="arquivo JSON do relatório (padrão: saída padrão)")
+    argumentos = parser.parse_args(argumentos)
+
+    banco, _ = carregar(argumentos.diretorio)
+    texto = json.dumps(conciliar(banco), indent=2, ensure_ascii=False)
+
+    if argumentos.saida:
+        with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto + "\n")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
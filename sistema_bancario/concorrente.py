@@ -0,0 +1,55 @@
+## Execução concorrente das operações do Banco em um pool de threads.
+## Cada operação é submetida ao pool e devolve um Future com o seu resultado.
+## A consistência é garantida pelo próprio Banco: cada conta tem a sua trava, e operações
+## que envolvem duas contas adquirem as travas sempre na mesma ordem (agência, número).
+## Uso:
+##   with BancoConcorrente(trabalhadores=8) as banco:
+##       futuro = banco.depositar(1, "0001", 100.0)
+##       futuro.result()
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .nucleo import Banco
+
+
+class BancoConcorrente:
+    def __init__(self, banco=None, trabalhadores=None):
+        self._banco = banco if banco is not None else Banco()
+        self._executor = ThreadPoolExecutor(max_workers=trabalhadores or os.cpu_count())
+
+    @property
+    def banco(self):
+        return self._banco
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def submeter(self, funcao, *argumentos):
+        return self._executor.submit(funcao, *argumentos)
+
+    def adicionar_cliente(self, cpf, nome, data_nascimento, endereco):
+        return self.submeter(self._banco.adicionar_cliente, cpf, nome, data_nascimento, endereco)
+
+    def criar_conta(self, cpf, numero, agencia):
+        return self.submeter(self._banco.criar_conta, cpf, numero, agencia)
+
+    def depositar(self, numero, agencia, valor):
+        return self.submeter(self._banco.registrar_deposito, numero, agencia, valor)
+
+    def sacar(self, numero, agencia, valor):
+        return self.submeter(self._banco.registrar_saque, numero, agencia, valor)
+
+    def pix(self, numero, agencia, valor, chave, tipo_chave=None):
+        return self.submeter(self._banco.realizar_pix, numero, agencia, valor, chave, tipo_chave)
+
+    def executar(self, operacoes):
+        # operacoes: iterável de (nome_do_metodo, argumentos); devolve os resultados na mesma ordem
+        futuros = [getattr(self, nome)(*argumentos) for nome, argumentos in operacoes]
+        return [futuro.result() for futuro in futuros]
+
+    def fechar(self):
+        self._executor.shutdown(wait=True)
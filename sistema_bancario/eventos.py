@@ -0,0 +1,130 @@
+## Eventos emitidos pelas contas e pelo Banco no lugar de mensagens impressas no terminal.
+## Cada resultado de operação (saque, depósito, PIX, criação de conta, ...) vira um Evento com
+## um código; o texto para o usuário só é montado quando um sink precisa exibi-lo.
+## Sinks disponíveis:
+##   SinkConsole               imprime as mensagens (padrão da interface de terminal)
+##   SinkNulo                  descarta os eventos (benchmarks)
+##   SinkArquivoBufferizado    grava JSONL em blocos (servidores, processamento em lote); cada
+##                             linha é [instante, codigo, sucesso, agencia, numero, valor, detalhe]
+##   SinkAssincrono            entrega os eventos a outro sink em uma thread separada
+## Qualquer objeto com um método emitir(evento) pode ser usado como sink.
+
+import sys
+import threading
+import time
+from collections import namedtuple
+
+Evento = namedtuple("Evento", "codigo sucesso agencia numero valor detalhe")
+
+MENSAGENS = {
+    "saque_realizado": "\n=== Saque de R$ {valor:.2f} realizado com sucesso na conta {numero}! ===",
+    "deposito_realizado": "\n=== Depósito de R$ {valor:.2f} realizado com sucesso na conta {numero}! ===",
+    "pix_realizado": "\n=== PIX de R$ {valor:.2f} realizado com sucesso na conta {numero}! ===",
+    "pix_estornado": "\n=== PIX de R$ {valor:.2f} estornado na conta {numero}. ===",
+    "saldo_insuficiente": "\n@@@ Operação falhou! Você não tem saldo suficiente. @@@",
+    "valor_invalido": "\n@@@ Operação falhou! O valor informado é inválido. @@@",
+    "limite_saque_excedido": "@@@ Operação falhou! O valor do saque excede o limite de R$ {detalhe:.2f}. @@@",
+    "saques_excedidos": "@@@ Operação falhou! Número máximo de saques ({detalhe}) excedido. @@@",
+    "limite_pix_excedido": "@@@ Operação falhou! O valor do PIX excede o limite de R$ {detalhe:.2f}. @@@",
+    "pix_excedidos": "@@@ Operação falhou! Número máximo de saques ({detalhe}) excedido. @@@",
+    "limite_velocidade_excedido": "@@@ Operação falhou! Limite de operações no período excedido ({detalhe}). @@@",
+    "chave_pix_nao_encontrada": "\n@@@ Operação falhou! Chave PIX não encontrada. @@@",
+    "conta_criada": "Conta corrente criada com sucesso para o cliente {detalhe}. Número da conta: {numero}, Agência: {agencia}",
+    "conta_ja_cadastrada": "@@@ Já existe uma conta com este número nesta agência! @@@",
+    "conta_nao_encontrada": "@@@ Conta não encontrada. Por favor, verifique a agência e o número da conta! @@@",
+    "chave_pix_invalida": "@@@ Chave PIX inválida. Por favor, verifique a chave e tente novamente. @@@",
+    "chave_pix_ja_cadastrada": "@@@ Chave PIX já cadastrada! @@@",
+    "chave_pix_cadastrada": "Chave PIX {detalhe} cadastrada com sucesso para a conta {numero}, Agência: {agencia}",
+    "cliente_nao_encontrado": "@@@ Cliente não encontrado. Por favor, cadastre o cliente primeiro! @@@",
+}
+
+
+def mensagem(evento):
+    return MENSAGENS[evento.codigo].format(**evento._asdict())
+
+
+class SinkConsole:
+    def __init__(self, arquivo=None):
+        self._arquivo = arquivo  # None: a saída padrão do momento da emissão
+
+    def emitir(self, evento):
+        print(mensagem(evento), file=self._arquivo or sys.stdout)
+
+
+class SinkNulo:
+    def emitir(self, evento):
+        pass
+
+
+class SinkArquivoBufferizado:
+    # Acumula os eventos e grava um bloco de linhas JSON a cada `tamanho_buffer` eventos
+    def __init__(self, caminho, tamanho_buffer=1_000):
+        import json  # Sob demanda: o núcleo importa este módulo e não precisa de JSON
+
+        self._codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        self._arquivo = open(caminho, "a", encoding="utf-8")
+        self._tamanho_buffer = tamanho_buffer
+        self._buffer = []
+        self._trava = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def emitir(self, evento):
+        with self._trava:
+            self._buffer.append((time.time(), *evento))
+            if len(self._buffer) >= self._tamanho_buffer:
+                self._descarregar()
+
+    def _descarregar(self):
+        # Deve ser chamado com a trava adquirida
+        if self._buffer:
+            codificar = self._codificar
+            self._arquivo.write("".join([codificar(registro) + "\n" for registro in self._buffer]))
+            self._buffer.clear()
+        self._arquivo.flush()
+
+    def descarregar(self):
+        with self._trava:
+            self._descarregar()
+
+    def fechar(self):
+        with self._trava:
+            self._descarregar()
+            self._arquivo.close()
+
+
+class SinkAssincrono:
+    # Repassa os eventos a outro sink em uma thread própria; a operação bancária só enfileira
+    def __init__(self, destino, capacidade=100_000):
+        import queue
+
+        self._destino = destino
+        self._fila = queue.Queue(capacidade)
+        self._thread = threading.Thread(target=self._consumir, name="sink-assincrono", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def emitir(self, evento):
+        self._fila.put(evento)
+
+    def _consumir(self):
+        while True:
+            evento = self._fila.get()
+            if evento is None:
+                break
+            self._destino.emitir(evento)
+
+    def fechar(self):
+        self._fila.put(None)
+        self._thread.join()
+        if hasattr(self._destino, "fechar"):
+            self._destino.fechar()
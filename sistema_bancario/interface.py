@@ -0,0 +1,262 @@
+## Interface interativa (menu de console) do sistema bancário.
+## Uso: python -m sistema_bancario
+
+import datetime
+import textwrap
+
+from .nucleo import Banco
+from .numeracao import AlocadorNumeros
+from .validadores import TIPOS_CHAVE_PIX, validar_chave, validar_cnpj, validar_cpf, validar_email, validar_telefone
+
+class InterfaceBancaria:
+    def __init__(self, alocador=None, banco=None):
+        self._banco = banco if banco is not None else Banco()
+        self._alocador = alocador if alocador is not None else AlocadorNumeros()  # Números das novas contas
+        # Um banco restaurado (journal, SQLite, razão, mmap) já tem contas: a numeração continua depois delas
+        for agencia, numero in self._banco.ultimos_numeros().items():
+            self._alocador.avancar(agencia, numero)
+    
+    @property
+    def banco(self):
+        return self._banco
+    
+    def validar_cpf(self, cpf):
+        return validar_cpf(cpf)
+
+    def validar_cnpj(self, cnpj):
+        return validar_cnpj(cnpj)
+
+    def validar_telefone(self, telefone):
+        return validar_telefone(telefone)
+
+    def validar_email(self, email):
+        return validar_email(email)
+
+    def validar_chave(self, tipo_chave, chave):
+        return validar_chave(tipo_chave, chave)
+
+    def exibir_menu(self):
+        menu = """\n
+            ***** Bem-vindo ao Sistema Bancário *****
+
+            *********** Menu Principal ***********
+            [1] Depósito
+            [2] Saque
+            [3] PIX
+            [4] Extrato
+            [5] Novo Usuário
+            [6] Nova Conta
+            [7] Listar Usuários
+            [8] Listar Contas
+            [9] Nova Chave PIX
+            [0] Sair
+
+            >>> Digite a opção desejada: """
+        
+        opção = input(textwrap.dedent(menu)) 
+
+        return opção
+
+    def informar_data(self):
+                   
+        try:
+            data_nascimento = input("Data de nascimento(dd/mm/aaaa): ").strip()
+            data_formatada = datetime.datetime.strptime(data_nascimento, '%d/%m/%Y')
+            return data_formatada.strftime('%d/%m/%Y')  # Retorna a data formatada como string
+        
+        except ValueError:
+            print("Data inválida. Por favor, digite uma data no formato dd/mm/aaaa.")  
+            return None
+    
+    def informar_agencia(self):
+        agencia = input("Informe a agência: ")
+        if self.banco.agencia_valida(agencia): 
+            return agencia
+        else:
+            print("\n@@@ Agência inválida! Informe uma agência válida! @@@")
+        return None
+
+    def informar_conta(self, agencia):
+         
+        try:
+            numero = int(input("Informe o número da conta: "))
+        except: 
+            return None
+        else:
+            if self.banco.validar_conta(numero, agencia):
+                return numero
+        return None
+
+    def realizar_transacao(self, tipo):
+
+        agencia = self.informar_agencia()
+        if agencia:
+            numero = self.informar_conta(agencia)
+            if numero:          
+                try:
+                    valor = float(input("Informe o valor: ").replace(',', '.'))
+                    if valor <= 0:
+                        print("@@@ Valor inválido! O valor deve ser numérico, positivo e maior que zero.")
+                except ValueError:
+                    print("@@@ Valor inválido! O valor deve ser numérico, positivo, maior que zero.")
+                else:
+                    if tipo == "DEPOSITO":
+                        self.banco.registrar_deposito(numero, agencia, valor)  
+                    elif tipo == "SAQUE":
+                        self.banco.registrar_saque(numero, agencia, valor)
+            else:
+                print("\n@@@ Conta inválida! Informe uma conta válida! @@@")
+        else:
+            print("\n@@@ Agência inválida! Informe uma agência válida! @@@")
+
+    def realizar_pix(self):
+
+        agencia = self.informar_agencia()
+        if agencia:
+            numero = self.informar_conta(agencia)
+            if numero:          
+                try:
+                    valor = float(input("Informe o valor: ").replace(',', '.'))
+                    if valor <= 0:
+                        print("@@@ Valor inválido! O valor deve ser numérico, positivo e maior que zero.")
+                except ValueError:
+                    print("@@@ Valor inválido! O valor deve ser numérico, positivo, maior que zero.")
+                else:
+                    tipo_chave = input("Digite o tipo de chave PIX desejada - [1]CPF [2]CNPJ [3]Email [4]Telefone: ").strip()
+                    chave_pix = input("Digite a chave PIX: ")  
+                    tipo_chave_valida = tipo_chave in ['1', '2', '3', '4']
+                    chave_pix_valida = self.validar_chave(tipo_chave, chave_pix)
+
+                    if not tipo_chave_valida:
+                        print("\n@@@ Tipo de chave PIX inválido. Por favor, escolha uma opção válida: [1]CPF [2]CNPJ [3]Email [4]Telefone. @@@")
+                    elif not chave_pix_valida:
+                        print("\n@@@ Chave PIX inválida. Por favor, verifique a chave e tente novamente. @@@")
+                    else:
+                        self.banco.realizar_pix(numero, agencia, valor, chave_pix, TIPOS_CHAVE_PIX[tipo_chave])
+            else:
+                print("\n@@@ Conta inválida! Informe uma conta válida! @@@")
+        else:
+            print("\n@@@ Agência inválida! Informe uma agência válida! @@@")
+
+    def cadastrar_chave_pix(self):
+
+        agencia = self.informar_agencia()
+        if agencia:
+            numero = self.informar_conta(agencia)
+            if numero:
+                tipo_chave = input("Digite o tipo de chave PIX - [1]CPF [2]CNPJ [3]Email [4]Telefone: ").strip()
+                chave_pix = input("Digite a chave PIX: ").strip()
+
+                if tipo_chave not in TIPOS_CHAVE_PIX:
+                    print("\n@@@ Tipo de chave PIX inválido. Por favor, escolha uma opção válida: [1]CPF [2]CNPJ [3]Email [4]Telefone. @@@")
+                else:
+                    self.banco.registrar_chave_pix(numero, agencia, TIPOS_CHAVE_PIX[tipo_chave], chave_pix)
+            else:
+                print("\n@@@ Conta inválida! Informe uma conta válida! @@@")
+        else:
+            print("\n@@@ Agência inválida! Informe uma agência válida! @@@")
+
+    def criar_cliente(self):
+
+        cpf = input("Informe o CPF do cliente: ").strip().replace('.', '').replace('-', '')
+        
+        if self.validar_cpf(cpf):
+            nome = input("Informe o nome do cliente: ").strip()
+            data_nascimento = self.informar_data()
+            if data_nascimento:
+                endereco = input("Informe o endereço (logradouro, nro - bairro - cidade/sigla estado): ").strip()
+                self.banco.adicionar_cliente(cpf, nome, data_nascimento, endereco)
+                print(f"Cliente {nome} cadastrado com sucesso!")
+        else:
+            print("CPF inválido! Verifique o número do CPF.")
+
+    def criar_conta(self):
+
+        agencia = self.informar_agencia()
+
+        if agencia:
+            cpf = input("Informe o CPF do titular: ").strip().replace('.', '').replace('-', '')
+
+            if self.validar_cpf(cpf):
+                self.banco.criar_conta(cpf, self._alocador.proximo(agencia), agencia)
+            else:
+                print("@@@ CPF inválido! Informe um CPF válido! @@@")
+        else:
+            print("@@@ Agência inválida! Informe uma agência válida! @@@")                            
+
+    def listar_clientes(self):
+        self.banco.listar_clientes()
+
+    def listar_contas(self):
+        self.banco.listar_contas()
+
+    def exibir_extrato(self):
+        
+        agencia = self.informar_agencia()
+        if agencia:
+            numero = self.informar_conta(agencia)
+            if numero:    
+                self.banco.exibir_extrato(numero, agencia)
+            else:
+                print("\n@@@ Conta inválida! Informe uma conta válida! @@@")
+        else:
+            print("\n@@@ Agência inválida! Informe uma agência válida! @@@")
+  
+    def menu(self):
+
+        while True:      
+            opcao = self.exibir_menu()
+
+            if opcao == '1': # Depósito
+
+                self.realizar_transacao("DEPOSITO")
+                
+            elif opcao == '2': # Saque
+
+                self.realizar_transacao("SAQUE")    
+            
+            elif opcao == '3': # PIX
+
+                self.realizar_pix()
+                    
+            elif opcao == '4': # Extrato
+                
+                self.exibir_extrato()
+
+            elif opcao == '5': # Cadastrar Usuário
+
+                self.criar_cliente()   
+                
+            elif opcao == '6': # Criar Conta Corrente
+
+                self.criar_conta()
+
+            elif opcao == '7': # Listar Usuários
+
+                self.listar_clientes()
+            
+            elif opcao == '8': # Listar Contas Correntes
+
+                self.listar_contas()
+
+            elif opcao == '9': # Cadastrar Chave PIX
+
+                self.cadastrar_chave_pix()
+            
+            elif opcao == '0':
+                print("Obrigado por utilizar nosso sistema. Até logo!")
+                break
+
+            else:
+                print("Opção inválida. Por favor, escolha uma opção válida do menu.")
+
+            if opcao in ['0','1', '2', '3', '4', '5', '6', '7', '8', '9']:
+                input("\nPressione qualquer tecla para continuar...")
+
+    def main(self):
+        self.menu()
+
+
+def main():
+    sistema = InterfaceBancaria()
+    sistema.main()
@@ -0,0 +1,299 @@
+## Journal (write-ahead log) com snapshots para persistir o estado do Banco entre execuções.
+## Cada alteração bem-sucedida (novo cliente, nova conta, chave PIX, transação) é anexada ao
+## journal como uma linha JSON com um número de sequência (LSN).
+## As gravações usam group commit: quem anexa um registro só retorna depois do fsync que o
+## confirma. O primeiro a esperar grava e sincroniza, fora da trava, todos os registros
+## acumulados até ali; os que chegam durante esse fsync formam o grupo seguinte, de modo que
+## um único fsync confirma as operações de várias threads. Uma operação concluída nunca se perde.
+## Com `confirmacao_assincrona=True` (commit assíncrono), quem anexa não espera: o grupo é
+## sincronizado ao atingir `tamanho_grupo` registros ou a cada `intervalo_sincronizacao`
+## segundos, e uma queda pode perder as operações concluídas do grupo ainda não sincronizado.
+## A cada `registros_por_snapshot` registros é gravado um snapshot compacto do banco e o
+## journal passa para um novo segmento. Na recuperação, o snapshot mais recente é carregado
+## e somente os segmentos posteriores a ele são reaplicados.
+## O snapshot é gravado fora da trava do journal, lendo cada conta sob a sua própria trava,
+## e por isso pode conter transações posteriores ao seu LSN; a reaplicação ignora essas
+## transações comparando o índice de cada registro com o tamanho do histórico da conta.
+## Uso:
+##   banco, journal = abrir_banco("dados")
+##   banco.registrar_deposito(1, "0001", 100.0)
+##   journal.fechar()
+
+import datetime
+import json
+import os
+import pickle
+import threading
+
+from .nucleo import Banco, ContaCorrente, Historico
+
+PREFIXO_SEGMENTO = "journal-"
+SUFIXO_SEGMENTO = ".log"
+ARQUIVO_SNAPSHOT = "snapshot.pickle"
+
+# Tipos que consomem os limites diários da conta corrente
+TIPOS_LIMITADOS = {Historico.CODIGOS["Saque"], Historico.CODIGOS["Transferencia_Origem"]}
+
+
+class Journal:
+    def __init__(self, diretorio, banco, lsn=0, tamanho_grupo=1000, intervalo_sincronizacao=0.05,
+                 registros_por_snapshot=1_000_000, confirmacao_assincrona=False):
+        self._diretorio = diretorio
+        self._banco = banco
+        self._lsn = lsn  # Número de sequência do último registro anexado
+        self._tamanho_grupo = tamanho_grupo
+        self._intervalo_sincronizacao = intervalo_sincronizacao
+        self._registros_por_snapshot = registros_por_snapshot
+        self._registros_desde_snapshot = 0
+        self._confirmacao_assincrona = confirmacao_assincrona
+        self._pendentes = []  # Registros do grupo ainda não sincronizado
+        self._lsn_sincronizado = lsn  # Último LSN confirmado por fsync
+        self._gravando = False  # Um grupo está sendo gravado fora da trava
+        self._trava = threading.Lock()
+        self._grupo_sincronizado = threading.Condition(self._trava)
+        self._trava_snapshot = threading.Lock()
+        self._arquivo = self._abrir_segmento(lsn + 1)
+
+        # Sincroniza periodicamente o grupo em aberto mesmo sem novas gravações e grava os
+        # snapshots solicitados, fora das travas mantidas por quem notifica o journal
+        self._snapshot_pendente = threading.Event()
+        self._parar = threading.Event()
+        self._sincronizador = threading.Thread(target=self._sincronizar_periodicamente, daemon=True)
+        self._sincronizador.start()
+
+    @property
+    def lsn(self):
+        return self._lsn
+
+    def _abrir_segmento(self, lsn_inicial):
+        caminho = os.path.join(self._diretorio, f"{PREFIXO_SEGMENTO}{lsn_inicial:020d}{SUFIXO_SEGMENTO}")
+        return open(caminho, "w", encoding="utf-8")
+
+    def cliente_adicionado(self, cliente):
+        self._anexar(["cliente", cliente.cpf, cliente.nome, cliente.data_nascimento, cliente.endereco])
+
+    def conta_criada(self, conta):
+        self._anexar(["conta", conta.cliente.cpf, conta.agencia, conta.numero])
+
+    def chave_pix_registrada(self, conta, tipo, chave):
+        self._anexar(["chave", conta.agencia, conta.numero, tipo, chave])
+
+    def transacao_registrada(self, conta, transacao, indice):
+        codigo, _, instante = conta.historico.registro(indice)
+        self._anexar(["transacao", conta.agencia, conta.numero, indice, codigo, transacao.valor, instante])
+
+    def _anexar(self, registro):
+        with self._trava:
+            self._lsn += 1
+            registro.insert(0, self._lsn)
+            self._pendentes.append(json.dumps(registro, ensure_ascii=False, separators=(",", ":")))
+            self._registros_desde_snapshot += 1
+
+            if self._registros_desde_snapshot >= self._registros_por_snapshot:
+                self._registros_desde_snapshot = 0
+                self._snapshot_pendente.set()
+
+            if self._confirmacao_assincrona:
+                if len(self._pendentes) >= self._tamanho_grupo:
+                    self._sincronizar()
+                return
+
+            lsn = self._lsn
+            while self._lsn_sincronizado < lsn:
+                if self._gravando:
+                    self._grupo_sincronizado.wait()
+                else:
+                    self._gravar_grupo()
+
+    def _gravar_grupo(self):
+        # Deve ser chamado com a trava adquirida e sem outro grupo em gravação; a trava é liberada
+        # durante a escrita e o fsync, para que os próximos registros formem o grupo seguinte
+        grupo, self._pendentes = self._pendentes, []
+        ultimo = self._lsn
+        self._gravando = True
+        self._trava.release()
+        try:
+            if grupo:
+                self._arquivo.write("\n".join(grupo) + "\n")
+                self._arquivo.flush()
+                os.fsync(self._arquivo.fileno())
+        finally:
+            self._trava.acquire()
+            self._gravando = False
+            self._grupo_sincronizado.notify_all()
+        self._lsn_sincronizado = ultimo
+
+    def _sincronizar(self):
+        # Deve ser chamado com a trava adquirida; retorna sem grupo em gravação nem registros pendentes
+        while self._gravando or self._pendentes:
+            if self._gravando:
+                self._grupo_sincronizado.wait()
+            else:
+                self._gravar_grupo()
+
+    def _sincronizar_periodicamente(self):
+        while not self._parar.wait(self._intervalo_sincronizacao):
+            self.sincronizar()
+
+            if self._snapshot_pendente.is_set():
+                self._snapshot_pendente.clear()
+                self.tirar_snapshot()
+
+    def sincronizar(self):
+        with self._trava:
+            self._sincronizar()
+
+    def tirar_snapshot(self):
+        # Não deve ser chamado por quem mantém a trava de alguma conta
+        with self._trava_snapshot:
+            with self._trava:
+                self._sincronizar()
+                lsn = self._lsn
+
+                segmento_anterior = self._arquivo
+                self._arquivo = self._abrir_segmento(lsn + 1)
+                segmento_anterior.close()
+
+            gravar_snapshot(self._diretorio, self._banco, lsn)
+
+            # Segmentos totalmente cobertos pelo snapshot não são mais necessários
+            for lsn_inicial, caminho in listar_segmentos(self._diretorio):
+                if lsn_inicial <= lsn:
+                    os.remove(caminho)
+
+    def fechar(self):
+        self._parar.set()
+        self._sincronizador.join()
+        self._banco.remover_ouvinte(self)
+
+        with self._trava:
+            self._sincronizar()
+            self._arquivo.close()
+
+
+def listar_segmentos(diretorio):
+    segmentos = []
+    for nome in os.listdir(diretorio):
+        if nome.startswith(PREFIXO_SEGMENTO) and nome.endswith(SUFIXO_SEGMENTO):
+            lsn_inicial = int(nome[len(PREFIXO_SEGMENTO):-len(SUFIXO_SEGMENTO)])
+            segmentos.append((lsn_inicial, os.path.join(diretorio, nome)))
+    return sorted(segmentos)
+
+
+def estado_conta(conta):
+    with conta.trava:
+        return (
+            conta.cliente.cpf, conta.agencia, conta.numero, conta.saldo, conta.status,
+            conta.contadores.estado(), *(coluna.tobytes() for coluna in conta.historico.colunas())
+        )
+
+
+def gravar_snapshot(diretorio, banco, lsn):
+    # As contas são copiadas antes dos clientes para que todo titular esteja no snapshot
+    contas = [estado_conta(conta) for conta in list(banco.contas)]
+    estado = {
+        "lsn": lsn,
+        "clientes": [
+            (cliente.cpf, cliente.nome, cliente.data_nascimento, cliente.endereco)
+            for cliente in list(banco.clientes)
+        ],
+        "contas": contas,
+        "chaves_pix": [
+            (tipo, chave, conta.agencia, conta.numero)
+            for tipo, chave, conta in list(banco.diretorio_pix.chaves())
+        ],
+    }
+
+    caminho = os.path.join(diretorio, ARQUIVO_SNAPSHOT)
+    temporario = caminho + ".tmp"
+
+    with open(temporario, "wb") as arquivo:
+        pickle.dump(estado, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+
+    os.replace(temporario, caminho)
+
+
+def carregar_snapshot(diretorio, banco):
+    caminho = os.path.join(diretorio, ARQUIVO_SNAPSHOT)
+    if not os.path.exists(caminho):
+        return 0
+
+    with open(caminho, "rb") as arquivo:
+        estado = pickle.load(arquivo)
+
+    for cpf, nome, data_nascimento, endereco in estado["clientes"]:
+        banco.adicionar_cliente(cpf, nome, data_nascimento, endereco)
+
+    for cpf, agencia, numero, saldo, status, contadores, tipos, valores, instantes in estado["contas"]:
+        conta = ContaCorrente(banco.buscar_cliente(cpf), numero, agencia)
+        conta.restaurar(saldo, status)
+        conta.contadores.restaurar(*contadores)
+        conta.historico.restaurar_colunas(tipos, valores, instantes)
+        banco.incluir_conta(conta)
+
+    for tipo, chave, agencia, numero in estado["chaves_pix"]:
+        banco.diretorio_pix.registrar(tipo, chave, banco.filtrar_conta(numero, agencia))
+
+    return estado["lsn"]
+
+
+def aplicar_registro(banco, registro, hoje):
+    operacao = registro[1]
+
+    if operacao == "transacao":
+        _, _, agencia, numero, indice, codigo, valor, instante = registro
+        conta = banco.filtrar_conta(numero, agencia)
+
+        # Transações já presentes no snapshot são ignoradas, o que torna a reaplicação idempotente
+        if indice < len(conta.historico):
+            return
+
+        conta.restaurar(conta.saldo + Historico.SINAIS[codigo] * valor, conta.status)
+        conta.historico.adicionar_registro(codigo, round(valor * 100), instante)
+
+        if codigo in TIPOS_LIMITADOS and datetime.date.fromtimestamp(instante) == hoje:
+            conta.contadores.incrementar(Historico.TIPOS[codigo])
+
+    elif operacao == "cliente":
+        _, _, cpf, nome, data_nascimento, endereco = registro
+        if banco.buscar_cliente(cpf) is None:
+            banco.adicionar_cliente(cpf, nome, data_nascimento, endereco)
+
+    elif operacao == "conta":
+        _, _, cpf, agencia, numero = registro
+        if banco.filtrar_conta(numero, agencia) is None:
+            banco.incluir_conta(ContaCorrente(banco.buscar_cliente(cpf), numero, agencia))
+
+    elif operacao == "chave":
+        _, _, agencia, numero, tipo, chave = registro
+        banco.diretorio_pix.registrar(tipo, chave, banco.filtrar_conta(numero, agencia))
+
+
+def carregar(diretorio, sink=None):
+    banco = Banco(sink=sink)
+    lsn = carregar_snapshot(diretorio, banco)
+    hoje = datetime.date.today()
+
+    for _, caminho in listar_segmentos(diretorio):
+        with open(caminho, encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    break  # Último grupo gravado parcialmente antes de uma queda
+
+                if registro[0] > lsn:
+                    aplicar_registro(banco, registro, hoje)
+                    lsn = registro[0]
+
+    return banco, lsn
+
+
+def abrir_banco(diretorio, sink=None, **opcoes):
+    os.makedirs(diretorio, exist_ok=True)
+    banco, lsn = carregar(diretorio, sink)
+    journal = Journal(diretorio, banco, lsn, **opcoes)
+    banco.adicionar_ouvinte(journal)
+    return banco, journal
@@ -0,0 +1,161 @@
+## Processamento em lote de operações bancárias, sem interação com o terminal.
+## O arquivo de entrada pode ser CSV (com cabeçalho) ou JSONL (um objeto JSON por linha).
+## Campos por operação:
+##   cliente:  cpf, nome, data_nascimento, endereco
+##   conta:    cpf, agencia, numero
+##   deposito: agencia, numero, valor
+##   saque:    agencia, numero, valor
+##   chave:    agencia, numero, tipo (cpf, cnpj, email ou telefone), chave
+##   pix:      agencia, numero, valor, chave, tipo_chave (opcional)
+## As operações são lidas e aplicadas uma a uma, e os resultados são gravados à medida
+## que são produzidos, de modo que o uso de memória não depende do tamanho do arquivo.
+## As mensagens das contas não vão para o terminal: por padrão os eventos são descartados, e com
+## --eventos eles são gravados em JSONL por um sink bufferizado.
+## Uso: python -m sistema_bancario.lote operacoes.csv [--resultados resultados.jsonl] [--eventos eventos.jsonl]
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import namedtuple
+
+from .eventos import SinkArquivoBufferizado, SinkNulo
+from .nucleo import Banco, valor_valido
+
+ResultadoOperacao = namedtuple("ResultadoOperacao", "linha operacao sucesso erro")
+ResumoLote = namedtuple("ResumoLote", "total sucessos falhas segundos operacoes_por_segundo")
+LinhaInvalida = namedtuple("LinhaInvalida", "erro")
+
+
+def ler_operacoes(arquivo, formato):
+    # Linhas JSONL malformadas viram LinhaInvalida, registradas como falha sem interromper o arquivo
+    if formato == "jsonl":
+        for linha in arquivo:
+            if linha.strip():
+                try:
+                    yield json.loads(linha)
+                except json.JSONDecodeError as erro:
+                    yield LinhaInvalida(f"JSON inválido: {erro}")
+    else:
+        yield from csv.DictReader(arquivo)
+
+
+def ler_valor(dados):
+    # Valores não positivos, não finitos ou acima do limite são recusados antes de chegar ao Banco
+    valor = float(dados["valor"])
+    if not valor_valido(valor):
+        raise ValueError(f"valor fora do intervalo aceito: {dados['valor']!r}")
+    return valor
+
+
+def formato_arquivo(caminho):
+    return "jsonl" if caminho.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+class ProcessadorLote:
+    def __init__(self, banco=None):
+        self._banco = banco if banco is not None else Banco(sink=SinkNulo())
+        self._operacoes = {
+            "cliente": self._cliente,
+            "conta": self._conta,
+            "chave": self._chave,
+            "deposito": self._deposito,
+            "saque": self._saque,
+            "pix": self._pix,
+        }
+
+    @property
+    def banco(self):
+        return self._banco
+
+    def _cliente(self, dados):
+        self._banco.adicionar_cliente(dados["cpf"], dados["nome"], dados["data_nascimento"], dados.get("endereco"))
+        return True
+
+    def _conta(self, dados):
+        return self._banco.criar_conta(dados["cpf"], int(dados["numero"]), dados["agencia"]) is not None
+
+    def _chave(self, dados):
+        return self._banco.registrar_chave_pix(int(dados["numero"]), dados["agencia"], dados["tipo"], dados["chave"])
+
+    def _deposito(self, dados):
+        return self._banco.registrar_deposito(int(dados["numero"]), dados["agencia"], ler_valor(dados))
+
+    def _saque(self, dados):
+        return self._banco.registrar_saque(int(dados["numero"]), dados["agencia"], ler_valor(dados))
+
+    def _pix(self, dados):
+        return self._banco.realizar_pix(int(dados["numero"]), dados["agencia"], ler_valor(dados), dados["chave"],
+                                        dados.get("tipo_chave") or None)
+
+    def aplicar(self, dados):
+        if isinstance(dados, LinhaInvalida):
+            return False, dados.erro
+        if not isinstance(dados, dict):
+            return False, f"a operação deve ser um objeto JSON: {dados!r}"
+
+        operacao = self._operacoes.get(dados.get("operacao"))
+
+        if operacao is None:
+            return False, f"operação desconhecida: {dados.get('operacao')!r}"
+
+        try:
+            sucesso = operacao(dados)
+        except KeyError as campo:
+            return False, f"campo obrigatório ausente: {campo}"
+        except (TypeError, ValueError, OverflowError) as erro:
+            return False, f"valor inválido: {erro}"
+
+        return sucesso, None if sucesso else "operação recusada"
+
+    def processar(self, operacoes):
+        for linha, dados in enumerate(operacoes, start=1):
+            sucesso, erro = self.aplicar(dados)
+            yield ResultadoOperacao(linha, dados.get("operacao") if isinstance(dados, dict) else None, sucesso, erro)
+
+    def executar(self, operacoes, saida=None):
+        total = sucessos = 0
+        inicio = time.perf_counter()
+
+        for resultado in self.processar(operacoes):
+            total += 1
+            sucessos += resultado.sucesso
+            if saida is not None:
+                saida.write(json.dumps(resultado._asdict(), ensure_ascii=False) + "\n")
+
+        segundos = time.perf_counter() - inicio
+        return ResumoLote(total, sucessos, total - sucessos, segundos, total / segundos if segundos else 0.0)
+
+    def executar_arquivo(self, caminho, saida=None):
+        with open(caminho, newline="", encoding="utf-8") as arquivo:
+            return self.executar(ler_operacoes(arquivo, formato_arquivo(caminho)), saida)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Aplica um arquivo de operações bancárias em lote.")
+    parser.add_argument("arquivo", help="arquivo de operações (.csv ou .jsonl)")
+    parser.add_argument("--resultados", help="grava o resultado de cada operação em JSONL ('-' para a saída padrão)")
+    parser.add_argument("--eventos", help="grava os eventos das contas (mensagens de sucesso e falha) em JSONL")
+    argumentos = parser.parse_args(argumentos)
+
+    sink = SinkArquivoBufferizado(argumentos.eventos) if argumentos.eventos else SinkNulo()
+    processador = ProcessadorLote(Banco(sink=sink))
+
+    if argumentos.resultados == "-":
+        resumo = processador.executar_arquivo(argumentos.arquivo, sys.stdout)
+    elif argumentos.resultados:
+        with open(argumentos.resultados, "w", encoding="utf-8") as saida:
+            resumo = processador.executar_arquivo(argumentos.arquivo, saida)
+    else:
+        resumo = processador.executar_arquivo(argumentos.arquivo)
+
+    if argumentos.eventos:
+        sink.fechar()
+
+    print(f"Operações: {resumo.total} | Sucessos: {resumo.sucessos} | Falhas: {resumo.falhas} | "
+          f"Tempo: {resumo.segundos:.2f} s | Vazão: {resumo.operacoes_por_segundo:,.0f} op/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
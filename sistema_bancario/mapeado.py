@@ -0,0 +1,240 @@
+## Armazenamento opcional dos saldos em um arquivo mapeado em memória (mmap) de registros fixos.
+## Cada conta ocupa um registro de 44 bytes, na posição (slot) em que foi criada:
+##   agência (4 bytes), CPF do titular (11 bytes), número, saldo em centavos, status, dia e
+##   contadores diários de saques e PIX.
+## O saldo, o status e os contadores das contas de um BancoMapeado são lidos e gravados
+## diretamente no registro; a durabilidade fica a cargo do cache de páginas do sistema
+## operacional (sincronizar() força a gravação em disco). Ao abrir um arquivo existente, apenas
+## o índice (agência, número) -> slot é reconstruído; quando a conta é criada de novo (pelo
+## cadastro ou pela reaplicação de um journal de cadastros), ela volta com o saldo do arquivo.
+## O histórico de transações continua em memória e não é persistido por este armazenamento; por
+## isso ele não deve ser combinado com a reaplicação de transações do journal.
+## Uso:
+##   banco = BancoMapeado("saldos.dat")
+##   ...
+##   banco.fechar()
+
+import datetime
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+
+from .nucleo import Banco, ContadorDiario, ContaCorrente, Saque, Transferencia_Origem
+
+CABECALHO = struct.Struct("<8sQ")  # Identificação do formato e quantidade de registros
+REGISTRO = struct.Struct("<4s11sxqqBxxxiHH")
+IDENTIFICACAO = b"SALDOS01"
+CAPACIDADE_INICIAL = 1024
+
+# Campos gravados individualmente: (formato, deslocamento dentro do registro)
+CENTAVOS = struct.Struct("<q"), struct.calcsize("<4s11sxq")
+STATUS = struct.Struct("<B"), struct.calcsize("<4s11sxqq")
+CONTADORES = struct.Struct("<iHH"), struct.calcsize("<4s11sxqqBxxx")
+
+SITUACOES = ("ativo", "inativo")
+TIPOS_CONTADOS = (Saque.__name__, Transferencia_Origem.__name__)
+
+
+class ArmazemSaldos:
+    def __init__(self, caminho, capacidade_inicial=CAPACIDADE_INICIAL):
+        novo = not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+        self._arquivo = open(caminho, "w+b" if novo else "r+b")
+        if novo:
+            self._arquivo.truncate(CABECALHO.size + capacidade_inicial * REGISTRO.size)
+        self._mmap = mmap.mmap(self._arquivo.fileno(), 0)
+
+        if novo:
+            CABECALHO.pack_into(self._mmap, 0, IDENTIFICACAO, 0)
+        identificacao, self._quantidade = CABECALHO.unpack_from(self._mmap, 0)
+        if identificacao != IDENTIFICACAO:
+            raise ValueError(f"{caminho} não é um arquivo de saldos")
+
+        self._trava = threading.Lock()  # Protege a alocação de slots e o crescimento do arquivo
+        # Índice (agência, número) -> slot, reconstruído a partir dos registros
+        self._slots = self.percorrer(
+            lambda registros: {(agencia.decode(), numero): slot
+                               for slot, (agencia, _, numero, *_) in enumerate(registros)}
+        )
+
+    def __len__(self):
+        return self._quantidade
+
+    def _deslocamento(self, slot):
+        return CABECALHO.size + slot * REGISTRO.size
+
+    def slot(self, agencia, numero, cpf):
+        # Slot da conta; contas novas recebem o próximo registro livre, com saldo zero
+        with self._trava:
+            slot = self._slots.get((agencia, numero))
+            if slot is not None:
+                return slot
+
+            slot = self._quantidade
+            if self._deslocamento(slot + 1) > len(self._mmap):
+                self._mmap.resize(self._deslocamento(2 * slot))
+
+            REGISTRO.pack_into(self._mmap, self._deslocamento(slot), agencia.encode(), cpf.encode(), numero, 0, 0, 0, 0, 0)
+            self._quantidade += 1
+            CABECALHO.pack_into(self._mmap, 0, IDENTIFICACAO, self._quantidade)
+            self._slots[(agencia, numero)] = slot
+            return slot
+
+    def ler(self, campo, slot):
+        formato, deslocamento = campo
+        return formato.unpack_from(self._mmap, self._deslocamento(slot) + deslocamento)
+
+    def gravar(self, campo, slot, *valores):
+        formato, deslocamento = campo
+        formato.pack_into(self._mmap, self._deslocamento(slot) + deslocamento, *valores)
+
+    @contextmanager
+    def registros(self):
+        # Percorre os registros diretamente sobre o mapeamento, sem copiar o arquivo; enquanto
+        # a iteração estiver aberta, novas contas aguardam (o arquivo não pode crescer)
+        with self._trava:
+            yield (REGISTRO.unpack_from(self._mmap, deslocamento)
+                   for deslocamento in range(CABECALHO.size, self._deslocamento(self._quantidade), REGISTRO.size))
+
+    def percorrer(self, funcao):
+        # Aplica funcao ao iterador dos registros, desempacotados em bloco sobre uma visão do
+        # mapeamento; a visão é liberada assim que funcao retorna
+        with self._trava, memoryview(self._mmap) as visao:
+            trecho = visao[CABECALHO.size:self._deslocamento(self._quantidade)]
+            resultado = funcao(REGISTRO.iter_unpack(trecho))
+            trecho.release()
+        return resultado
+
+    def total_centavos(self):
+        return self.percorrer(lambda registros: sum(registro[3] for registro in registros))
+
+    def sincronizar(self):
+        self._mmap.flush()
+
+    def fechar(self):
+        self._mmap.flush()
+        self._mmap.close()
+        self._arquivo.close()
+
+
+class ContadorMapeado(ContadorDiario):
+    # Contadores diários de saques e PIX gravados no registro da conta
+    __slots__ = ('_armazem', '_slot')
+
+    def __init__(self, armazem, slot):
+        super().__init__()
+        self._armazem = armazem
+        self._slot = slot
+
+    def _contagens(self):
+        dia, *contagens = self._armazem.ler(CONTADORES, self._slot)
+        if dia != datetime.date.today().toordinal():
+            return [0] * len(TIPOS_CONTADOS)
+        return contagens
+
+    def _gravar(self, contagens, dia=None):
+        ordinal = (dia or datetime.date.today()).toordinal()
+        self._armazem.gravar(CONTADORES, self._slot, ordinal, *contagens)
+
+    def contagem(self, tipo):
+        return self._contagens()[TIPOS_CONTADOS.index(tipo)] if tipo in TIPOS_CONTADOS else 0
+
+    def estado(self):
+        dia, *contagens = self._armazem.ler(CONTADORES, self._slot)
+        return (datetime.date.fromordinal(dia) if dia else None), dict(zip(TIPOS_CONTADOS, contagens))
+
+    def restaurar(self, dia, contagem):
+        if dia is None:
+            self._armazem.gravar(CONTADORES, self._slot, 0, *([0] * len(TIPOS_CONTADOS)))
+        else:
+            self._gravar([contagem.get(tipo, 0) for tipo in TIPOS_CONTADOS], dia)
+
+    def incrementar(self, tipo):
+        if tipo in TIPOS_CONTADOS:
+            contagens = self._contagens()
+            contagens[TIPOS_CONTADOS.index(tipo)] += 1
+            self._gravar(contagens)
+
+    def decrementar(self, tipo):
+        if tipo in TIPOS_CONTADOS:
+            contagens = self._contagens()
+            indice = TIPOS_CONTADOS.index(tipo)
+            if contagens[indice] > 0:
+                contagens[indice] -= 1
+                self._gravar(contagens)
+
+
+class ContaMapeada(ContaCorrente):
+    __slots__ = ('_armazem', '_slot')
+
+    def __init__(self, cliente, numero, agencia, armazem, **limites):
+        # Conta.__init__ atribui o saldo e o status iniciais; o registro só é associado depois,
+        # para que uma conta reaberta mantenha os valores gravados no arquivo
+        self._armazem = armazem
+        self._slot = None
+        super().__init__(cliente, numero, agencia, **limites)
+        self._slot = armazem.slot(agencia, numero, cliente.cpf)
+        self._contadores = ContadorMapeado(armazem, self._slot)
+
+    @property
+    def _saldo(self):
+        return 0.0 if self._slot is None else self._armazem.ler(CENTAVOS, self._slot)[0] / 100
+
+    @_saldo.setter
+    def _saldo(self, saldo):
+        if self._slot is not None:
+            self._armazem.gravar(CENTAVOS, self._slot, round(saldo * 100))
+
+    @property
+    def _status(self):
+        return SITUACOES[0] if self._slot is None else SITUACOES[self._armazem.ler(STATUS, self._slot)[0]]
+
+    @_status.setter
+    def _status(self, status):
+        if self._slot is not None:
+            self._armazem.gravar(STATUS, self._slot, SITUACOES.index(status))
+
+
+class BancoMapeado(Banco):
+    def __init__(self, caminho, **opcoes):
+        super().__init__(**opcoes)
+        self._armazem = ArmazemSaldos(caminho)
+
+    @property
+    def armazem(self):
+        return self._armazem
+
+    def _nova_conta(self, cliente, numero, agencia):
+        return ContaMapeada(cliente, numero, agencia, self._armazem)
+
+    def listar_contas(self):
+        # Os saldos saem direto dos registros; o nome do titular, das contas já carregadas
+        if not len(self._armazem):
+            print("Nenhuma conta cadastrada.")
+            return
+
+        print("Contas cadastradas:")
+        with self._armazem.registros() as registros:
+            for agencia, cpf, numero, centavos, status, *_ in registros:
+                conta = self.filtrar_conta(numero, agencia.decode())
+                nome = conta.cliente.nome if conta is not None else f"CPF {cpf.decode()}"
+                print(f"Agência: {agencia.decode()}, Número da Conta: {numero}, Cliente: {nome}, "
+                      f"Saldo: R$ {centavos / 100:.2f}, Status: {SITUACOES[status]}")
+
+    def ultimos_numeros(self):
+        # Inclui os registros do arquivo cujas contas ainda não foram criadas de novo
+        ultimos = super().ultimos_numeros()
+        with self._armazem.registros() as registros:
+            for agencia, _, numero, *_ in registros:
+                ultimos[agencia.decode()] = max(ultimos.get(agencia.decode(), 0), numero)
+        return ultimos
+
+    def saldo_total(self):
+        return self._armazem.total_centavos() / 100
+
+    def sincronizar(self):
+        self._armazem.sincronizar()
+
+    def fechar(self):
+        self._armazem.fechar()
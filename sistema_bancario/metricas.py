@@ -0,0 +1,145 @@
+## Métricas de operações do Banco: histogramas de latência e contadores de sucesso/falha.
+## Os histogramas seguem a ideia do HdrHistogram: buckets log-lineares com precisão relativa
+## fixa (2 ** -bits_precisao), memória constante e registro em O(1).
+## As métricas ficam disponíveis como dicionário (snapshot) ou no formato texto do Prometheus.
+## A instrumentação é ativada por Banco.ativar_metricas() e, quando desativada, não deixa
+## nenhum custo nas operações.
+
+import threading
+import time
+
+# Maior shift suportado: latências de até 2 ** 64 ns
+SHIFT_MAXIMO = 64
+
+
+class HistogramaLatencia:
+    def __init__(self, bits_precisao=5):
+        self._bits = bits_precisao
+        self._limite_exato = 1 << (bits_precisao + 1)  # Valores abaixo disso têm bucket próprio
+        self._contagens = [0] * ((SHIFT_MAXIMO + 2) << bits_precisao)
+        self._total = 0
+        self._soma = 0
+        self._maximo = 0
+
+    def _indice(self, valor):
+        if valor < self._limite_exato:
+            return valor
+        shift = valor.bit_length() - self._bits - 1
+        return (shift << self._bits) + (valor >> shift)
+
+    def _valor(self, indice):
+        # Menor valor representado pelo bucket
+        if indice < self._limite_exato:
+            return indice
+        shift = (indice >> self._bits) - 1
+        return (indice - (shift << self._bits)) << shift
+
+    def registrar(self, valor):
+        self._contagens[self._indice(valor)] += 1
+        self._total += 1
+        self._soma += valor
+        if valor > self._maximo:
+            self._maximo = valor
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def soma(self):
+        return self._soma
+
+    @property
+    def maximo(self):
+        return self._maximo
+
+    def percentil(self, fracao):
+        if not self._total:
+            return 0
+        alvo = max(1, round(fracao * self._total))
+        acumulado = 0
+        for indice, contagem in enumerate(self._contagens):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return min(self._valor(indice), self._maximo)
+        return self._maximo
+
+
+class MetricasBanco:
+    QUANTIS = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, bits_precisao=5):
+        self._bits_precisao = bits_precisao
+        self._operacoes = {}  # operação -> [sucessos, falhas, histograma]
+        self._trava = threading.Lock()
+
+    def _operacao(self, operacao):
+        dados = self._operacoes.get(operacao)
+        if dados is None:
+            dados = self._operacoes.setdefault(operacao, [0, 0, HistogramaLatencia(self._bits_precisao)])
+        return dados
+
+    def registrar(self, operacao, sucesso, nanossegundos):
+        dados = self._operacao(operacao)
+        with self._trava:
+            dados[not sucesso] += 1
+            dados[2].registrar(nanossegundos)
+
+    def instrumentar(self, operacao, funcao):
+        # Envolve a função medindo a latência; resultados False contam como falha.
+        # Os contadores da operação são resolvidos uma única vez, fora do caminho medido
+        dados = self._operacao(operacao)
+        registrar = dados[2].registrar
+        trava = self._trava
+        relogio = time.perf_counter_ns
+
+        def medir(*argumentos, **opcoes):
+            inicio = relogio()
+            resultado = funcao(*argumentos, **opcoes)
+            duracao = relogio() - inicio
+            with trava:
+                dados[resultado is False] += 1
+                registrar(duracao)
+            return resultado
+
+        return medir
+
+    def snapshot(self):
+        with self._trava:
+            resultado = {}
+            for operacao, (sucessos, falhas, histograma) in self._operacoes.items():
+                resultado[operacao] = {
+                    "sucessos": sucessos,
+                    "falhas": falhas,
+                    "latencia_media_ns": histograma.soma / histograma.total if histograma.total else 0,
+                    "latencia_maxima_ns": histograma.maximo,
+                    **{f"latencia_p{quantil * 100:g}_ns": histograma.percentil(quantil) for quantil in self.QUANTIS},
+                }
+            return resultado
+
+    def prometheus(self):
+        with self._trava:
+            operacoes = [(operacao, *dados) for operacao, dados in self._operacoes.items()]
+
+            linhas = [
+                "# HELP banco_operacoes_total Operações processadas pelo banco, por resultado.",
+                "# TYPE banco_operacoes_total counter",
+            ]
+            for operacao, sucessos, falhas, _ in operacoes:
+                linhas.append(f'banco_operacoes_total{{operacao="{operacao}",resultado="sucesso"}} {sucessos}')
+                linhas.append(f'banco_operacoes_total{{operacao="{operacao}",resultado="falha"}} {falhas}')
+
+            linhas += [
+                "# HELP banco_latencia_segundos Latência das operações do banco.",
+                "# TYPE banco_latencia_segundos summary",
+            ]
+            for operacao, _, _, histograma in operacoes:
+                for quantil in self.QUANTIS:
+                    linhas.append(
+                        f'banco_latencia_segundos{{operacao="{operacao}",quantile="{quantil:g}"}} '
+                        f'{histograma.percentil(quantil) / 1e9:.9f}'
+                    )
+                linhas.append(f'banco_latencia_segundos_sum{{operacao="{operacao}"}} {histograma.soma / 1e9:.9f}')
+                linhas.append(f'banco_latencia_segundos_count{{operacao="{operacao}"}} {histograma.total}')
+
+        return "\n".join(linhas) + "\n"
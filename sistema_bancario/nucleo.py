@@ -0,0 +1,998 @@
+## Núcleo do sistema bancário: clientes, contas, transações, histórico, diretório PIX e o Banco.
+## Não tem efeitos colaterais na importação; a interface de console fica em sistema_bancario.interface.
+
+from abc import ABC, abstractclassmethod, abstractproperty
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Sequence
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+import re   
+import datetime
+import threading
+import time
+
+from .eventos import Evento, SinkConsole
+from .metricas import MetricasBanco
+from .validadores import VALIDADORES_CHAVE_PIX
+
+def atributos(objeto):
+    # Pares (nome, valor) dos atributos declarados em __slots__, das classes base para as derivadas
+    for classe in reversed(type(objeto).__mro__):
+        for nome in classe.__dict__.get('__slots__', ()):
+            if hasattr(objeto, nome):
+                yield nome, getattr(objeto, nome)
+
+SINK_PADRAO = SinkConsole()  # As mensagens vão para o terminal, como na interface interativa
+
+# Limites dos valores: o histórico guarda os centavos de cada transação em um inteiro de 64 bits,
+# e uma operação vale no máximo VALOR_MAXIMO, bem abaixo desse limite
+CENTAVOS_MAXIMO = 2 ** 63 - 1
+VALOR_MAXIMO = 10 ** 12
+
+def valor_valido(valor):
+    # Valor de operação aceito: positivo, finito e até VALOR_MAXIMO (NaN falha nas duas comparações)
+    return 0 < valor <= VALOR_MAXIMO
+
+class Cliente():
+    __slots__ = ('_endereco', '_contas')
+
+    def __init__(self, endereco):
+        self._endereco = endereco  # Endereço completo do cliente
+        self._contas = []  # Lista de contas associadas ao cliente
+
+    def __str__(self):
+        return f"{self.__class__.__name__}:{', '.join([f'{chave}={valor}' for chave, valor in atributos(self)])}"
+    
+    @property
+    def endereco(self):
+        return self._endereco
+
+    @classmethod
+    def realizar_transacao(self, conta, transacao):
+        return transacao.registrar(conta)
+
+    def adicionar_conta(self, conta):
+        self._contas.append(conta)
+
+class PessoaFisica(Cliente):
+    __slots__ = ('_cpf', '_nome', '_data_nascimento')
+
+    def __init__(self, cpf, nome, data_nascimento, endereco=None):
+        super().__init__(endereco)
+        self._cpf = cpf
+        self._nome = nome
+        self._data_nascimento = data_nascimento
+    
+    def __str__(self):
+        return f"{self.__class__.__name__}:{', '.join([f'{chave}={valor}' for chave, valor in atributos(self)])}"    
+
+    @property  
+    def cpf(self):
+        return self._cpf
+    
+    @property  
+    def nome(self):
+        return self._nome
+    
+    @property  
+    def data_nascimento(self):
+        return self._data_nascimento
+
+class Conta():
+    __slots__ = ('_saldo', '_agencia', '_numero', '_cliente', '_historico', '_status', '_trava', '_sink')
+
+    def __init__(self, cliente, numero, agencia='0001'):
+        self._saldo = 0.0
+        self._agencia = agencia  # Agência padrão'
+        self._numero = numero
+        self._cliente = cliente
+        self._historico = Historico()  # Histórico de transações
+        self._status = 'ativo'  # Status da conta
+        self._trava = threading.Lock()  # Serializa as operações sobre a conta
+        self._sink = SINK_PADRAO  # Destino dos eventos das operações (ver sistema_bancario.eventos)
+
+    def __str__(self):
+        return f"{self.__class__.__name__}:{', '.join([f'{chave}={valor}' for chave, valor in atributos(self)])}" 
+  
+    @classmethod
+    def nova_conta(cls, cliente, numero, agencia='0001'):
+        return cls(numero, agencia, cliente)
+     
+    @property  
+    def saldo(self):
+        return self._saldo
+    
+    @property  
+    def numero(self):
+        return self._numero
+    
+    @property  
+    def agencia(self):
+        return self._agencia
+    
+    @property  
+    def cliente(self):
+        return self._cliente
+    
+    @property  
+    def historico(self):
+        return self._historico
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def trava(self):
+        return self._trava
+
+    @property
+    def sink(self):
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink):
+        self._sink = sink
+
+    def _emitir(self, codigo, sucesso, valor=None, detalhe=None):
+        self._sink.emitir(Evento(codigo, sucesso, self._agencia, self._numero, valor, detalhe))
+
+    def restaurar(self, saldo, status):
+        self._saldo = saldo
+        self._status = status
+
+    def sacar(self, valor):
+        saldo = self.saldo
+        excedeu_saldo = valor > saldo
+
+        if excedeu_saldo:
+            self._emitir("saldo_insuficiente", False, valor)
+
+        elif valor_valido(valor):
+            self._saldo -= valor
+            self._emitir("saque_realizado", True, valor)
+            return True
+        
+        else:
+            self._emitir("valor_invalido", False, valor)
+
+        return False
+       
+    def depositar(self, valor):     
+        if valor_valido(valor):
+            self._saldo += valor
+            self._emitir("deposito_realizado", True, valor)
+        else:
+            self._emitir("valor_invalido", False, valor)
+            return False
+        
+        return True
+    
+        
+class ContaCorrente(Conta):
+    __slots__ = ('_limite', '_limite_saques', '_limite_pix', '_limite_valor_pix', '_contadores')
+
+    def __init__(self, cliente, numero, agencia, limite=500, limite_saques=3, limite_pix=5, limite_valor_pix=1000):
+        super().__init__(cliente, numero, agencia)
+        self._limite = limite
+        self._limite_saques = limite_saques
+        self._limite_pix = limite_pix
+        self._limite_valor_pix = limite_valor_pix
+        self._contadores = ContadorDiario()  # Saques e PIX realizados no dia
+
+    def __str__(self):
+        return f"""\
+            Agência:\t{self.agencia}
+            C/C:\t\t{self.numero}
+            Titular:\t{self.cliente.nome}
+        """
+
+    @property
+    def contadores(self):
+        return self._contadores
+
+    def sacar(self, valor):
+        numero_saques = self._contadores.contagem(Saque.__name__)
+        excedeu_limite = valor > self._limite
+        excedeu_saques = numero_saques >= self._limite_saques
+
+        if excedeu_limite:
+            self._emitir("limite_saque_excedido", False, valor, self._limite)
+
+        elif excedeu_saques:
+            self._emitir("saques_excedidos", False, valor, self._limite_saques)
+
+        elif super().sacar(valor):
+            self._contadores.incrementar(Saque.__name__)
+            return True
+
+        return False 
+ 
+    def transferir_pix(self, valor):
+        numero_pix = self._contadores.contagem(Transferencia_Origem.__name__)
+        excedeu_limite_valor_pix = valor > self._limite_valor_pix
+        excedeu_limite_num_pix = numero_pix >= self._limite_pix
+
+        if not valor_valido(valor):
+            self._emitir("valor_invalido", False, valor)
+
+        elif excedeu_limite_valor_pix:
+            self._emitir("limite_pix_excedido", False, valor, self._limite)
+
+        elif excedeu_limite_num_pix:
+            self._emitir("pix_excedidos", False, valor, self._limite_saques)
+
+        else:
+            self._saldo -= valor
+            self._contadores.incrementar(Transferencia_Origem.__name__)
+            self._emitir("pix_realizado", True, valor)
+            return True
+
+        return False
+
+    def receber_pix(self, valor):
+        if valor_valido(valor):
+            self._saldo += valor
+        else:
+            return False
+        
+        return True
+
+    def estornar_pix(self, valor):
+        # Desfaz um transferir_pix cuja transferência não foi concluída (ex.: PIX entre shards abortado)
+        self._saldo += valor
+        self._contadores.decrementar(Transferencia_Origem.__name__)
+        self._emitir("pix_estornado", True, valor)
+
+class ContadorDiario:
+    __slots__ = ('_dia', '_contagem')
+
+    def __init__(self):
+        self._dia = None  # Dia a que as contagens se referem
+        self._contagem = {}  # Contagem de transações por tipo
+
+    def _dia_atual(self):
+        hoje = datetime.date.today()
+        if hoje != self._dia:
+            self._dia = hoje
+            self._contagem = {}
+        return self._contagem
+
+    def contagem(self, tipo):
+        return self._dia_atual().get(tipo, 0)
+
+    def estado(self):
+        return self._dia, dict(self._contagem)
+
+    def restaurar(self, dia, contagem):
+        self._dia = dia
+        self._contagem = dict(contagem)
+
+    def incrementar(self, tipo):
+        contagem = self._dia_atual()
+        contagem[tipo] = contagem.get(tipo, 0) + 1
+
+    def decrementar(self, tipo):
+        contagem = self._dia_atual()
+        if contagem.get(tipo, 0) > 0:
+            contagem[tipo] -= 1
+
+class Historico:
+    TIPOS = ("Saque", "Deposito", "Transferencia_Origem", "Transferencia_Destino")
+    SINAIS = (-1, 1, -1, 1)  # Efeito de cada tipo no saldo
+    CODIGOS = {tipo: codigo for codigo, tipo in enumerate(TIPOS)}
+
+    __slots__ = ('_tipos', '_valores', '_instantes')
+
+    def __init__(self):
+        self._tipos = array('b')  # Código do tipo de cada transação
+        self._valores = array('q')  # Valores em centavos
+        self._instantes = array('d')  # Data/hora em segundos desde a época
+
+    def __len__(self):
+        return len(self._tipos)
+
+    @property
+    def transacoes(self):
+        return TransacoesHistorico(self)
+
+    def adicionar_transacao(self, transacao):
+        instante = time.time()
+
+        # Mantém o histórico ordenado por data/hora mesmo se o relógio do sistema retroceder
+        if self._instantes and instante < self._instantes[-1]:
+            instante = self._instantes[-1]
+
+        self.adicionar_registro(
+            self.CODIGOS[transacao.__class__.__name__],
+            round(transacao.valor * 100),
+            instante
+        )
+
+    def adicionar_registro(self, codigo, centavos, instante):
+        # Verificado antes de alterar qualquer coluna, para que as três tenham sempre o mesmo tamanho
+        if not -CENTAVOS_MAXIMO <= centavos <= CENTAVOS_MAXIMO:
+            raise OverflowError(f"valor fora do intervalo do histórico: {centavos} centavos")
+        self._tipos.append(codigo)
+        self._valores.append(centavos)
+        self._instantes.append(instante)
+
+    def remover_ultimo(self):
+        # Desfaz o último registro (ex.: débito de um PIX cujo crédito falhou), na ordem inversa
+        # da inclusão, para que _tipos nunca fique mais curta que as outras colunas
+        self._instantes.pop()
+        self._valores.pop()
+        self._tipos.pop()
+
+    def colunas(self):
+        return self._tipos, self._valores, self._instantes
+
+    def restaurar_colunas(self, tipos, valores, instantes):
+        self._tipos = array('b', tipos)
+        self._valores = array('q', valores)
+        self._instantes = array('d', instantes)
+
+    def registro(self, indice):
+        return self._tipos[indice], self._valores[indice], self._instantes[indice]
+
+    def transacao(self, indice):
+        return {
+            "tipo": self.TIPOS[self._tipos[indice]],
+            "valor": self._valores[indice] / 100,
+            "data_hora": datetime.datetime.fromtimestamp(self._instantes[indice]).strftime('%d/%m/%Y %H:%M:%S')
+        }
+
+    @staticmethod
+    def _instante(momento):
+        # Aceita datetime, date (meia-noite do dia) ou segundos desde a época
+        if isinstance(momento, datetime.datetime):
+            return momento.timestamp()
+        if isinstance(momento, datetime.date):
+            return datetime.datetime.combine(momento, datetime.time.min).timestamp()
+        return float(momento)
+
+    def intervalo(self, inicio=None, fim=None):
+        # Posições [primeira, ultima) das transações com inicio <= data/hora < fim, por busca binária
+        primeira = 0 if inicio is None else bisect_left(self._instantes, self._instante(inicio))
+        ultima = len(self) if fim is None else bisect_left(self._instantes, self._instante(fim))
+        return primeira, max(primeira, ultima)
+
+    def consultar(self, inicio=None, fim=None, cursor=None, deslocamento=0, limite=None):
+        # Gera (índice, transação) do período; o índice seguinte ao último serve de cursor da próxima página
+        if deslocamento < 0 or (limite is not None and limite < 1):
+            raise ValueError(f"página inválida: deslocamento {deslocamento!r}, limite {limite!r}")
+
+        primeira, ultima = self.intervalo(inicio, fim)
+        if cursor is not None:
+            primeira = max(primeira, cursor)
+        primeira = min(primeira + deslocamento, ultima)
+        if limite is not None:
+            ultima = min(ultima, primeira + limite)
+
+        for indice in range(primeira, ultima):
+            yield indice, self.transacao(indice)
+
+class TransacoesHistorico(Sequence):
+    # Visão somente leitura do histórico no formato de dicionário, formatada sob demanda
+    def __init__(self, historico):
+        self._historico = historico
+
+    def __len__(self):
+        return len(self._historico)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._historico.transacao(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de transação fora do histórico")
+        return self._historico.transacao(indice)
+
+class Transacao(ABC):
+    __slots__ = ()
+
+    @property
+    @abstractproperty
+    def valor(self):
+        pass
+
+    @abstractclassmethod
+    def registrar(self, conta):
+        pass
+
+class Saque(Transacao):
+    __slots__ = ('_valor',)
+
+    def __init__(self, valor):
+        self._valor = valor
+
+    @property
+    def valor(self):
+        return self._valor
+    
+    def registrar(self, conta):
+        sucesso_transacao = conta.sacar(self.valor)
+
+        if sucesso_transacao:
+            conta.historico.adicionar_transacao(self)
+
+        return sucesso_transacao
+           
+class Deposito(Transacao):
+    __slots__ = ('_valor',)
+
+    def __init__(self, valor):
+        self._valor = valor
+
+    @property
+    def valor(self):
+        return self._valor
+    
+    def registrar(self, conta):
+        sucesso_transacao = conta.depositar(self.valor)
+
+        if sucesso_transacao:
+            conta.historico.adicionar_transacao(self)
+
+        return sucesso_transacao
+
+class Transferencia_Origem(Transacao):
+    __slots__ = ('_valor',)
+
+    def __init__(self, valor):
+        self._valor = valor
+
+    @property
+    def valor(self):
+        return self._valor
+    
+    def registrar(self, conta):
+        sucesso_transacao = conta.transferir_pix(self.valor)
+
+        if sucesso_transacao:
+            conta.historico.adicionar_transacao(self)
+
+        return sucesso_transacao
+
+class Transferencia_Destino(Transacao):
+    __slots__ = ('_valor',)
+
+    def __init__(self, valor):
+        self._valor = valor
+
+    @property
+    def valor(self):
+        return self._valor
+    
+    def registrar(self, conta):
+        sucesso_transacao = conta.receber_pix(self.valor)
+
+        if sucesso_transacao:
+            conta.historico.adicionar_transacao(self)
+
+        return sucesso_transacao
+
+class DiretorioPix:
+    def __init__(self):
+        self._chaves = {}  # (tipo, chave normalizada) -> conta
+
+    def __len__(self):
+        return len(self._chaves)
+
+    @staticmethod
+    def tipo_da_chave(chave):
+        chave = chave.strip()
+        if '@' in chave:
+            return 'email'
+
+        digitos = re.sub(r'\D', '', chave)
+        if chave.startswith('+') or len(digitos) == 10:
+            return 'telefone'
+
+        return 'cnpj' if len(digitos) == 14 else 'cpf'
+
+    @staticmethod
+    def normalizar(tipo, chave):
+        chave = chave.strip()
+        if tipo == 'email':
+            return chave.lower()
+
+        digitos = re.sub(r'\D', '', chave)
+        if tipo == 'telefone' and len(digitos) > 11 and digitos.startswith('55'):
+            digitos = digitos[2:]  # Remove o código do país (+55)
+        return digitos
+
+    def registrar(self, tipo, chave, conta):
+        chave = (tipo, self.normalizar(tipo, chave))
+        if chave in self._chaves:
+            return False
+
+        self._chaves[chave] = conta
+        return True
+
+    def identificar(self, chave, tipo=None):
+        # (tipo, chave normalizada) que identifica a chave no diretório
+        if tipo is None:
+            tipo = self.tipo_da_chave(chave)
+        return tipo, self.normalizar(tipo, chave)
+
+    def resolver(self, chave, tipo=None):
+        return self._chaves.get(self.identificar(chave, tipo))
+
+    def chaves(self):
+        return ((tipo, chave, conta) for (tipo, chave), conta in self._chaves.items())
+
+class Instantaneo:
+    # Visão consistente, de um ponto no tempo, dos clientes e contas do banco, obtida sem interromper
+    # as transações (cópia na escrita): enquanto o instantâneo está aberto, cada operação preserva o
+    # estado das contas que vai alterar, se ainda não preservado, antes de alterá-las
+    def __init__(self, banco, quantidade_clientes, quantidade_contas):
+        self._banco = banco
+        self._quantidade_clientes = quantidade_clientes  # As listas do banco só crescem: o instantâneo é um prefixo
+        self._quantidade_contas = quantidade_contas
+        self._preservados = {}  # Conta -> (saldo, status, transações no histórico) no momento do instantâneo
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    @property
+    def quantidade_clientes(self):
+        return self._quantidade_clientes
+
+    @property
+    def quantidade_contas(self):
+        return self._quantidade_contas
+
+    def preservar(self, conta):
+        # Deve ser chamado com a trava da conta adquirida, antes de alterá-la
+        if conta not in self._preservados:
+            self._preservados[conta] = (conta.saldo, conta.status, len(conta.historico))
+
+    def estado(self, conta):
+        with conta.trava:
+            estado = self._preservados.get(conta)
+            return estado if estado is not None else (conta.saldo, conta.status, len(conta.historico))
+
+    def clientes(self):
+        return islice(self._banco.clientes, self._quantidade_clientes)
+
+    def contas(self):
+        return islice(self._banco.contas, self._quantidade_contas)
+
+    def fechar(self):
+        self._banco.liberar_instantaneo(self)
+
+class CacheExtratos:
+    # Linhas de extrato já formatadas, por conta, nas contas consultadas mais recentemente (LRU).
+    # O histórico só cresce: cada consulta formata apenas as transações registradas desde a anterior.
+    # Se o histórico for substituído (restaurar_colunas), as linhas da conta são refeitas
+    def __init__(self, capacidade=1_024):
+        self._capacidade = capacidade  # Máximo de contas mantidas
+        self._entradas = OrderedDict()  # Conta -> (coluna de tipos do histórico, linhas formatadas)
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    @property
+    def capacidade(self):
+        return self._capacidade
+
+    @staticmethod
+    def formatar(transacao):
+        return f"{transacao['data_hora']} - {transacao['tipo']}: R$ {transacao['valor']:.2f}"
+
+    def extrato(self, conta):
+        # Devolve (saldo, linhas) de um mesmo momento da conta
+        historico = conta.historico
+        with conta.trava:
+            saldo = conta.saldo
+            quantidade = len(historico)
+            tipos = historico.colunas()[0]
+
+        with self._trava:
+            entrada = self._entradas.pop(conta, None)
+            if entrada is None or entrada[0] is not tipos:
+                entrada = (tipos, [])
+            linhas = entrada[1]
+            linhas.extend(self.formatar(historico.transacao(indice)) for indice in range(len(linhas), quantidade))
+
+            self._entradas[conta] = entrada
+            if len(self._entradas) > self._capacidade:
+                self._entradas.popitem(last=False)
+            return saldo, linhas[:quantidade]
+
+class Banco:
+    # Métodos medidos quando as métricas estão ativas e o nome da operação correspondente
+    OPERACOES_MEDIDAS = {
+        "registrar_deposito": "deposito",
+        "registrar_saque": "saque",
+        "realizar_pix": "pix",
+        "exibir_extrato": "extrato",
+    }
+
+    def __init__(self, metricas=None, sink=None, velocidade=None, extratos=None):
+        self._clientes = []  # Lista de clientes do banco
+        self._contas = []  # Lista de contas do banco
+        self._indice_clientes = {}  # Índice de clientes por CPF
+        self._indice_contas = {}  # Índice de contas por (agência, número)
+        self._agencias = {"0001","0002","0003" }  # Conjunto de agências válidas
+        self._ouvintes = []  # Observadores notificados a cada alteração de estado (ex.: journal)
+        self._trava_cadastro = threading.Lock()  # Protege a inclusão de clientes, contas e chaves PIX
+        self._diretorio_pix = DiretorioPix()  # Chaves PIX cadastradas
+        self._metricas = None  # Histogramas de latência e contadores por operação
+        self._sink = sink if sink is not None else SINK_PADRAO  # Destino dos eventos do banco e das suas contas
+        self._velocidade = velocidade  # Regras de velocidade verificadas antes de cada transação (ver sistema_bancario.velocidade)
+        self._instantaneos = ()  # Instantâneos abertos (substituído, nunca alterado, para leitura sem trava)
+        self._extratos = extratos if extratos is not None else CacheExtratos()  # Linhas de extrato já formatadas
+
+        if metricas is not None:
+            self.ativar_metricas(metricas)
+    
+    @property
+    def contas(self):
+        return self._contas
+    
+    @property
+    def clientes(self):
+        return self._clientes
+    
+    @property
+    def agencias(self):
+        return self._agencias
+
+    @property
+    def diretorio_pix(self):
+        return self._diretorio_pix
+
+    @property
+    def sink(self):
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink):
+        with self._trava_cadastro:
+            self._sink = sink
+            for conta in self._contas:
+                conta.sink = sink
+
+    @property
+    def metricas(self):
+        return self._metricas
+
+    @property
+    def extratos(self):
+        return self._extratos
+
+    @property
+    def velocidade(self):
+        return self._velocidade
+
+    @velocidade.setter
+    def velocidade(self, motor):
+        self._velocidade = motor
+
+    def ativar_metricas(self, metricas=None):
+        # As versões medidas substituem os métodos apenas nesta instância; desativadas, as
+        # chamadas voltam a ir direto aos métodos da classe, sem nenhuma verificação extra
+        self.desativar_metricas()
+        self._metricas = metricas if metricas is not None else MetricasBanco()
+        for metodo, operacao in self.OPERACOES_MEDIDAS.items():
+            setattr(self, metodo, self._metricas.instrumentar(operacao, getattr(self, metodo)))
+        return self._metricas
+
+    def desativar_metricas(self):
+        for metodo in self.OPERACOES_MEDIDAS:
+            self.__dict__.pop(metodo, None)
+        self._metricas = None
+
+    def instantaneo(self):
+        with self._trava_cadastro:
+            instantaneo = Instantaneo(self, len(self._clientes), len(self._contas))
+            self._instantaneos += (instantaneo,)
+        return instantaneo
+
+    def liberar_instantaneo(self, instantaneo):
+        with self._trava_cadastro:
+            self._instantaneos = tuple(aberto for aberto in self._instantaneos if aberto is not instantaneo)
+
+    def _preservar(self, *contas):
+        # Deve ser chamado com as travas das contas adquiridas, uma única vez por operação e antes de
+        # qualquer alteração, para que uma operação fique inteira dentro ou fora de cada instantâneo
+        for instantaneo in self._instantaneos:
+            for conta in contas:
+                instantaneo.preservar(conta)
+
+    def adicionar_ouvinte(self, ouvinte):
+        self._ouvintes.append(ouvinte)
+
+    def remover_ouvinte(self, ouvinte):
+        self._ouvintes.remove(ouvinte)
+
+    def adicionar_cliente(self, cpf, nome, data_nascimento, endereco):
+
+        cliente = PessoaFisica(cpf, nome, data_nascimento, endereco)
+        
+        with self._trava_cadastro:
+            self.clientes.append(cliente)  
+            self._indice_clientes.setdefault(cpf, cliente)
+
+            for ouvinte in self._ouvintes:
+                ouvinte.cliente_adicionado(cliente)
+
+        return cliente
+
+    def criar_conta(self, cpf, numero, agencia):
+
+        cliente = self.buscar_cliente(cpf)
+
+        if cliente:
+            with self._trava_cadastro:
+                if self._conta_cadastrada(numero, agencia):
+                    conta = None
+                else:
+                    conta = self._incluir_conta(self._nova_conta(cliente, numero, agencia))
+
+                    for ouvinte in self._ouvintes:
+                        ouvinte.conta_criada(conta)
+
+            if conta is not None:
+                self._sink.emitir(Evento("conta_criada", True, agencia, numero, None, cliente.nome))
+                return conta
+
+            self._sink.emitir(Evento("conta_ja_cadastrada", False, agencia, numero, None, cliente.nome))
+
+        else:
+            self._sink.emitir(Evento("cliente_nao_encontrado", False, agencia, numero, None, cpf))
+
+        return None
+
+    def _conta_cadastrada(self, numero, agencia):
+        # Deve ser chamado com a trava de cadastro adquirida; bancos persistentes também consultam
+        # as contas gravadas que ainda não foram carregadas
+        return (agencia, numero) in self._indice_contas
+
+    def _nova_conta(self, cliente, numero, agencia):
+        # Ponto de extensão para bancos com outro armazenamento de contas (ex.: BancoMapeado)
+        return ContaCorrente(cliente, numero, agencia)
+
+    def incluir_conta(self, conta):
+        with self._trava_cadastro:
+            return self._incluir_conta(conta)
+
+    def _incluir_conta(self, conta):
+        conta.sink = self._sink
+        conta.cliente.adicionar_conta(conta)
+        self.contas.append(conta)
+        self._indice_contas.setdefault((conta.agencia, conta.numero), conta)
+        return conta
+
+    def registrar_chave_pix(self, numero, agencia, tipo, chave):
+        conta = self.filtrar_conta(numero, agencia)
+
+        if not conta:
+            codigo = "conta_nao_encontrada"
+
+        elif tipo not in VALIDADORES_CHAVE_PIX or not VALIDADORES_CHAVE_PIX[tipo](chave):
+            codigo = "chave_pix_invalida"
+
+        elif not self._incluir_chave_pix(conta, tipo, chave):
+            codigo = "chave_pix_ja_cadastrada"
+
+        else:
+            self._sink.emitir(Evento("chave_pix_cadastrada", True, agencia, numero, None, chave))
+            return True
+
+        self._sink.emitir(Evento(codigo, False, agencia, numero, None, chave))
+        return False
+
+    def registrar_chaves_pix(self, chaves, validar=True):
+        # Cadastro em lote: chaves é um iterável de (numero, agencia, tipo, chave)
+        cadastradas = 0
+
+        for numero, agencia, tipo, chave in chaves:
+            conta = self.filtrar_conta(numero, agencia)
+            if conta is None or tipo not in VALIDADORES_CHAVE_PIX:
+                continue
+            if validar and not VALIDADORES_CHAVE_PIX[tipo](chave):
+                continue
+            cadastradas += self._incluir_chave_pix(conta, tipo, chave)
+
+        return cadastradas
+
+    def _incluir_chave_pix(self, conta, tipo, chave):
+        with self._trava_cadastro:
+            if not self._diretorio_pix.registrar(tipo, chave, conta):
+                return False
+
+            for ouvinte in self._ouvintes:
+                ouvinte.chave_pix_registrada(conta, tipo, chave)
+
+        return True
+
+    def buscar_cliente(self, cpf):
+        return self._indice_clientes.get(cpf)
+     
+    def listar_clientes(self):
+        with self.instantaneo() as instantaneo:
+            if not instantaneo.quantidade_clientes:
+                print("Nenhum cliente cadastrado.")
+                return
+            print("Clientes cadastrados:")
+            for cliente in instantaneo.clientes():
+                print(f"CPF: {cliente._cpf}, Nome: {cliente._nome}, Data de Nascimento: {cliente._data_nascimento}, Endereço: {cliente._endereco}")
+
+    def listar_contas(self):
+        # As contas e os saldos listados são os do início da listagem, mesmo com transações em andamento
+        with self.instantaneo() as instantaneo:
+            if not instantaneo.quantidade_contas:
+                print("Nenhuma conta cadastrada.")
+                return
+            print("Contas cadastradas:")
+            for conta in instantaneo.contas():
+                saldo, status, _ = instantaneo.estado(conta)
+                print(f"Agência: {conta.agencia}, Número da Conta: {conta.numero}, Cliente: {conta.cliente.nome}, Saldo: R$ {saldo:.2f}, Status: {status}")
+
+    def agencia_valida(self, agencia):
+        valido = agencia.isdigit() and len(agencia) == 4 and agencia in self.agencias
+        if not valido:
+            print("Agência inválida! Verifique o número da agência.") 
+        return valido
+    
+    def filtrar_conta(self, numero, agencia):
+        return self._indice_contas.get((agencia, numero))
+           
+    def validar_conta(self, numero, agencia):
+        return (agencia, numero) in self._indice_contas
+
+    def ultimos_numeros(self):
+        # Maior número de conta já usado em cada agência, para que a numeração de novas contas
+        # (AlocadorNumeros.avancar) continue depois das contas restauradas
+        with self._trava_cadastro:
+            chaves = list(self._indice_contas)
+
+        ultimos = {}
+        for agencia, numero in chaves:
+            ultimos[agencia] = max(ultimos.get(agencia, 0), numero)
+        return ultimos
+
+    def registrar_deposito(self, numero, agencia, valor):
+    
+        conta = self.filtrar_conta(numero, agencia)
+        
+        if conta:
+            return self._executar_transacao(conta, Deposito(valor))
+
+        return False
+        
+    def registrar_saque(self, numero, agencia, valor):
+        
+        conta = self.filtrar_conta(numero, agencia)
+        
+        if conta:
+            return self._executar_transacao(conta, Saque(valor))
+
+        return False
+
+    def realizar_pix(self, numero, agencia, valor, chave, tipo_chave=None):
+        
+        conta = self.filtrar_conta(numero, agencia)
+        
+        if conta:
+            destino = self._diretorio_pix.resolver(chave, tipo_chave)
+
+            if not valor_valido(valor):
+                self._sink.emitir(Evento("valor_invalido", False, agencia, numero, valor, None))
+                return False
+
+            if destino is None:
+                self._sink.emitir(Evento("chave_pix_nao_encontrada", False, agencia, numero, valor, chave))
+                return False
+
+            chave_destino = self._diretorio_pix.identificar(chave, tipo_chave) if self._velocidade is not None else None
+
+            with self.travar_contas(conta, destino):
+                if self._instantaneos:
+                    self._preservar(conta, destino)
+
+                # Tudo ou nada: os ouvintes só são notificados depois do crédito no destino; se
+                # ele falhar, o débito na origem é desfeito
+                debito = Transferencia_Origem(valor)
+                sucesso, reserva = self._registrar_transacao(conta, debito, chave_destino)
+                if sucesso:
+                    # Num PIX para a própria conta o crédito vem logo depois do débito no histórico
+                    indice_debito = len(conta.historico) - 1
+                    credito = Transferencia_Destino(valor)
+                    if self._registrar_transacao(destino, credito)[0]:
+                        self._notificar_transacao(conta, debito, indice_debito)
+                        self._notificar_transacao(destino, credito)
+                    else:
+                        conta.estornar_pix(valor)
+                        conta.historico.remover_ultimo()
+                        if reserva:
+                            self._velocidade.cancelar(reserva)
+                        sucesso = False
+
+            return sucesso
+
+        return False
+    
+    @staticmethod
+    @contextmanager
+    def travar_contas(*contas):
+        # Adquire as travas sempre na mesma ordem (agência, número) para evitar deadlocks
+        with ExitStack() as pilha:
+            for conta in sorted(set(contas), key=lambda conta: (conta.agencia, conta.numero)):
+                pilha.enter_context(conta.trava)
+            yield
+
+    def _executar_transacao(self, conta, transacao):
+        with conta.trava:
+            if self._instantaneos:
+                self._preservar(conta)
+            return self._aplicar_transacao(conta, transacao)
+
+    def _aplicar_transacao(self, conta, transacao, chave_destino=None):
+        # Deve ser chamado com a trava da conta adquirida
+        sucesso, _ = self._registrar_transacao(conta, transacao, chave_destino)
+        if sucesso:
+            self._notificar_transacao(conta, transacao)
+        return sucesso
+
+    def _registrar_transacao(self, conta, transacao, chave_destino=None):
+        # Aplica a transação sem notificar os ouvintes; devolve (sucesso, reserva de velocidade)
+        reserva = None
+        # Valores inválidos não passam pelas regras de velocidade: seguem para a conta, que os recusa
+        if self._velocidade is not None and valor_valido(transacao.valor):
+            regra, reserva = self._velocidade.autorizar(conta, transacao, chave_destino)
+            if regra is not None:
+                self._sink.emitir(Evento("limite_velocidade_excedido", False, conta.agencia, conta.numero, transacao.valor, regra.nome))
+                return False, None
+
+        sucesso = conta.cliente.realizar_transacao(conta, transacao)
+
+        if reserva and not sucesso:
+            self._velocidade.cancelar(reserva)
+
+        return sucesso, reserva
+
+    def _notificar_transacao(self, conta, transacao, indice=None):
+        # `indice`: posição da transação no histórico da conta (padrão: a última)
+        indice = len(conta.historico) - 1 if indice is None else indice
+        for ouvinte in self._ouvintes:
+            ouvinte.transacao_registrada(conta, transacao, indice)
+
+    def consultar_extrato(self, numero, agencia, inicio=None, fim=None, cursor=None, deslocamento=0, limite=None):
+        conta = self.filtrar_conta(numero, agencia)
+
+        if conta:
+            yield from conta.historico.consultar(inicio, fim, cursor, deslocamento, limite)
+
+    def pagina_extrato(self, numero, agencia, inicio=None, fim=None, cursor=None, limite=50):
+        if limite < 1:
+            raise ValueError(f"limite de página inválido: {limite!r}")
+        transacoes = list(self.consultar_extrato(numero, agencia, inicio, fim, cursor, limite=limite + 1))
+        proximo_cursor = transacoes.pop()[0] if len(transacoes) > limite else None
+        return [transacao for _, transacao in transacoes], proximo_cursor
+
+    def exibir_extrato(self, numero, agencia):
+        
+        conta = self.filtrar_conta(numero, agencia) 
+
+        if conta:
+            saldo, linhas = self._extratos.extrato(conta)
+            if linhas:
+                print(f"\n=== Extrato da Conta {conta.numero} - Agência {conta.agencia} ===")
+                print("\n".join(linhas))
+                print(f"\nSaldo: R$ {saldo:.2f}") 
+            else:
+                print("Nenhuma transação realizada.")                        
+            return True
+
+        return False
@@ -0,0 +1,82 @@
+## Alocação de números de conta sem trava global e sem percorrer a lista de contas.
+## Os números são arrendados em blocos de `tamanho_bloco` por agência. Cada thread recebe os
+## seus próprios blocos (threading.local) e só volta ao alocador quando o bloco se esgota, de
+## modo que a trava do alocador é adquirida uma vez a cada `tamanho_bloco` contas.
+## Com `arquivo`, o próximo número livre de cada agência é persistido a cada novo bloco, sob
+## uma trava de arquivo (fcntl), e os números continuam únicos entre reinícios e entre
+## processos (ex.: shards) que compartilham o mesmo arquivo. Os números restantes de um bloco
+## arrendado e não usado antes de um reinício são descartados: a numeração pode ter lacunas,
+## mas nunca repetições.
+## Uso:
+##   alocador = AlocadorNumeros("numeracao.json")
+##   numero = alocador.proximo("0001")
+
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Sem fcntl (Windows) a exclusão mútua vale apenas dentro do processo
+
+TAMANHO_BLOCO = 100
+
+
+class AlocadorNumeros:
+    def __init__(self, arquivo=None, tamanho_bloco=TAMANHO_BLOCO):
+        self._arquivo = arquivo
+        self._tamanho_bloco = tamanho_bloco
+        self._proximos = {}  # Agência -> primeiro número ainda não arrendado por este alocador
+        self._trava = threading.Lock()
+        self._local = threading.local()  # Blocos da thread: agência -> [próximo, fim)
+
+    def proximo(self, agencia):
+        blocos = getattr(self._local, "blocos", None)
+        if blocos is None:
+            blocos = self._local.blocos = {}
+
+        bloco = blocos.get(agencia)
+        if bloco is None or bloco[0] >= bloco[1]:
+            bloco = blocos[agencia] = self._arrendar(agencia)
+
+        numero = bloco[0]
+        bloco[0] += 1
+        return numero
+
+    def avancar(self, agencia, numero):
+        # Garante que os próximos blocos da agência comecem depois de `numero` (ex.: contas já
+        # existentes em um banco restaurado); não afeta blocos já arrendados pelas threads
+        with self._trava:
+            self._proximos[agencia] = max(self._proximos.get(agencia, 1), numero + 1)
+
+    def _arrendar(self, agencia):
+        with self._trava:
+            inicio = self._proximos.get(agencia, 1)
+            if self._arquivo is not None:
+                inicio = self._arrendar_no_arquivo(agencia, inicio)
+            self._proximos[agencia] = inicio + self._tamanho_bloco
+        return [inicio, inicio + self._tamanho_bloco]
+
+    def _arrendar_no_arquivo(self, agencia, minimo):
+        # A trava fica em um arquivo à parte porque o arquivo de dados é substituído a cada gravação
+        with open(self._arquivo + ".trava", "a") as trava:
+            if fcntl is not None:
+                fcntl.flock(trava, fcntl.LOCK_EX)
+
+            proximos = {}
+            if os.path.exists(self._arquivo):
+                with open(self._arquivo, encoding="utf-8") as arquivo:
+                    proximos = json.load(arquivo)
+
+            inicio = max(proximos.get(agencia, 1), minimo)
+            proximos[agencia] = inicio + self._tamanho_bloco
+
+            temporario = self._arquivo + ".tmp"
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                json.dump(proximos, arquivo)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            os.replace(temporario, self._arquivo)
+
+        return inicio
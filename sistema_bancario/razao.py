@@ -0,0 +1,401 @@
+## Livro-razão com event sourcing: o log de transações é a fonte da verdade, e os saldos, os
+## contadores diários e as posições por cliente são projeções reconstruídas a partir dele.
+## Cada transação bem-sucedida é anexada como um registro binário de 21 bytes (conta, tipo,
+## centavos, data/hora) à partição da sua conta. As contas recebem um número sequencial na
+## criação e ficam na partição (número módulo quantidade de partições), de modo que todos os
+## eventos de uma conta estão em uma única partição, na ordem em que ocorreram. Clientes, contas
+## e chaves PIX vão para o cadastro, em JSONL.
+## A reconstrução processa as partições em paralelo, uma por processo, em blocos de tamanho fixo
+## (vetorizada com NumPy quando disponível). BancoRazao reconstrói o banco inteiro ao abrir o
+## diretório: saldo, contadores diários e histórico de cada conta saem do log, montados nos mesmos
+## processos, e o estado em memória passa a ser apenas a projeção corrente, mantida a cada nova
+## transação.
+## As gravações são sincronizadas a cada `intervalo_sincronizacao` segundos; uma queda pode
+## perder apenas os registros ainda não sincronizados. Um registro gravado pela metade no fim de
+## uma partição e eventos de contas ausentes do cadastro são ignorados; ao abrir um BancoRazao,
+## esses eventos são removidos das partições, já que o número da conta será dado à próxima criada.
+## Uso:
+##   banco = BancoRazao("razao")
+##   banco.registrar_deposito(1, "0001", 100.0)
+##   banco.fechar()
+##   python -m sistema_bancario.razao razao --processos 8   (reconstrói e resume as projeções)
+
+import argparse
+import datetime
+import json
+import os
+import struct
+import threading
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .nucleo import Banco, Historico
+
+ARQUIVO_CADASTRO = "cadastro.jsonl"
+PREFIXO_PARTICAO = "particao-"
+SUFIXO_PARTICAO = ".log"
+PARTICOES = 8
+
+EVENTO = struct.Struct("<Ibqd")  # Conta, código do tipo, centavos, data/hora em segundos desde a época
+EVENTOS_POR_BLOCO = 1 << 20
+CODIGO_SAQUE = Historico.CODIGOS["Saque"]
+CODIGO_PIX = Historico.CODIGOS["Transferencia_Origem"]
+
+if np is not None:
+    TIPO_EVENTO = np.dtype([("conta", "<u4"), ("codigo", "i1"), ("centavos", "<i8"), ("instante", "<f8")])
+
+Cadastro = namedtuple("Cadastro", "clientes contas chaves")
+Projecoes = namedtuple("Projecoes", "eventos contas saldos transacoes saques_hoje pix_hoje posicoes historicos",
+                       defaults=(None,))
+
+
+class LivroRazao:
+    def __init__(self, diretorio, particoes=PARTICOES, contas=(), intervalo_sincronizacao=0.05):
+        # `contas`: (cpf, agencia, numero) das contas já cadastradas, na ordem do cadastro
+        self._diretorio = diretorio
+        self._ids = {(agencia, numero): indice for indice, (_, agencia, numero) in enumerate(contas)}
+        self._intervalo_sincronizacao = intervalo_sincronizacao
+
+        # Registros gravados pela metade antes de uma queda são descartados antes de anexar novos
+        caminhos = listar_particoes(diretorio) or [caminho_particao(diretorio, indice) for indice in range(particoes)]
+        self._particoes = [open(caminho, "ab") for caminho in caminhos]
+        for arquivo in self._particoes:
+            arquivo.truncate(arquivo.tell() - arquivo.tell() % EVENTO.size)
+        self._travas = [threading.Lock() for _ in caminhos]  # Uma por partição
+        self._cadastro = open(os.path.join(diretorio, ARQUIVO_CADASTRO), "ab")
+        self._cadastro.truncate(_fim_ultima_linha(self._cadastro.name))
+        self._trava = threading.Lock()  # Protege o cadastro
+
+        self._parar = threading.Event()
+        self._sincronizador = threading.Thread(target=self._sincronizar_periodicamente, daemon=True)
+        self._sincronizador.start()
+
+    @property
+    def particoes(self):
+        return len(self._particoes)
+
+    def cliente_adicionado(self, cliente):
+        self._anexar(["cliente", cliente.cpf, cliente.nome, cliente.data_nascimento, cliente.endereco])
+
+    def conta_criada(self, conta):
+        # Chamado com a trava de cadastro do banco adquirida: os números saem em sequência
+        if (conta.agencia, conta.numero) not in self._ids:
+            self._ids[(conta.agencia, conta.numero)] = len(self._ids)
+            self._anexar(["conta", conta.cliente.cpf, conta.agencia, conta.numero])
+
+    def chave_pix_registrada(self, conta, tipo, chave):
+        self._anexar(["chave", conta.agencia, conta.numero, tipo, chave])
+
+    def transacao_registrada(self, conta, transacao, indice):
+        # Chamado com a trava da conta adquirida: os eventos da conta entram na ordem do histórico
+        codigo, centavos, instante = conta.historico.registro(indice)
+        identificador = self._ids[(conta.agencia, conta.numero)]
+        particao = identificador % len(self._particoes)
+        with self._travas[particao]:
+            self._particoes[particao].write(EVENTO.pack(identificador, codigo, centavos, instante))
+
+    def _anexar(self, registro):
+        with self._trava:
+            self._cadastro.write((json.dumps(registro, ensure_ascii=False, separators=(",", ":")) + "\n").encode())
+
+    def _sincronizar_periodicamente(self):
+        while not self._parar.wait(self._intervalo_sincronizacao):
+            self.sincronizar()
+
+    def sincronizar(self):
+        # O cadastro primeiro, para que os eventos sincronizados tenham as suas contas cadastradas
+        with self._trava:
+            self._cadastro.flush()
+            os.fsync(self._cadastro.fileno())
+        for trava, arquivo in zip(self._travas, self._particoes):
+            with trava:
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+
+    def fechar(self):
+        self._parar.set()
+        self._sincronizador.join()
+        self.sincronizar()
+        self._cadastro.close()
+        for arquivo in self._particoes:
+            arquivo.close()
+
+
+def _fim_ultima_linha(caminho):
+    # Posição logo após o último fim de linha do arquivo (0 se não houver nenhum)
+    with open(caminho, "rb") as arquivo:
+        fim = arquivo.seek(0, os.SEEK_END)
+        while fim > 0:
+            inicio = max(fim - 4096, 0)
+            arquivo.seek(inicio)
+            posicao = arquivo.read(fim - inicio).rfind(b"\n")
+            if posicao >= 0:
+                return inicio + posicao + 1
+            fim = inicio
+    return 0
+
+
+def caminho_particao(diretorio, indice):
+    return os.path.join(diretorio, f"{PREFIXO_PARTICAO}{indice:03d}{SUFIXO_PARTICAO}")
+
+
+def listar_particoes(diretorio):
+    nomes = sorted(
+        nome for nome in os.listdir(diretorio)
+        if nome.startswith(PREFIXO_PARTICAO) and nome.endswith(SUFIXO_PARTICAO)
+    )
+    return [os.path.join(diretorio, nome) for nome in nomes]
+
+
+def carregar_cadastro(diretorio):
+    cadastro = Cadastro([], [], [])
+    caminho = os.path.join(diretorio, ARQUIVO_CADASTRO)
+    if not os.path.exists(caminho):
+        return cadastro
+
+    contas = set()
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                operacao, *campos = json.loads(linha)
+            except json.JSONDecodeError:
+                break  # Última linha gravada parcialmente antes de uma queda
+
+            if operacao == "cliente":
+                cadastro.clientes.append(tuple(campos))
+            elif operacao == "conta" and tuple(campos[1:]) not in contas:
+                contas.add(tuple(campos[1:]))
+                cadastro.contas.append(tuple(campos))
+            elif operacao == "chave":
+                cadastro.chaves.append(tuple(campos))
+    return cadastro
+
+
+def _blocos(caminho):
+    # Conteúdo da partição em blocos de registros completos
+    with open(caminho, "rb") as arquivo:
+        restantes = os.fstat(arquivo.fileno()).st_size // EVENTO.size
+        while restantes:
+            quantidade = min(EVENTOS_POR_BLOCO, restantes)
+            yield arquivo.read(quantidade * EVENTO.size)
+            restantes -= quantidade
+
+
+def _limites_dia(hoje):
+    inicio = datetime.datetime.combine(hoje, datetime.time.min)
+    return inicio.timestamp(), (inicio + datetime.timedelta(days=1)).timestamp()
+
+
+def projetar_particao(caminho, particao, particoes, quantidade_contas, inicio_dia, fim_dia, descartar_orfaos=False,
+                      historicos=False):
+    # Projeções das contas da partição (particao, particao + particoes, ...), na ordem das contas:
+    # (eventos, saldos em centavos, transações, saques e PIX enviados no dia, colunas do histórico
+    # de cada conta ou None, se `historicos` for falso)
+    tamanho = len(range(particao, quantidade_contas, particoes))
+    projetar = _projetar_numpy if np is not None else _projetar_python
+    eventos, orfaos, *projecoes = projetar(caminho, particoes, tamanho, inicio_dia, fim_dia, historicos)
+
+    if orfaos and descartar_orfaos:
+        _descartar_orfaos(caminho, quantidade_contas)
+    return (eventos, *projecoes)
+
+
+def _descartar_orfaos(caminho, quantidade_contas):
+    # Reescreve a partição sem os eventos de contas ausentes do cadastro (perdidas em uma queda):
+    # o número dessas contas é dado à próxima conta criada, que não deve herdar os eventos
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as saida:
+        for bloco in _blocos(caminho):
+            if np is not None:
+                registros = np.frombuffer(bloco, dtype=TIPO_EVENTO)
+                saida.write(registros[registros["conta"] < quantidade_contas].tobytes())
+            else:
+                saida.write(b"".join(EVENTO.pack(*registro) for registro in EVENTO.iter_unpack(bloco)
+                                     if registro[0] < quantidade_contas))
+        saida.flush()
+        os.fsync(saida.fileno())
+    os.replace(temporario, caminho)
+
+
+def _projetar_python(caminho, particoes, tamanho, inicio_dia, fim_dia, historicos):
+    saldos, transacoes, saques, pix = ([0] * tamanho for _ in range(4))
+    colunas = [(array('b'), array('q'), array('d')) for _ in range(tamanho)] if historicos else None
+    eventos = orfaos = 0
+    for bloco in _blocos(caminho):
+        for conta, codigo, centavos, instante in EVENTO.iter_unpack(bloco):
+            indice = conta // particoes
+            if indice >= tamanho:
+                orfaos += 1
+                continue
+            eventos += 1
+            saldos[indice] += Historico.SINAIS[codigo] * centavos
+            transacoes[indice] += 1
+            if inicio_dia <= instante < fim_dia:
+                if codigo == CODIGO_SAQUE:
+                    saques[indice] += 1
+                elif codigo == CODIGO_PIX:
+                    pix[indice] += 1
+            if colunas is not None:
+                tipos, valores, instantes = colunas[indice]
+                tipos.append(codigo)
+                valores.append(centavos)
+                instantes.append(instante)
+    return eventos, orfaos, saldos, transacoes, saques, pix, colunas
+
+
+def _projetar_numpy(caminho, particoes, tamanho, inicio_dia, fim_dia, historicos):
+    sinais = np.array(Historico.SINAIS, dtype=np.int64)
+    saldos, transacoes, saques, pix = (np.zeros(tamanho, dtype=np.int64) for _ in range(4))
+    colunas = [(bytearray(), bytearray(), bytearray()) for _ in range(tamanho)] if historicos else None
+    eventos = orfaos = 0
+    for bloco in _blocos(caminho):
+        registros = np.frombuffer(bloco, dtype=TIPO_EVENTO)
+        indices = registros["conta"] // particoes
+        validos = indices < tamanho
+        if not validos.all():
+            orfaos += len(registros) - int(validos.sum())
+            registros, indices = registros[validos], indices[validos]
+        codigos = registros["codigo"]
+        eventos += len(registros)
+
+        # Somas de um bloco cabem com folga na precisão exata do float64 (2 ** 53 centavos)
+        saldos += np.bincount(indices, weights=sinais[codigos] * registros["centavos"], minlength=tamanho).round().astype(np.int64)
+        transacoes += np.bincount(indices, minlength=tamanho)
+        no_dia = (registros["instante"] >= inicio_dia) & (registros["instante"] < fim_dia)
+        saques += np.bincount(indices[no_dia & (codigos == CODIGO_SAQUE)], minlength=tamanho)
+        pix += np.bincount(indices[no_dia & (codigos == CODIGO_PIX)], minlength=tamanho)
+        if colunas is not None:
+            _anexar_historicos(colunas, registros, indices)
+    return eventos, orfaos, saldos.tolist(), transacoes.tolist(), saques.tolist(), pix.tolist(), colunas
+
+
+def _anexar_historicos(colunas, registros, indices):
+    # Acrescenta os eventos do bloco às colunas de cada conta; a ordenação estável mantém, em
+    # cada conta, a ordem do log
+    ordem = np.argsort(indices, kind="stable")
+    indices = indices[ordem]
+    tipos = registros["codigo"][ordem].tobytes()
+    valores = registros["centavos"][ordem].tobytes()
+    instantes = registros["instante"][ordem].tobytes()
+    contas, inicios = np.unique(indices, return_index=True)
+    fins = [*inicios[1:].tolist(), len(indices)]
+    for conta, inicio, fim in zip(contas.tolist(), inicios.tolist(), fins):
+        tipos_conta, valores_conta, instantes_conta = colunas[conta]
+        tipos_conta += tipos[inicio:fim]
+        valores_conta += valores[inicio * 8:fim * 8]
+        instantes_conta += instantes[inicio * 8:fim * 8]
+
+
+def reconstruir(diretorio, processos=None, hoje=None, cadastro=None, descartar_orfaos=False, historicos=False):
+    cadastro = cadastro if cadastro is not None else carregar_cadastro(diretorio)
+    caminhos = listar_particoes(diretorio)
+    quantidade = len(cadastro.contas)
+    inicio_dia, fim_dia = _limites_dia(hoje or datetime.date.today())
+    argumentos = [
+        (caminho, particao, len(caminhos), quantidade, inicio_dia, fim_dia, descartar_orfaos, historicos)
+        for particao, caminho in enumerate(caminhos)
+    ]
+
+    processos = min(processos or os.cpu_count(), len(caminhos) or 1)
+    if processos == 1:
+        resultados = [projetar_particao(*argumento) for argumento in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = list(executor.map(projetar_particao, *zip(*argumentos)))
+
+    # Cada partição devolve as suas contas em ordem; intercaladas, voltam à ordem do cadastro
+    colunas = [[0] * quantidade for _ in range(4)] + [[None] * quantidade if historicos else None]
+    for particao, (_, *projecoes) in enumerate(resultados):
+        for coluna, projecao in zip(colunas, projecoes):
+            if coluna is not None:
+                coluna[particao::len(caminhos)] = projecao
+    saldos, transacoes, saques, pix, historicos = colunas
+
+    posicoes = dict.fromkeys((cpf for cpf, *_ in cadastro.clientes), 0)
+    for (cpf, _, _), saldo in zip(cadastro.contas, saldos):
+        posicoes[cpf] = posicoes.get(cpf, 0) + saldo
+
+    return Projecoes(sum(resultado[0] for resultado in resultados), cadastro.contas, saldos, transacoes, saques, pix,
+                     posicoes, historicos)
+
+
+class BancoRazao(Banco):
+    def __init__(self, diretorio, particoes=PARTICOES, processos=None, intervalo_sincronizacao=0.05, **opcoes):
+        super().__init__(**opcoes)
+        os.makedirs(diretorio, exist_ok=True)
+        self._diretorio = diretorio
+        self._processos = processos
+
+        cadastro = carregar_cadastro(diretorio)
+        # Eventos de contas que não chegaram ao cadastro são removidos antes que o número delas
+        # seja dado a uma nova conta
+        self._restaurar(cadastro, reconstruir(diretorio, processos, cadastro=cadastro, descartar_orfaos=True, historicos=True))
+        self._razao = LivroRazao(diretorio, particoes, cadastro.contas, intervalo_sincronizacao)
+        self.adicionar_ouvinte(self._razao)
+
+    @property
+    def razao(self):
+        return self._razao
+
+    def _restaurar(self, cadastro, projecoes):
+        hoje = datetime.date.today()
+        for cpf, nome, data_nascimento, endereco in cadastro.clientes:
+            if self.buscar_cliente(cpf) is None:
+                self.adicionar_cliente(cpf, nome, data_nascimento, endereco)
+
+        for indice, (cpf, agencia, numero) in enumerate(cadastro.contas):
+            conta = self.incluir_conta(self._nova_conta(self.buscar_cliente(cpf), numero, agencia))
+            conta.restaurar(projecoes.saldos[indice] / 100, conta.status)
+            conta.contadores.restaurar(hoje, {
+                "Saque": projecoes.saques_hoje[indice], "Transferencia_Origem": projecoes.pix_hoje[indice],
+            })
+            conta.historico.restaurar_colunas(*projecoes.historicos[indice])
+
+        for agencia, numero, tipo, chave in cadastro.chaves:
+            self._diretorio_pix.registrar(tipo, chave, self.filtrar_conta(numero, agencia))
+
+    def projecoes(self, processos=None):
+        # Reconstrói as projeções a partir do log sincronizado, sem alterar o estado em memória
+        self._razao.sincronizar()
+        return reconstruir(self._diretorio, processos or self._processos)
+
+    def sincronizar(self):
+        self._razao.sincronizar()
+
+    def fechar(self):
+        self.remover_ouvinte(self._razao)
+        self._razao.fechar()
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Reconstrói as projeções do livro-razão a partir do log de eventos.")
+    parser.add_argument("diretorio")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: um por CPU, até uma por partição")
+    argumentos = parser.parse_args(argumentos)
+
+    inicio = time.perf_counter()
+    projecoes = reconstruir(argumentos.diretorio, argumentos.processos)
+    segundos = time.perf_counter() - inicio
+
+    print(json.dumps({
+        "eventos": projecoes.eventos,
+        "contas": len(projecoes.contas),
+        "clientes": len(projecoes.posicoes),
+        "particoes": len(listar_particoes(argumentos.diretorio)),
+        "segundos": segundos,
+        "eventos_por_segundo": projecoes.eventos / segundos if segundos else 0.0,
+        "saldo_total": sum(projecoes.saldos) / 100,
+        "saques_hoje": sum(projecoes.saques_hoje),
+        "pix_hoje": sum(projecoes.pix_hoje),
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
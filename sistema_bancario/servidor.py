@@ -0,0 +1,246 @@
+## Servidor asyncio para as operações do Banco e gerador de carga.
+## Protocolo: JSON por linha sobre TCP. Cada requisição é um objeto com "operacao" e os
+## mesmos campos aceitos pelo processamento em lote (cliente, conta, chave, deposito, saque, pix),
+## além de "extrato" (agencia, numero e, opcionalmente, inicio e fim em ISO 8601, cursor e
+## limite; sem período nem cursor, devolve as últimas transações) e "metricas" (snapshot dos
+## histogramas de latência, disponível com --metricas). O campo "id", se presente, é
+## devolvido na resposta. As respostas saem na ordem das requisições, o que permite enviar
+## várias requisições sem esperar pelas respostas (pipelining).
+## Uso:
+##   python -m sistema_bancario.servidor servidor --porta 8765
+##   python -m sistema_bancario.servidor carga --porta 8765 --clientes 50 --requisicoes 2000
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import sys
+import time
+
+from .eventos import SinkArquivoBufferizado, SinkAssincrono, SinkConsole, SinkNulo
+from .lote import ProcessadorLote
+from .nucleo import Banco
+
+LIMITE_EXTRATO = 100
+TAMANHO_MAXIMO_REQUISICAO = 2 ** 20
+
+
+class ServidorBancario:
+    def __init__(self, banco=None):
+        self._processador = ProcessadorLote(banco)
+
+    @property
+    def banco(self):
+        return self._processador.banco
+
+    def _extrato(self, dados):
+        conta = self.banco.filtrar_conta(int(dados["numero"]), dados["agencia"])
+        if conta is None:
+            return {"sucesso": False, "erro": "conta não encontrada"}
+
+        limite = int(dados.get("limite", LIMITE_EXTRATO))
+        if limite < 1:
+            raise ValueError(f"limite de extrato inválido: {limite}")
+
+        if not any(campo in dados for campo in ("inicio", "fim", "cursor")):
+            transacoes = conta.historico.transacoes
+            return {"sucesso": True, "saldo": conta.saldo, "transacoes": transacoes[max(len(transacoes) - limite, 0):]}
+
+        inicio = datetime.datetime.fromisoformat(dados["inicio"]) if dados.get("inicio") else None
+        fim = datetime.datetime.fromisoformat(dados["fim"]) if dados.get("fim") else None
+        cursor = int(dados["cursor"]) if dados.get("cursor") is not None else None
+        transacoes, proximo_cursor = self.banco.pagina_extrato(conta.numero, conta.agencia, inicio, fim, cursor, limite)
+        return {"sucesso": True, "saldo": conta.saldo, "transacoes": transacoes, "proximo_cursor": proximo_cursor}
+
+    def _metricas(self, dados):
+        if self.banco.metricas is None:
+            return {"sucesso": False, "erro": "métricas desativadas"}
+        return {"sucesso": True, "metricas": self.banco.metricas.snapshot()}
+
+    def atender(self, dados):
+        try:
+            if dados.get("operacao") == "extrato":
+                resposta = self._extrato(dados)
+            elif dados.get("operacao") == "metricas":
+                resposta = self._metricas(dados)
+            else:
+                sucesso, erro = self._processador.aplicar(dados)
+                resposta = {"sucesso": sucesso, "erro": erro}
+        except (KeyError, TypeError, ValueError, OverflowError) as erro:
+            resposta = {"sucesso": False, "erro": f"requisição inválida: {erro}"}
+
+        if "id" in dados:
+            resposta["id"] = dados["id"]
+        return resposta
+
+    def responder(self, linha):
+        try:
+            dados = json.loads(linha)
+        except json.JSONDecodeError:
+            resposta = {"sucesso": False, "erro": "JSON inválido"}
+        else:
+            resposta = self.atender(dados) if isinstance(dados, dict) else {"sucesso": False, "erro": "requisição inválida"}
+        return json.dumps(resposta, ensure_ascii=False) + "\n"
+
+    async def iniciar(self, host="127.0.0.1", porta=8765):
+        laco = asyncio.get_running_loop()
+        return await laco.create_server(lambda: ConexaoBancaria(self), host, porta)
+
+
+class ConexaoBancaria(asyncio.Protocol):
+    def __init__(self, servidor):
+        self._servidor = servidor
+        self._transporte = None
+        self._pendente = b""  # Início de uma requisição ainda incompleta
+
+    def connection_made(self, transporte):
+        self._transporte = transporte
+
+    def data_received(self, dados):
+        linhas = (self._pendente + dados).split(b"\n")
+        self._pendente = linhas.pop()
+
+        if len(self._pendente) > TAMANHO_MAXIMO_REQUISICAO:
+            self._transporte.close()
+            return
+
+        # Todas as requisições completas do bloco recebido são respondidas em uma única escrita
+        if linhas:
+            self._transporte.write("".join(self._servidor.responder(linha) for linha in linhas if linha.strip()).encode())
+
+
+async def servir(host, porta, metricas=False, sink=None):
+    banco = Banco(sink=sink if sink is not None else SinkNulo())
+    if metricas:
+        banco.ativar_metricas()
+    servidor = await ServidorBancario(banco).iniciar(host, porta)
+    print(f"Servidor bancário em {host}:{porta}", file=sys.stderr)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def percentil(valores_ordenados, fracao):
+    if not valores_ordenados:
+        return 0.0
+    indice = min(int(fracao * len(valores_ordenados)), len(valores_ordenados) - 1)
+    return valores_ordenados[indice]
+
+
+async def _cliente_carga(host, porta, contas, requisicoes, profundidade, gerador, latencias):
+    leitor, escritor = await asyncio.open_connection(host, porta, limit=2 ** 20)
+    enviadas = 0
+
+    while enviadas < requisicoes:
+        janela = min(profundidade, requisicoes - enviadas)
+        linhas = []
+        for _ in range(janela):
+            numero = gerador.randint(1, contas)
+            operacao = gerador.choices(("deposito", "saque", "pix", "extrato"), (60, 25, 10, 5))[0]
+            linhas.append(json.dumps({
+                "operacao": operacao, "agencia": "0001", "numero": numero,
+                "valor": gerador.randint(1, 200), "chave": f"cliente{gerador.randint(1, contas)}@banco.com", "limite": 10,
+            }))
+
+        inicio = time.perf_counter()
+        escritor.write(("\n".join(linhas) + "\n").encode())
+        await escritor.drain()
+        for _ in range(janela):
+            await leitor.readline()
+            # Latência de cada requisição desde o envio da janela até a chegada da sua resposta
+            latencias.append(time.perf_counter() - inicio)
+        enviadas += janela
+
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def preparar_contas(host, porta, contas):
+    leitor, escritor = await asyncio.open_connection(host, porta, limit=2 ** 20)
+    linhas = []
+    for numero in range(1, contas + 1):
+        cpf = f"{numero:011d}"
+        linhas.append(json.dumps({"operacao": "cliente", "cpf": cpf, "nome": f"Cliente {numero}",
+                                  "data_nascimento": "01/01/1990", "endereco": "Rua Teste, 1"}))
+        linhas.append(json.dumps({"operacao": "conta", "cpf": cpf, "agencia": "0001", "numero": numero}))
+        linhas.append(json.dumps({"operacao": "chave", "agencia": "0001", "numero": numero,
+                                  "tipo": "email", "chave": f"cliente{numero}@banco.com"}))
+        linhas.append(json.dumps({"operacao": "deposito", "agencia": "0001", "numero": numero, "valor": 10_000}))
+
+    escritor.write(("\n".join(linhas) + "\n").encode())
+    await escritor.drain()
+    for _ in linhas:
+        await leitor.readline()
+
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def gerar_carga(host="127.0.0.1", porta=8765, clientes=50, requisicoes=2_000, profundidade=16,
+                      contas=1_000, semente=42):
+    await preparar_contas(host, porta, contas)
+
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        _cliente_carga(host, porta, contas, requisicoes, profundidade, random.Random(semente + indice), latencias)
+        for indice in range(clientes)
+    ))
+    segundos = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "clientes": clientes,
+        "requisicoes": len(latencias),
+        "profundidade_pipeline": profundidade,
+        "requisicoes_por_segundo": len(latencias) / segundos,
+        "latencia_p50_ms": percentil(latencias, 0.50) * 1000,
+        "latencia_p99_ms": percentil(latencias, 0.99) * 1000,
+    }
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Servidor asyncio do sistema bancário e gerador de carga.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    servidor = subcomandos.add_parser("servidor", help="inicia o servidor")
+    servidor.add_argument("--host", default="127.0.0.1")
+    servidor.add_argument("--porta", type=int, default=8765)
+    servidor.add_argument("--verboso", action="store_true", help="mantém as mensagens das contas no terminal")
+    servidor.add_argument("--eventos", help="grava os eventos das contas em JSONL, fora do laço de atendimento")
+    servidor.add_argument("--metricas", action="store_true", help="mede a latência das operações do banco")
+
+    carga = subcomandos.add_parser("carga", help="mede requisições por segundo e latência p99")
+    carga.add_argument("--host", default="127.0.0.1")
+    carga.add_argument("--porta", type=int, default=8765)
+    carga.add_argument("--clientes", type=int, default=50)
+    carga.add_argument("--requisicoes", type=int, default=2_000, help="requisições por cliente")
+    carga.add_argument("--profundidade", type=int, default=16, help="requisições em voo por conexão")
+    carga.add_argument("--contas", type=int, default=1_000)
+
+    argumentos = parser.parse_args(argumentos)
+
+    if argumentos.comando == "servidor":
+        if argumentos.eventos:
+            sink = SinkAssincrono(SinkArquivoBufferizado(argumentos.eventos))
+        else:
+            sink = SinkConsole() if argumentos.verboso else SinkNulo()
+
+        try:
+            asyncio.run(servir(argumentos.host, argumentos.porta, argumentos.metricas, sink))
+        finally:
+            if argumentos.eventos:
+                sink.fechar()
+    else:
+        resultado = asyncio.run(gerar_carga(
+            argumentos.host, argumentos.porta, argumentos.clientes, argumentos.requisicoes,
+            argumentos.profundidade, argumentos.contas,
+        ))
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
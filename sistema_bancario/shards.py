@@ -0,0 +1,270 @@
+## Modo particionado (sharding) do Banco: um processo por agência, cada um com o seu próprio Banco
+## e o seu próprio GIL, e um roteador no processo principal que envia cada operação ao shard dono
+## da conta. Com menos shards que agências, as agências são distribuídas entre eles em rodízio.
+## Clientes são replicados em todos os shards, já que qualquer agência pode abrir conta para eles.
+## O roteador mantém o diretório global de chaves PIX. Um PIX entre contas do mesmo shard é
+## executado pelo próprio shard; entre shards diferentes, segue um protocolo em duas fases:
+##   1. preparar: o shard de origem debita o valor (com as mesmas regras de limite do PIX local)
+##      e o shard de destino confirma que a conta existe; nada é gravado no histórico ainda
+##   2. confirmar, se os dois prepararam, gravando as transações nos históricos e creditando o
+##      destino; senão abortar, estornando o débito na origem
+## As operações enviadas em lote (executar) seguem para cada shard em uma única mensagem e os
+## shards trabalham em paralelo; um PIX entre shards é uma barreira: as operações anteriores
+## são concluídas antes dele, de modo que o resultado é o mesmo de uma execução sequencial.
+## Os shards não têm journal nem ouvintes: o modo particionado é voltado à vazão.
+## Uso:
+##   with BancoParticionado() as banco:
+##       banco.adicionar_cliente("52998224725", "Ana", "01/01/1990", "Rua A, 1")
+##       banco.criar_conta("52998224725", 1, "0001")
+##       banco.registrar_deposito(1, "0001", 100.0)
+
+import itertools
+import multiprocessing
+
+from .eventos import SinkNulo
+from .nucleo import Banco, DiretorioPix, Transferencia_Destino, Transferencia_Origem
+from .validadores import VALIDADORES_CHAVE_PIX
+
+AGENCIAS = ("0001", "0002", "0003")
+
+# Métodos do Banco aceitos pelos shards e posição da agência nos argumentos de cada um
+OPERACOES_BANCO = {
+    "adicionar_cliente": None,
+    "criar_conta": 2,
+    "registrar_chave_pix": 1,
+    "registrar_deposito": 1,
+    "registrar_saque": 1,
+    "realizar_pix": 1,
+}
+OPERACOES_SHARD = {"preparar_debito", "preparar_credito", "confirmar", "abortar", "consultar_saldo", "saldo_total"}
+
+
+class Shard:
+    def __init__(self):
+        self._banco = Banco(sink=SinkNulo())
+        self._pendentes = {}  # Transações PIX preparadas: id -> (tipo, conta, valor)
+
+    def aplicar(self, nome, argumentos):
+        try:
+            if nome in OPERACOES_BANCO:
+                return bool(getattr(self._banco, nome)(*argumentos))
+            if nome in OPERACOES_SHARD:
+                return getattr(self, nome)(*argumentos)
+        except (TypeError, ValueError):
+            pass
+        return False
+
+    def preparar_debito(self, transacao, numero, agencia, valor):
+        conta = self._banco.filtrar_conta(numero, agencia)
+        if conta is None:
+            return False
+
+        with conta.trava:
+            if not conta.transferir_pix(valor):
+                return False
+
+        self._pendentes[transacao] = ("debito", conta, valor)
+        return True
+
+    def preparar_credito(self, transacao, numero, agencia, valor):
+        conta = self._banco.filtrar_conta(numero, agencia)
+        if conta is None or valor <= 0:
+            return False
+
+        self._pendentes[transacao] = ("credito", conta, valor)
+        return True
+
+    def confirmar(self, transacao):
+        tipo, conta, valor = self._pendentes.pop(transacao)
+
+        with conta.trava:
+            if tipo == "debito":
+                conta.historico.adicionar_transacao(Transferencia_Origem(valor))
+            else:
+                conta.cliente.realizar_transacao(conta, Transferencia_Destino(valor))
+        return True
+
+    def abortar(self, transacao):
+        pendente = self._pendentes.pop(transacao, None)
+
+        if pendente is not None and pendente[0] == "debito":
+            _, conta, valor = pendente
+            with conta.trava:
+                conta.estornar_pix(valor)
+        return True
+
+    def consultar_saldo(self, numero, agencia):
+        conta = self._banco.filtrar_conta(numero, agencia)
+        return None if conta is None else conta.saldo
+
+    def saldo_total(self):
+        return sum(conta.saldo for conta in self._banco.contas)
+
+
+def executar_shard(conexao):
+    # Laço do processo de um shard: recebe listas de (nome, argumentos) e devolve os resultados
+    shard = Shard()
+    while True:
+        mensagem = conexao.recv()
+        if mensagem is None:
+            break
+        conexao.send([shard.aplicar(nome, argumentos) for nome, argumentos in mensagem])
+    conexao.close()
+
+
+class BancoParticionado:
+    def __init__(self, agencias=AGENCIAS, shards=None):
+        shards = shards or len(agencias)
+        self._shard_da_agencia = {agencia: indice % shards for indice, agencia in enumerate(agencias)}
+        self._chaves = {}  # (tipo, chave normalizada) -> (agência, número) da conta dona da chave
+        self._transacoes = itertools.count(1)
+        self._conexoes = []
+        self._processos = []
+
+        for indice in range(shards):
+            local, remota = multiprocessing.Pipe()
+            processo = multiprocessing.Process(target=executar_shard, args=(remota,), name=f"shard-{indice}", daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    @property
+    def shards(self):
+        return len(self._conexoes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        for conexao in self._conexoes:
+            conexao.send(None)
+        for processo in self._processos:
+            processo.join()
+        for conexao in self._conexoes:
+            conexao.close()
+        self._conexoes = []
+        self._processos = []
+
+    def _enviar(self, mensagens):
+        # mensagens: {shard: [(nome, argumentos)]}; envia a todos antes de esperar as respostas
+        for shard, operacoes in mensagens.items():
+            self._conexoes[shard].send(operacoes)
+        return {shard: self._conexoes[shard].recv() for shard in mensagens}
+
+    @staticmethod
+    def _chave(chave, tipo=None):
+        if tipo is None:
+            tipo = DiretorioPix.tipo_da_chave(chave)
+        return tipo, DiretorioPix.normalizar(tipo, chave)
+
+    def _descarregar(self, pendentes, resultados, chaves_provisorias):
+        mensagens = {shard: [(nome, argumentos) for _, nome, argumentos in lote]
+                     for shard, lote in enumerate(pendentes) if lote}
+        respostas = self._enviar(mensagens)
+
+        for shard, resposta in respostas.items():
+            for (posicao, _, _), resultado in zip(pendentes[shard], resposta):
+                # Clientes são enviados a todos os shards e só têm sucesso se todos aceitarem
+                resultados[posicao] = resultado if resultados[posicao] is None else resultados[posicao] and resultado
+            pendentes[shard].clear()
+
+        # Chaves reservadas no diretório global que o shard recusou (conta inexistente, chave inválida)
+        for posicao, chave in chaves_provisorias:
+            if not resultados[posicao]:
+                del self._chaves[chave]
+        chaves_provisorias.clear()
+
+    def _pix_entre_shards(self, origem, destino, numero, agencia, valor, conta_destino):
+        transacao = next(self._transacoes)
+        preparados = self._enviar({
+            origem: [("preparar_debito", (transacao, numero, agencia, valor))],
+            destino: [("preparar_credito", (transacao, conta_destino[1], conta_destino[0], valor))],
+        })
+        sucesso = preparados[origem][0] and preparados[destino][0]
+
+        decisao = "confirmar" if sucesso else "abortar"
+        self._enviar({origem: [(decisao, (transacao,))], destino: [(decisao, (transacao,))]})
+        return sucesso
+
+    def executar(self, operacoes):
+        # operacoes: iterável de (nome_do_metodo_do_banco, argumentos); devolve os resultados na mesma ordem
+        resultados = []
+        pendentes = [[] for _ in self._conexoes]  # (posição, nome, argumentos) por shard
+        chaves_provisorias = []  # (posição, chave) reservadas no diretório global até a resposta do shard
+
+        for nome, argumentos in operacoes:
+            posicao = len(resultados)
+            resultados.append(None)
+
+            if nome not in OPERACOES_BANCO:
+                resultados[posicao] = False
+                continue
+
+            if nome == "adicionar_cliente":
+                for lote in pendentes:
+                    lote.append((posicao, nome, argumentos))
+                continue
+
+            shard = self._shard_da_agencia.get(argumentos[OPERACOES_BANCO[nome]])
+            if shard is None:
+                resultados[posicao] = False
+                continue
+
+            if nome == "registrar_chave_pix":
+                numero, agencia, tipo, chave = argumentos
+                if tipo not in VALIDADORES_CHAVE_PIX or self._chave(chave, tipo) in self._chaves:
+                    resultados[posicao] = False
+                    continue
+                self._chaves[self._chave(chave, tipo)] = (agencia, numero)
+                chaves_provisorias.append((posicao, self._chave(chave, tipo)))
+
+            elif nome == "realizar_pix":
+                numero, agencia, valor, chave, *tipo_chave = argumentos
+                conta_destino = self._chaves.get(self._chave(chave, *tipo_chave))
+                if conta_destino is None:
+                    resultados[posicao] = False
+                    continue
+
+                destino = self._shard_da_agencia[conta_destino[0]]
+                if destino != shard:
+                    # Barreira: conclui as operações anteriores e confirma a chave antes das duas fases
+                    self._descarregar(pendentes, resultados, chaves_provisorias)
+                    conta_destino = self._chaves.get(self._chave(chave, *tipo_chave))
+                    resultados[posicao] = conta_destino is not None and self._pix_entre_shards(
+                        shard, destino, numero, agencia, valor, conta_destino)
+                    continue
+
+            pendentes[shard].append((posicao, nome, argumentos))
+
+        self._descarregar(pendentes, resultados, chaves_provisorias)
+        return resultados
+
+    def adicionar_cliente(self, cpf, nome, data_nascimento, endereco):
+        return self.executar([("adicionar_cliente", (cpf, nome, data_nascimento, endereco))])[0]
+
+    def criar_conta(self, cpf, numero, agencia):
+        return self.executar([("criar_conta", (cpf, numero, agencia))])[0]
+
+    def registrar_chave_pix(self, numero, agencia, tipo, chave):
+        return self.executar([("registrar_chave_pix", (numero, agencia, tipo, chave))])[0]
+
+    def registrar_deposito(self, numero, agencia, valor):
+        return self.executar([("registrar_deposito", (numero, agencia, valor))])[0]
+
+    def registrar_saque(self, numero, agencia, valor):
+        return self.executar([("registrar_saque", (numero, agencia, valor))])[0]
+
+    def realizar_pix(self, numero, agencia, valor, chave, tipo_chave=None):
+        return self.executar([("realizar_pix", (numero, agencia, valor, chave, tipo_chave))])[0]
+
+    def consultar_saldo(self, numero, agencia):
+        shard = self._shard_da_agencia.get(agencia)
+        return None if shard is None else self._enviar({shard: [("consultar_saldo", (numero, agencia))]})[shard][0]
+
+    def saldo_total(self):
+        respostas = self._enviar({shard: [("saldo_total", ())] for shard in range(self.shards)})
+        return sum(resposta[0] for resposta in respostas.values())
@@ -0,0 +1,326 @@
+## Persistência do Banco em SQLite (modo WAL), com gravações em lote.
+## PersistenciaSQLite é um ouvinte do Banco: cada cliente, conta, chave PIX e transação é
+## acumulado em memória e gravado com executemany em uma única transação SQL a cada
+## `tamanho_lote` registros ou a cada `intervalo_sincronizacao` segundos. O saldo, o status e os
+## contadores diários de cada conta alterada são capturados no momento da transação (sob a trava
+## da conta) e gravados uma vez por lote, com o valor mais recente.
+## BancoSQLite carrega clientes, contas e chaves PIX sob demanda: buscar_cliente e filtrar_conta
+## consultam primeiro os objetos já carregados e, na falta deles, o banco de dados pela chave
+## primária. Os objetos carregados permanecem em memória (cada conta tem a sua trava, e duas
+## cópias da mesma conta não podem coexistir), de modo que o cache não descarta entradas.
+## criar_conta recusa (agência, número) já gravados, mesmo que a conta não esteja carregada, e as
+## transações são inseridas sem OR IGNORE: uma colisão de índice falha o lote em vez de perder a linha.
+## Uso:
+##   banco = BancoSQLite("banco.db")
+##   banco.registrar_deposito(1, "0001", 100.0)
+##   banco.fechar()
+
+import datetime
+import sqlite3
+import threading
+from array import array
+
+from .nucleo import Banco, ContaCorrente, DiretorioPix, PessoaFisica
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    cpf TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    data_nascimento TEXT,
+    endereco TEXT
+);
+CREATE TABLE IF NOT EXISTS contas (
+    agencia TEXT NOT NULL,
+    numero INTEGER NOT NULL,
+    cpf TEXT NOT NULL REFERENCES clientes (cpf),
+    saldo_centavos INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'ativo',
+    dia TEXT,
+    saques INTEGER NOT NULL DEFAULT 0,
+    pix INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (agencia, numero)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS transacoes (
+    agencia TEXT NOT NULL,
+    numero INTEGER NOT NULL,
+    indice INTEGER NOT NULL,
+    codigo INTEGER NOT NULL,
+    centavos INTEGER NOT NULL,
+    instante REAL NOT NULL,
+    PRIMARY KEY (agencia, numero, indice)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS chaves_pix (
+    tipo TEXT NOT NULL,
+    chave TEXT NOT NULL,
+    agencia TEXT NOT NULL,
+    numero INTEGER NOT NULL,
+    PRIMARY KEY (tipo, chave)
+) WITHOUT ROWID;
+"""
+
+INSERIR_CLIENTE = "INSERT OR IGNORE INTO clientes (cpf, nome, data_nascimento, endereco) VALUES (?, ?, ?, ?)"
+INSERIR_CONTA = "INSERT OR IGNORE INTO contas (agencia, numero, cpf) VALUES (?, ?, ?)"
+INSERIR_CHAVE = "INSERT OR IGNORE INTO chaves_pix (tipo, chave, agencia, numero) VALUES (?, ?, ?, ?)"
+INSERIR_TRANSACAO = (
+    "INSERT INTO transacoes (agencia, numero, indice, codigo, centavos, instante) VALUES (?, ?, ?, ?, ?, ?)"
+)
+ATUALIZAR_CONTA = (
+    "UPDATE contas SET saldo_centavos = ?, status = ?, dia = ?, saques = ?, pix = ? WHERE agencia = ? AND numero = ?"
+)
+
+
+class PersistenciaSQLite:
+    def __init__(self, caminho, tamanho_lote=1000, intervalo_sincronizacao=0.05):
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False, isolation_level=None)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(ESQUEMA)
+
+        self._tamanho_lote = tamanho_lote
+        self._intervalo_sincronizacao = intervalo_sincronizacao
+        self._trava = threading.Lock()  # Protege os registros pendentes
+        self._trava_conexao = threading.Lock()  # Serializa o uso da conexão (gravações e consultas)
+        self._novo_lote()
+
+        self._parar = threading.Event()
+        self._sincronizador = threading.Thread(target=self._sincronizar_periodicamente, daemon=True)
+        self._sincronizador.start()
+
+    def _novo_lote(self):
+        self._clientes = []
+        self._contas = []
+        self._chaves = []
+        self._transacoes = []
+        self._estados = {}  # (agência, número) -> estado mais recente da conta no lote
+        self._pendentes = 0
+
+    def cliente_adicionado(self, cliente):
+        self._anexar(self._clientes, (cliente.cpf, cliente.nome, cliente.data_nascimento, cliente.endereco))
+
+    def conta_criada(self, conta):
+        self._anexar(self._contas, (conta.agencia, conta.numero, conta.cliente.cpf))
+
+    def chave_pix_registrada(self, conta, tipo, chave):
+        self._anexar(self._chaves, (tipo, DiretorioPix.normalizar(tipo, chave), conta.agencia, conta.numero))
+
+    def transacao_registrada(self, conta, transacao, indice):
+        # Chamado com a trava da conta adquirida: o estado capturado corresponde a esta transação
+        codigo, centavos, instante = conta.historico.registro(indice)
+        dia, contagem = conta.contadores.estado()
+
+        with self._trava:
+            self._transacoes.append((conta.agencia, conta.numero, indice, codigo, centavos, instante))
+            self._estados[(conta.agencia, conta.numero)] = (
+                round(conta.saldo * 100), conta.status, dia.isoformat() if dia else None,
+                contagem.get("Saque", 0), contagem.get("Transferencia_Origem", 0),
+            )
+            self._pendentes += 1
+            cheio = self._pendentes >= self._tamanho_lote
+
+        if cheio:
+            self.sincronizar()
+
+    def _anexar(self, lista, linha):
+        with self._trava:
+            lista.append(linha)
+            self._pendentes += 1
+            cheio = self._pendentes >= self._tamanho_lote
+
+        if cheio:
+            self.sincronizar()
+
+    def _retirar_lote(self):
+        # Deve ser chamado com a trava dos pendentes adquirida
+        lote = (self._clientes, self._contas, self._chaves, self._transacoes, self._estados)
+        self._novo_lote()
+        return lote
+
+    def _gravar(self, lote):
+        # Deve ser chamado com a trava da conexão adquirida
+        clientes, contas, chaves, transacoes, estados = lote
+        if not (clientes or contas or chaves or transacoes):
+            return
+
+        cursor = self._conexao.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(INSERIR_CLIENTE, clientes)
+            cursor.executemany(INSERIR_CONTA, contas)
+            cursor.executemany(INSERIR_CHAVE, chaves)
+            cursor.executemany(INSERIR_TRANSACAO, transacoes)
+            cursor.executemany(ATUALIZAR_CONTA, (estado + chave for chave, estado in estados.items()))
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+    def _sincronizar_periodicamente(self):
+        while not self._parar.wait(self._intervalo_sincronizacao):
+            self.sincronizar()
+
+    def sincronizar(self):
+        # O lote é retirado e gravado sob a trava da conexão, que ordena os lotes entre si; a
+        # trava dos pendentes é sempre adquirida depois dela
+        with self._trava_conexao:
+            with self._trava:
+                lote = self._retirar_lote()
+            self._gravar(lote)
+
+    def consultar(self, sql, parametros=()):
+        with self._trava_conexao:
+            return self._conexao.execute(sql, parametros).fetchall()
+
+    def fechar(self):
+        self._parar.set()
+        self._sincronizador.join()
+        self.sincronizar()
+        with self._trava_conexao:
+            self._conexao.close()
+
+
+class DiretorioPixSQLite(DiretorioPix):
+    # Chaves cadastradas em execuções anteriores são buscadas no banco de dados e as contas
+    # correspondentes, carregadas pelo Banco
+    def __init__(self, banco, persistencia):
+        super().__init__()
+        self._banco = banco
+        self._persistencia = persistencia
+
+    def _consultar(self, tipo, chave):
+        linhas = self._persistencia.consultar(
+            "SELECT agencia, numero FROM chaves_pix WHERE tipo = ? AND chave = ?", (tipo, self.normalizar(tipo, chave))
+        )
+        return linhas[0] if linhas else None
+
+    def registrar(self, tipo, chave, conta):
+        if self._consultar(tipo, chave) is not None:
+            return False
+        return super().registrar(tipo, chave, conta)
+
+    def resolver(self, chave, tipo=None):
+        if tipo is None:
+            tipo = self.tipo_da_chave(chave)
+
+        conta = super().resolver(chave, tipo)
+        if conta is None:
+            linha = self._consultar(tipo, chave)
+            if linha is not None:
+                conta = self._banco.filtrar_conta(linha[1], linha[0])
+                self._chaves.setdefault((tipo, self.normalizar(tipo, chave)), conta)
+        return conta
+
+
+class BancoSQLite(Banco):
+    def __init__(self, caminho, tamanho_lote=1000, intervalo_sincronizacao=0.05, **opcoes):
+        super().__init__(**opcoes)
+        self._persistencia = PersistenciaSQLite(caminho, tamanho_lote, intervalo_sincronizacao)
+        self._diretorio_pix = DiretorioPixSQLite(self, self._persistencia)
+        self.adicionar_ouvinte(self._persistencia)
+
+    @property
+    def persistencia(self):
+        return self._persistencia
+
+    def buscar_cliente(self, cpf):
+        cliente = self._indice_clientes.get(cpf)
+        if cliente is not None:
+            return cliente
+
+        with self._trava_cadastro:
+            return self._carregar_cliente(cpf)
+
+    def _carregar_cliente(self, cpf):
+        # Deve ser chamado com a trava de cadastro adquirida
+        cliente = self._indice_clientes.get(cpf)
+        if cliente is None:
+            linhas = self._persistencia.consultar(
+                "SELECT nome, data_nascimento, endereco FROM clientes WHERE cpf = ?", (cpf,)
+            )
+            if linhas:
+                cliente = PessoaFisica(cpf, *linhas[0])
+                self._clientes.append(cliente)
+                self._indice_clientes[cpf] = cliente
+        return cliente
+
+    def filtrar_conta(self, numero, agencia):
+        conta = self._indice_contas.get((agencia, numero))
+        if conta is not None:
+            return conta
+
+        with self._trava_cadastro:
+            conta = self._indice_contas.get((agencia, numero))
+            if conta is None:
+                conta = self._carregar_conta(numero, agencia)
+        return conta
+
+    def _conta_cadastrada(self, numero, agencia):
+        # Deve ser chamado com a trava de cadastro adquirida: contas gravadas e ainda não carregadas
+        # também contam, para que uma conta nova não sobreponha o saldo e o histórico gravados
+        return super()._conta_cadastrada(numero, agencia) or bool(self._persistencia.consultar(
+            "SELECT 1 FROM contas WHERE agencia = ? AND numero = ?", (agencia, numero)
+        ))
+
+    def _carregar_conta(self, numero, agencia):
+        # Deve ser chamado com a trava de cadastro adquirida
+        linhas = self._persistencia.consultar(
+            "SELECT cpf, saldo_centavos, status, dia, saques, pix FROM contas WHERE agencia = ? AND numero = ?",
+            (agencia, numero),
+        )
+        if not linhas:
+            return None
+
+        cpf, centavos, status, dia, saques, pix = linhas[0]
+        conta = ContaCorrente(self._carregar_cliente(cpf), numero, agencia)
+        conta.restaurar(centavos / 100, status)
+        if dia is not None:
+            conta.contadores.restaurar(datetime.date.fromisoformat(dia), {"Saque": saques, "Transferencia_Origem": pix})
+
+        transacoes = self._persistencia.consultar(
+            "SELECT codigo, centavos, instante FROM transacoes WHERE agencia = ? AND numero = ? ORDER BY indice",
+            (agencia, numero),
+        )
+        conta.historico.restaurar_colunas(
+            array('b', (linha[0] for linha in transacoes)),
+            array('q', (linha[1] for linha in transacoes)),
+            array('d', (linha[2] for linha in transacoes)),
+        )
+        return self._incluir_conta(conta)
+
+    def ultimos_numeros(self):
+        # Inclui as contas gravadas que ainda não foram carregadas
+        ultimos = super().ultimos_numeros()
+        for agencia, numero in self._persistencia.consultar("SELECT agencia, MAX(numero) FROM contas GROUP BY agencia"):
+            ultimos[agencia] = max(ultimos.get(agencia, 0), numero)
+        return ultimos
+
+    def listar_clientes(self):
+        self._persistencia.sincronizar()
+        clientes = self._persistencia.consultar("SELECT cpf, nome, data_nascimento, endereco FROM clientes ORDER BY cpf")
+        if not clientes:
+            print("Nenhum cliente cadastrado.")
+            return
+
+        print("Clientes cadastrados:")
+        for cpf, nome, data_nascimento, endereco in clientes:
+            print(f"CPF: {cpf}, Nome: {nome}, Data de Nascimento: {data_nascimento}, Endereço: {endereco}")
+
+    def listar_contas(self):
+        self._persistencia.sincronizar()
+        contas = self._persistencia.consultar(
+            "SELECT contas.agencia, contas.numero, clientes.nome, contas.saldo_centavos, contas.status "
+            "FROM contas JOIN clientes ON clientes.cpf = contas.cpf ORDER BY contas.agencia, contas.numero"
+        )
+        if not contas:
+            print("Nenhuma conta cadastrada.")
+            return
+
+        print("Contas cadastradas:")
+        for agencia, numero, nome, centavos, status in contas:
+            print(f"Agência: {agencia}, Número da Conta: {numero}, Cliente: {nome}, Saldo: R$ {centavos / 100:.2f}, Status: {status}")
+
+    def sincronizar(self):
+        self._persistencia.sincronizar()
+
+    def fechar(self):
+        self.remover_ouvinte(self._persistencia)
+        self._persistencia.fechar()
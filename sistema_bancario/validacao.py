@@ -0,0 +1,90 @@
+## Validação vetorizada de CPF e CNPJ em lote com NumPy.
+## Os documentos podem conter pontuação ("123.456.789-09"); apenas os dígitos ASCII são
+## considerados. O resultado é uma máscara booleana com uma posição por documento e segue
+## exatamente as mesmas regras de validar_cpf e validar_cnpj de sistema_bancario.validadores.
+## Os documentos são processados em blocos para limitar o uso de memória em lotes grandes.
+## Requer numpy (pip install numpy).
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TAMANHO_BLOCO = 1_000_000
+
+
+def _exigir_numpy():
+    if np is None:
+        raise ImportError("A validação vetorizada requer o pacote numpy (pip install numpy).")
+
+
+def _digitos(documentos, quantidade):
+    # Converte um bloco de documentos em uma matriz (n, quantidade) de dígitos e uma máscara
+    # indicando quais documentos têm exatamente `quantidade` dígitos
+    documentos = np.asarray(documentos)
+    if documentos.dtype.kind == "S":
+        codigos = documentos.view(np.uint8).reshape(len(documentos), documentos.dtype.itemsize)
+    elif documentos.dtype.kind == "U":
+        codigos = documentos.view(np.uint32).reshape(len(documentos), documentos.dtype.itemsize // 4)
+    else:
+        raise TypeError("os documentos devem ser strings")
+
+    if codigos.shape[1] < quantidade:
+        codigos = np.pad(codigos, ((0, 0), (0, quantidade - codigos.shape[1])))
+
+    eh_digito = (codigos >= 48) & (codigos <= 57)
+    tamanho_valido = eh_digito.sum(axis=1) == quantidade
+
+    if codigos.shape[1] == quantidade and tamanho_valido.all():
+        digitos = codigos
+    else:
+        # Move os dígitos de cada linha para o início, preservando a ordem
+        ordem = np.argsort(~eh_digito, axis=1, kind="stable")[:, :quantidade]
+        digitos = np.take_along_axis(codigos, ordem, axis=1)
+
+    digitos = digitos.astype(np.int32) - 48
+    return np.where(tamanho_valido[:, None], digitos, 0), tamanho_valido
+
+
+def _em_blocos(validador, documentos, tamanho_bloco):
+    _exigir_numpy()
+    total = len(documentos)
+    mascara = np.empty(total, dtype=bool)
+    for inicio in range(0, total, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, total)
+        mascara[inicio:fim] = validador(documentos[inicio:fim])
+    return mascara
+
+
+def _validar_bloco_cpf(documentos):
+    cpf, tamanho_valido = _digitos(documentos, 11)
+    todos_iguais = (cpf == cpf[:, :1]).all(axis=1)
+
+    # Mesma regra do validador escalar: o dígito verificador é o resto de (soma * 10) % 11
+    dv1 = (cpf[:, :9] @ np.arange(10, 1, -1, dtype=np.int32) * 10) % 11
+    dv2 = (cpf[:, :10] @ np.arange(11, 1, -1, dtype=np.int32) * 10) % 11
+
+    return tamanho_valido & ~todos_iguais & (dv1 == cpf[:, 9]) & (dv2 == cpf[:, 10])
+
+
+def _validar_bloco_cnpj(documentos):
+    cnpj, tamanho_valido = _digitos(documentos, 14)
+    todos_iguais = (cnpj == cnpj[:, :1]).all(axis=1)
+
+    pesos1 = np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], dtype=np.int32)
+    resto = (cnpj[:, :12] @ pesos1) % 11
+    dv1 = np.where(resto < 2, 0, 11 - resto)
+
+    pesos2 = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3], dtype=np.int32)
+    resto = (cnpj[:, :12] @ pesos2 + dv1 * 2) % 11
+    dv2 = np.where(resto < 2, 0, 11 - resto)
+
+    return tamanho_valido & ~todos_iguais & (dv1 == cnpj[:, 12]) & (dv2 == cnpj[:, 13])
+
+
+def validar_cpfs(documentos, tamanho_bloco=TAMANHO_BLOCO):
+    return _em_blocos(_validar_bloco_cpf, documentos, tamanho_bloco)
+
+
+def validar_cnpjs(documentos, tamanho_bloco=TAMANHO_BLOCO):
+    return _em_blocos(_validar_bloco_cnpj, documentos, tamanho_bloco)
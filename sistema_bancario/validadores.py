@@ -0,0 +1,93 @@
+## Validação de documentos e chaves PIX, compartilhada pelas três versões do sistema bancário.
+
+import re
+
+def validar_cpf(cpf):
+    cpf = [int(char) for char in cpf if char.isdigit()]
+
+    if len(cpf) != 11:
+        return False
+
+    # Evitar CPFs com todos os dígitos iguais (ex: 11111111111)
+    if len(set(cpf)) == 1:
+        return False
+
+    # Primeiro dígito verificador
+    soma = sum((10 - i) * cpf[i] for i in range(9))
+    resto = (soma * 10) % 11
+
+    dv1 = 0 if (resto == 10 | resto == 11) else resto
+
+    if dv1 != cpf[9]:
+        return False
+
+    # Segundo dígito verificador
+    soma = sum((11 - i) * cpf[i] for i in range(10))
+    resto = (soma * 10) % 11
+
+    dv2 = 0 if (resto == 10 | resto == 11) else resto
+
+    if dv2 != cpf[10]:
+        return False
+
+    return True
+
+def validar_cnpj(cnpj):
+    cnpj = [int(char) for char in cnpj if char.isdigit()]
+
+    if len(cnpj) != 14:
+        return False
+
+    # Evitar CNPJs com todos os dígitos iguais (ex: 11111111111111)
+    if len(set(cnpj)) == 1:
+        return False
+
+    # Cálculo do primeiro dígito verificador
+    soma = sum((5 - i) * cnpj[i] for i in range(4)) + sum((13 - i) * cnpj[i] for i in range(4, 12))
+    resto = soma % 11
+    dv1 = 0 if resto < 2 else 11 - resto
+    if dv1 != cnpj[12]:
+        return False
+
+    # Cálculo do segundo dígito verificador
+    soma = sum((6 - i) * cnpj[i] for i in range(5)) + sum((14 - i) * cnpj[i] for i in range(5, 12)) + dv1 * 2
+    resto = soma % 11
+    dv2 = 0 if resto < 2 else 11 - resto
+
+    if dv2 != cnpj[13]:
+        return False
+    return True 
+
+def validar_telefone(telefone):
+    padrao = r'^\d{10,11}$'  # Aceita números com 10 ou 11 dígitos
+    return re.match(padrao, telefone) is not None
+
+def validar_email(email):
+    padrao = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+
+    return re.match(padrao, email) is not None
+
+def validar_chave(tipo_chave, chave):
+    if tipo_chave == '1':
+        return validar_cpf(chave)
+
+    elif tipo_chave == '2':
+        return validar_cnpj(chave)
+
+    elif tipo_chave == '3':
+        return validar_email(chave)
+
+    elif tipo_chave == '4':
+        return validar_telefone(chave)
+
+    else:
+        return False
+
+TIPOS_CHAVE_PIX = {'1': 'cpf', '2': 'cnpj', '3': 'email', '4': 'telefone'}  # Códigos usados no menu
+
+VALIDADORES_CHAVE_PIX = {
+    'cpf': validar_cpf,
+    'cnpj': validar_cnpj,
+    'email': validar_email,
+    'telefone': validar_telefone,
+}
@@ -0,0 +1,153 @@
+## Regras de velocidade: limites de quantidade e de valor das operações em uma janela deslizante,
+## por conta ou por chave PIX de destino, verificados pelo Banco antes de cada transação.
+## Ex.: no máximo 10 PIX ou R$ 2.000,00 por conta nos últimos 10 minutos.
+## Cada janela é dividida em `baldes` intervalos de mesma largura, guardados em um buffer
+## circular com os totais acumulados: verificar e registrar custam O(1) (amortizado; os baldes
+## vencidos são zerados ao avançar). A janela efetiva fica entre `segundos` menos a largura de
+## um balde e `segundos`. As janelas usam o relógio monotônico e não são persistidas.
+## Uso:
+##   motor = MotorVelocidade([
+##       RegraVelocidade("pix_conta_10min", ("pix",), "conta", 600, max_quantidade=10, max_valor=2_000),
+##       RegraVelocidade("pix_destino_10min", ("pix",), "chave_destino", 600, max_quantidade=50),
+##   ])
+##   banco = Banco(velocidade=motor)
+
+import math
+import threading
+import time
+from collections import namedtuple
+
+BALDES = 10
+
+# Operação de cada tipo de transação verificado
+OPERACOES = {"Saque": "saque", "Deposito": "deposito", "Transferencia_Origem": "pix"}
+ESCOPOS = ("conta", "chave_destino")
+
+RegraVelocidade = namedtuple(
+    "RegraVelocidade", "nome operacoes escopo segundos max_quantidade max_valor", defaults=(None, None)
+)
+
+
+class JanelaDeslizante:
+    __slots__ = ('_largura', '_quantidades', '_somas', '_balde_atual', '_quantidade', '_soma')
+
+    def __init__(self, segundos, baldes=BALDES):
+        self._largura = segundos / baldes
+        self._quantidades = [0] * baldes
+        self._somas = [0] * baldes
+        self._balde_atual = None  # Número absoluto (instante // largura) do balde mais recente
+        self._quantidade = 0  # Totais dos baldes dentro da janela
+        self._soma = 0
+
+    def avancar(self, instante):
+        # Desloca a janela até o instante; devolve o balde atual e os totais da janela
+        balde = int(instante // self._largura)
+        atual = self._balde_atual
+        if balde == atual:
+            return balde, self._quantidade, self._soma
+
+        baldes = len(self._quantidades)
+        if atual is None or balde - atual >= baldes:
+            self._quantidades = [0] * baldes
+            self._somas = [0] * baldes
+            self._quantidade = self._soma = 0
+        elif balde > atual:
+            # Zera os baldes que saíram da janela
+            for vencido in range(atual + 1, balde + 1):
+                posicao = vencido % baldes
+                self._quantidade -= self._quantidades[posicao]
+                self._soma -= self._somas[posicao]
+                self._quantidades[posicao] = self._somas[posicao] = 0
+        else:
+            return atual, self._quantidade, self._soma
+
+        self._balde_atual = balde
+        return balde, self._quantidade, self._soma
+
+    def contar(self, balde, valor):
+        # Conta uma operação no balde atual, devolvido por avancar()
+        posicao = balde % len(self._quantidades)
+        self._quantidades[posicao] += 1
+        self._somas[posicao] += valor
+        self._quantidade += 1
+        self._soma += valor
+
+    def desfazer(self, balde, valor):
+        # Remove uma operação contada em `balde`, se ele ainda estiver dentro da janela
+        if self._balde_atual - balde < len(self._quantidades):
+            posicao = balde % len(self._quantidades)
+            self._quantidades[posicao] -= 1
+            self._somas[posicao] -= valor
+            self._quantidade -= 1
+            self._soma -= valor
+
+
+class MotorVelocidade:
+    def __init__(self, regras, baldes=BALDES, relogio=time.monotonic):
+        self._regras = list(regras)
+        self._baldes = baldes
+        self._relogio = relogio
+        self._trava = threading.Lock()  # As janelas por chave de destino são compartilhadas entre contas
+        # Tipo de transação -> [(regra, máximo de operações, máximo em centavos, escopo por conta, janelas por chave)]
+        self._por_tipo = {}
+
+        for regra in self._regras:
+            if regra.escopo not in ESCOPOS:
+                raise ValueError(f"escopo inválido na regra {regra.nome}: {regra.escopo}")
+            # Limites ausentes viram infinitos, para que a verificação não precise testá-los
+            maximo_quantidade = math.inf if regra.max_quantidade is None else regra.max_quantidade
+            maximo_centavos = math.inf if regra.max_valor is None else round(regra.max_valor * 100)
+            janelas = {}
+            for tipo, operacao in OPERACOES.items():
+                if operacao in regra.operacoes:
+                    self._por_tipo.setdefault(tipo, []).append(
+                        (regra, maximo_quantidade, maximo_centavos, regra.escopo == "conta", janelas))
+
+    @property
+    def regras(self):
+        return self._regras
+
+    def autorizar(self, conta, transacao, chave_destino=None):
+        # Devolve (regra violada, None) ou (None, reserva); a operação autorizada já fica contada
+        # nas janelas e a reserva permite desfazê-la se a transação não for concluída
+        regras = self._por_tipo.get(transacao.__class__.__name__)
+        if regras is None:
+            return None, None
+
+        instante = self._relogio()
+        centavos = round(transacao.valor * 100)
+        da_conta = (conta.agencia, conta.numero)
+        reserva = []
+
+        with self._trava:
+            for regra, maximo_quantidade, maximo_centavos, por_conta, janelas in regras:
+                chave = da_conta if por_conta else chave_destino
+                if chave is None:
+                    continue
+
+                janela = janelas.get(chave)
+                if janela is None:
+                    janela = janelas[chave] = JanelaDeslizante(regra.segundos, self._baldes)
+
+                balde, quantidade, soma = janela.avancar(instante)
+                if quantidade >= maximo_quantidade or soma + centavos > maximo_centavos:
+                    return regra, None
+                reserva.append((janela, balde, centavos))
+
+            for janela, balde, _ in reserva:
+                janela.contar(balde, centavos)
+        return None, reserva
+
+    def cancelar(self, reserva):
+        with self._trava:
+            for janela, balde, centavos in reserva:
+                janela.desfazer(balde, centavos)
+
+    def descartar_inativas(self):
+        # Remove as janelas sem operações no período, liberando a memória de contas e chaves ociosas
+        instante = self._relogio()
+        with self._trava:
+            for regras in self._por_tipo.values():
+                for *_, janelas in regras:
+                    for chave in [chave for chave, janela in janelas.items() if janela.avancar(instante)[1] == 0]:
+                        del janelas[chave]
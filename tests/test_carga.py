@@ -0,0 +1,39 @@
+import itertools
+import json
+from collections import Counter
+
+from sistema_bancario.carga import VALORES, PerfilCarga, gerar_cadastro, gerar_operacoes, main, reproduzir
+
+PERFIL = PerfilCarga(contas=50, taxa=10_000.0)
+
+
+def test_mesma_semente_gera_as_mesmas_operacoes():
+    assert list(gerar_operacoes(PERFIL, 500, semente=7)) == list(gerar_operacoes(PERFIL, 500, semente=7))
+    assert list(gerar_operacoes(PERFIL, 500, semente=7)) != list(gerar_operacoes(PERFIL, 500, semente=8))
+
+
+def test_operacoes_seguem_o_perfil():
+    operacoes = list(gerar_operacoes(PERFIL, 5_000))
+    instantes = [dados["instante"] for dados in operacoes]
+    assert instantes == sorted(instantes)
+    assert all(0 < dados["valor"] <= VALORES[dados["operacao"]][2] for dados in operacoes)
+
+    tipos = Counter(dados["operacao"] for dados in operacoes)
+    assert tipos["deposito"] > tipos["saque"] > tipos["pix"] > 0
+    # Zipf: a conta mais usada concentra bem mais operações que a média
+    contas = Counter(dados["numero"] for dados in operacoes)
+    assert contas.most_common(1)[0][1] > 5 * len(operacoes) / PERFIL.contas
+
+
+def test_reproducao_aplica_o_cadastro_e_todas_as_operacoes():
+    carga = itertools.chain(gerar_cadastro(PERFIL), gerar_operacoes(PERFIL, 300))
+    resultado = reproduzir(carga, trabalhadores=4, aceleracao=100.0)
+    assert resultado["operacoes"] == 300 == resultado["sucessos"] + resultado["falhas"]
+    assert resultado["sucessos"] > 0 and resultado["latencia_maxima_us"] >= resultado["latencia_p50_us"]
+
+
+def test_arquivo_gerado_reproduz_a_mesma_carga(capsys):
+    main(["gerar", "--operacoes", "20", "--contas", "5", "--semente", "3"])
+    linhas = [json.loads(linha) for linha in capsys.readouterr().out.splitlines()]
+    perfil = PerfilCarga(contas=5)
+    assert linhas == list(gerar_cadastro(perfil)) + list(gerar_operacoes(perfil, 20, semente=3))
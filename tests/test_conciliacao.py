@@ -0,0 +1,43 @@
+import pytest
+
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.nucleo import Banco
+
+conciliacao = pytest.importorskip("sistema_bancario.conciliacao")
+pytest.importorskip("numpy")
+
+
+def criar_banco(contas):
+    banco = Banco(sink=SinkNulo())
+    for numero in range(1, contas + 1):
+        cpf = f"{numero:011d}"
+        banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(cpf, numero, ("0001", "0002")[numero % 2])
+    return banco
+
+
+def test_banco_vazio_gera_relatorio_vazio():
+    relatorio = conciliacao.conciliar(Banco(sink=SinkNulo()))
+    assert (relatorio["contas"], relatorio["transacoes"], relatorio["agencias"], relatorio["dias"]) == (0, 0, {}, {})
+    assert relatorio["divergencias"] == []
+    assert relatorio["banco"]["fluxo_liquido"] == 0
+
+
+def test_contas_sem_transacoes_no_inicio_do_dia():
+    relatorio = conciliacao.conciliar(criar_banco(4))
+    assert relatorio["contas"] == 4 and relatorio["transacoes"] == 0
+    assert relatorio["dias"] == {} and relatorio["divergencias"] == []
+    assert {agencia: dados["saldo"] for agencia, dados in relatorio["agencias"].items()} == {"0001": 0.0, "0002": 0.0}
+
+
+def test_conciliacao_confere_saldos_e_aponta_divergencias():
+    banco = criar_banco(4)
+    for numero in range(1, 5):
+        banco.registrar_deposito(numero, ("0001", "0002")[numero % 2], 100.0)
+    banco.registrar_saque(1, "0002", 30.0)
+    banco.contas[3].restaurar(1.0, "ativo")
+
+    relatorio = conciliacao.conciliar(banco)
+    assert relatorio["transacoes"] == 5
+    assert relatorio["banco"]["fluxo_liquido"] == pytest.approx(370.0)
+    assert [(divergencia["numero"], divergencia["soma_historico"]) for divergencia in relatorio["divergencias"]] == [(4, 100.0)]
@@ -0,0 +1,41 @@
+import random
+
+from sistema_bancario.concorrente import BancoConcorrente
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.nucleo import Banco
+
+
+def test_pix_concorrentes_conservam_o_total():
+    gerador = random.Random(7)
+    with BancoConcorrente(Banco(sink=SinkNulo()), trabalhadores=8) as banco:
+        cadastro = []
+        for numero in range(1, 21):
+            cpf = f"{numero:011d}"
+            cadastro += [("adicionar_cliente", (cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1"))]
+        banco.executar(cadastro)
+        banco.executar([("criar_conta", (f"{numero:011d}", numero, "0001")) for numero in range(1, 21)])
+        banco.banco.registrar_chaves_pix(((numero, "0001", "cpf", f"{numero:011d}") for numero in range(1, 21)), validar=False)
+        banco.executar([("depositar", (numero, "0001", 100.0)) for numero in range(1, 21)])
+
+        resultados = banco.executar([
+            ("pix", (gerador.randint(1, 20), "0001", float(gerador.randint(1, 200)), f"{gerador.randint(1, 20):011d}", "cpf"))
+            for _ in range(2_000)
+        ])
+
+    # Cada conta faz no máximo 5 PIX por dia: as demais tentativas são recusadas
+    assert sum(resultados) == 100
+    assert sum(conta.saldo for conta in banco.banco.contas) == 2_000.0
+
+
+def test_pix_repassa_o_tipo_da_chave():
+    with BancoConcorrente(Banco(sink=SinkNulo()), trabalhadores=2) as banco:
+        for numero in (1, 2):
+            banco.adicionar_cliente(f"{numero:011d}", f"Cliente {numero}", "01/01/1990", "Rua Teste, 1").result()
+            banco.criar_conta(f"{numero:011d}", numero, "0001").result()
+        # 11 dígitos sem "+": sem o tipo, a chave seria procurada como CPF
+        banco.banco.registrar_chaves_pix([(2, "0001", "telefone", "11987654321")], validar=False)
+        banco.depositar(1, "0001", 100.0).result()
+
+        assert not banco.pix(1, "0001", 10.0, "11987654321").result()
+        assert banco.pix(1, "0001", 10.0, "11987654321", "telefone").result()
+    assert [conta.saldo for conta in banco.banco.contas] == [90.0, 10.0]
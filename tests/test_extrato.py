@@ -0,0 +1,44 @@
+import pytest
+
+from sistema_bancario.servidor import ServidorBancario
+
+from .test_pix import criar_banco
+
+
+@pytest.fixture
+def banco():
+    banco = criar_banco()
+    for valor in range(1, 5):
+        banco.registrar_deposito(1, "0001", float(valor))
+    return banco
+
+
+def test_paginas_percorrem_todo_o_extrato(banco):
+    valores, cursor = [], 0
+    while cursor is not None:
+        pagina, cursor = banco.pagina_extrato(1, "0001", cursor=cursor, limite=2)
+        valores += [transacao["valor"] for transacao in pagina]
+    assert valores == [1_000.0, 1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.parametrize("limite", [0, -3])
+def test_limite_invalido_e_recusado(banco, limite):
+    with pytest.raises(ValueError):
+        banco.pagina_extrato(1, "0001", cursor=0, limite=limite)
+
+
+def test_deslocamento_negativo_e_recusado(banco):
+    with pytest.raises(ValueError):
+        list(banco.consultar_extrato(1, "0001", cursor=2, deslocamento=-2))
+
+
+def test_deslocamento_alem_do_periodo_nao_gera_transacoes(banco):
+    historico = banco.filtrar_conta(1, "0001").historico
+    assert list(historico.consultar(deslocamento=10, limite=2)) == []
+    assert banco.pagina_extrato(1, "0001", cursor=50) == ([], None)
+
+
+@pytest.mark.parametrize("requisicao", [{"cursor": 0, "limite": -3}, {"cursor": 0, "limite": 0}, {"limite": -1}])
+def test_servidor_recusa_limite_invalido(banco, requisicao):
+    resposta = ServidorBancario(banco).atender({"operacao": "extrato", "numero": 1, "agencia": "0001", **requisicao})
+    assert resposta["sucesso"] is False
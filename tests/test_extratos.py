@@ -0,0 +1,43 @@
+from array import array
+
+from sistema_bancario.nucleo import CacheExtratos
+
+from .test_pix import criar_banco
+
+
+def sem_cache(conta):
+    return [CacheExtratos.formatar(transacao) for transacao in conta.historico.transacoes]
+
+
+def test_linhas_em_cache_acompanham_o_historico():
+    banco, cache = criar_banco(), CacheExtratos()
+    conta = banco.filtrar_conta(1, "0001")
+    assert cache.extrato(conta) == (1_000.0, sem_cache(conta))
+
+    banco.registrar_saque(1, "0001", 100.0)
+    banco.realizar_pix(1, "0001", 50.0, "cliente2@banco.com", "email")
+    saldo, linhas = cache.extrato(conta)
+    assert (saldo, linhas) == (850.0, sem_cache(conta)) and len(linhas) == 3
+
+
+def test_historico_restaurado_refaz_as_linhas():
+    banco, cache = criar_banco(), CacheExtratos()
+    conta = banco.filtrar_conta(1, "0001")
+    banco.registrar_deposito(1, "0001", 20.0)
+    cache.extrato(conta)
+
+    tipos, valores, instantes = conta.historico.colunas()
+    conta.historico.restaurar_colunas(array('b', tipos[:1]), array('q', [12_345]), array('d', instantes[:1]))
+    assert cache.extrato(conta)[1] == sem_cache(conta) == [sem_cache(conta)[0]]
+    assert "R$ 123.45" in cache.extrato(conta)[1][0]
+
+
+def test_cache_descarta_a_conta_usada_ha_mais_tempo(capsys):
+    banco, cache = criar_banco(), CacheExtratos(capacidade=1)
+    primeira, segunda = banco.contas
+    cache.extrato(primeira)
+    cache.extrato(segunda)
+    assert len(cache) == 1 and cache.extrato(primeira)[1] == sem_cache(primeira)
+
+    banco.exibir_extrato(1, "0001")
+    assert sem_cache(primeira)[0] in capsys.readouterr().out
@@ -0,0 +1,44 @@
+import threading
+
+from .test_pix import criar_banco
+
+
+def test_instantaneo_mantem_o_estado_do_momento_em_que_foi_aberto():
+    banco = criar_banco()
+    with banco.instantaneo() as instantaneo:
+        assert banco.realizar_pix(1, "0001", 250.0, "cliente2@banco.com", "email")
+        assert banco.registrar_deposito(2, "0001", 10.0)
+        banco.adicionar_cliente("00000000003", "Cliente 3", "01/01/1990", "Rua Teste, 3")
+        banco.criar_conta("00000000003", 3, "0001")
+
+        assert instantaneo.quantidade_contas == 2 and len(list(instantaneo.clientes())) == 2
+        assert [instantaneo.estado(conta) for conta in instantaneo.contas()] == [(1_000.0, "ativo", 1), (0.0, "ativo", 0)]
+
+    # Fechado, o instantâneo não preserva mais as contas alteradas
+    assert banco.registrar_deposito(1, "0001", 1.0)
+    assert [instantaneo.estado(conta)[0] for conta in instantaneo.contas()] == [1_000.0, 0.0]
+    with banco.instantaneo() as atual:
+        assert [atual.estado(conta)[0] for conta in atual.contas()] == [751.0, 260.0, 0.0]
+
+
+def test_soma_pelo_instantaneo_e_exata_durante_pix():
+    banco = criar_banco()
+    total = sum(conta.saldo for conta in banco.contas)
+    parar = threading.Event()
+
+    def escrever():
+        while not parar.is_set():
+            banco.realizar_pix(1, "0001", 1.0, "cliente2@banco.com", "email")
+            banco.realizar_pix(2, "0001", 1.0, "cliente1@banco.com", "email")
+            for conta in banco.contas:
+                conta.contadores.restaurar(None, {})
+
+    escritora = threading.Thread(target=escrever)
+    escritora.start()
+    try:
+        for _ in range(500):
+            with banco.instantaneo() as instantaneo:
+                assert sum(instantaneo.estado(conta)[0] for conta in instantaneo.contas()) == total
+    finally:
+        parar.set()
+        escritora.join()
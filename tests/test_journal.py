@@ -0,0 +1,89 @@
+import json
+import os
+import time
+
+from sistema_bancario import journal as journal_modulo
+from sistema_bancario.concorrente import BancoConcorrente
+from sistema_bancario.journal import abrir_banco, listar_segmentos
+
+
+def estado(banco):
+    return [(conta.numero, conta.agencia, conta.saldo, [transacao["valor"] for transacao in conta.historico.transacoes])
+            for conta in banco.contas]
+
+
+def movimentar(banco):
+    assert banco.realizar_pix(1, "0001", 250.0, "cliente2@banco.com", "email")
+    assert banco.registrar_saque(2, "0001", 50.0)
+    assert not banco.realizar_pix(2, "0001", -10.0, "cliente1@banco.com", "email")
+
+
+def test_journal_recupera_o_estado_depois_de_reiniciar(tmp_path):
+    banco, journal = abrir_banco(str(tmp_path))
+    for numero in (1, 2):
+        banco.adicionar_cliente(f"{numero:011d}", f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(f"{numero:011d}", numero, "0001")
+    banco.registrar_chaves_pix(((numero, "0001", "email", f"cliente{numero}@banco.com") for numero in (1, 2)), validar=False)
+    banco.registrar_deposito(1, "0001", 1_000.0)
+    movimentar(banco)
+    esperado = estado(banco)
+    journal.fechar()
+
+    reaberto, journal = abrir_banco(str(tmp_path))
+    assert estado(reaberto) == esperado == [(1, "0001", 750.0, [1_000.0, 250.0]), (2, "0001", 200.0, [250.0, 50.0])]
+    assert reaberto.realizar_pix(2, "0001", 200.0, "cliente1@banco.com", "email")
+    journal.fechar()
+
+    reaberto, journal = abrir_banco(str(tmp_path))
+    assert estado(reaberto)[0][2] == 950.0
+    journal.fechar()
+
+
+def linhas_gravadas(diretorio):
+    return [json.loads(linha) for _, caminho in listar_segmentos(diretorio) for linha in open(caminho, encoding="utf-8")]
+
+
+def test_operacao_concluida_ja_esta_sincronizada(tmp_path):
+    banco, journal = abrir_banco(str(tmp_path), intervalo_sincronizacao=60)
+    banco.adicionar_cliente("00000000001", "Cliente 1", "01/01/1990", "Rua Teste, 1")
+    banco.criar_conta("00000000001", 1, "0001")
+    assert banco.registrar_deposito(1, "0001", 10.0)
+
+    assert [linha[1] for linha in linhas_gravadas(str(tmp_path))] == ["cliente", "conta", "transacao"]
+    journal.fechar()
+
+
+def test_group_commit_confirma_varias_threads_com_um_fsync(tmp_path, monkeypatch):
+    fsyncs = []
+    fsync = os.fsync
+
+    def contar_fsync(descritor):
+        fsyncs.append(descritor)
+        time.sleep(0.002)
+        fsync(descritor)
+
+    banco, journal = abrir_banco(str(tmp_path), intervalo_sincronizacao=60)
+    for numero in range(1, 9):
+        banco.adicionar_cliente(f"{numero:011d}", f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(f"{numero:011d}", numero, "0001")
+    monkeypatch.setattr(journal_modulo.os, "fsync", contar_fsync)
+
+    with BancoConcorrente(banco, trabalhadores=8) as concorrente:
+        assert all(concorrente.executar([("depositar", (numero % 8 + 1, "0001", 1.0)) for numero in range(400)]))
+
+    assert len(linhas_gravadas(str(tmp_path))) == 16 + 400
+    assert len(fsyncs) < 400
+    journal.fechar()
+
+
+def test_confirmacao_assincrona_sincroniza_no_fechamento(tmp_path):
+    banco, journal = abrir_banco(str(tmp_path), intervalo_sincronizacao=60, confirmacao_assincrona=True)
+    banco.adicionar_cliente("00000000001", "Cliente 1", "01/01/1990", "Rua Teste, 1")
+    banco.criar_conta("00000000001", 1, "0001")
+    banco.registrar_deposito(1, "0001", 10.0)
+    assert linhas_gravadas(str(tmp_path)) == []
+    journal.fechar()
+
+    reaberto, journal = abrir_banco(str(tmp_path))
+    assert reaberto.filtrar_conta(1, "0001").saldo == 10.0
+    journal.fechar()
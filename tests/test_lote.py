@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from sistema_bancario.lote import ProcessadorLote, main
+
+CADASTRO = [
+    {"operacao": "cliente", "cpf": "00000000001", "nome": "Cliente 1", "data_nascimento": "01/01/1990", "endereco": "Rua 1"},
+    {"operacao": "cliente", "cpf": "00000000002", "nome": "Cliente 2", "data_nascimento": "01/01/1990", "endereco": "Rua 2"},
+    {"operacao": "conta", "cpf": "00000000001", "agencia": "0001", "numero": 1},
+    {"operacao": "conta", "cpf": "00000000002", "agencia": "0001", "numero": 2},
+    {"operacao": "chave", "agencia": "0001", "numero": 2, "tipo": "email", "chave": "cliente2@banco.com"},
+    {"operacao": "deposito", "agencia": "0001", "numero": 1, "valor": "100"},
+]
+
+
+@pytest.mark.parametrize("operacao", ["deposito", "saque", "pix"])
+@pytest.mark.parametrize("valor", ["1e17", "inf", "nan", "-5", "0"])
+def test_valor_invalido_e_recusado_antes_de_chegar_ao_banco(operacao, valor):
+    processador = ProcessadorLote()
+    processador.executar(CADASTRO)
+
+    sucesso, erro = processador.aplicar({"operacao": operacao, "agencia": "0001", "numero": 1, "valor": valor,
+                                         "chave": "cliente2@banco.com", "tipo_chave": "email"})
+    assert not sucesso and erro.startswith("valor inválido")
+    assert [conta.saldo for conta in processador.banco.contas] == [100.0, 0.0]
+
+
+def test_linha_invalida_nao_interrompe_o_arquivo(tmp_path, capsys):
+    operacoes = [*CADASTRO,
+                 {"operacao": "deposito", "agencia": "0001", "numero": 1, "valor": "1e17"},
+                 {"operacao": "deposito", "agencia": "0001", "numero": 1, "valor": "50"}]
+    arquivo = tmp_path / "operacoes.jsonl"
+    arquivo.write_text("".join(json.dumps(dados) + "\n" for dados in operacoes), encoding="utf-8")
+
+    main([str(arquivo), "--resultados", "-"])
+    resultados = [json.loads(linha) for linha in capsys.readouterr().out.splitlines()]
+    assert [resultado["sucesso"] for resultado in resultados[-2:]] == [False, True]
+
+
+def test_linha_malformada_ou_que_nao_e_objeto_vira_falha(tmp_path, capsys):
+    arquivo = tmp_path / "operacoes.jsonl"
+    arquivo.write_text("".join(json.dumps(dados) + "\n" for dados in CADASTRO)
+                       + '{"operacao": "deposito", "agencia"\n[1]\n3\n"deposito"\n'
+                       + json.dumps({"operacao": "deposito", "agencia": "0001", "numero": 1, "valor": "50"}) + "\n",
+                       encoding="utf-8")
+
+    main([str(arquivo), "--resultados", "-"])
+    saida = capsys.readouterr()
+    resultados = [json.loads(linha) for linha in saida.out.splitlines()]
+    assert [resultado["sucesso"] for resultado in resultados[len(CADASTRO):]] == [False, False, False, False, True]
+    assert resultados[len(CADASTRO)]["erro"].startswith("JSON inválido")
+    assert "Falhas: 4" in saida.err
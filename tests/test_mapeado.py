@@ -0,0 +1,50 @@
+import pytest
+
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.mapeado import ArmazemSaldos, BancoMapeado
+
+from .test_pix import criar_banco
+
+
+def abrir(caminho):
+    return criar_banco(lambda **opcoes: BancoMapeado(caminho, **opcoes), saldo=500.0)
+
+
+def test_saldos_status_e_contadores_voltam_do_arquivo(tmp_path):
+    caminho = str(tmp_path / "saldos.dat")
+    banco = abrir(caminho)
+    assert banco.realizar_pix(1, "0001", 120.0, "cliente2@banco.com", "email")
+    assert banco.registrar_saque(1, "0001", 30.0)
+    banco.filtrar_conta(2, "0001").restaurar(120.0, "inativo")
+    banco.fechar()
+
+    # Contas criadas de novo, com os mesmos (agência, número), voltam com os valores gravados
+    reaberto = BancoMapeado(caminho, sink=SinkNulo())
+    assert reaberto.saldo_total() == 470.0
+    for numero in (1, 2):
+        reaberto.adicionar_cliente(f"{numero:011d}", f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        reaberto.criar_conta(f"{numero:011d}", numero, "0001")
+    origem, destino = reaberto.contas
+    assert (origem.saldo, destino.saldo, destino.status) == (350.0, 120.0, "inativo")
+    assert [origem.contadores.contagem(tipo) for tipo in ("Saque", "Transferencia_Origem")] == [1, 1]
+    assert len(reaberto.armazem) == 2
+    reaberto.fechar()
+
+
+def test_arquivo_cresce_alem_da_capacidade_inicial(tmp_path):
+    caminho = str(tmp_path / "saldos.dat")
+    armazem = ArmazemSaldos(caminho, capacidade_inicial=4)
+    slots = [armazem.slot("0001", numero, f"{numero:011d}") for numero in range(1, 101)]
+    assert slots == list(range(100)) and armazem.slot("0001", 7, "00000000007") == 6
+    armazem.fechar()
+
+    reaberto = ArmazemSaldos(caminho)
+    assert len(reaberto) == 100 and reaberto.slot("0001", 100, "00000000100") == 99
+    reaberto.fechar()
+
+
+def test_arquivo_de_outro_formato_e_recusado(tmp_path):
+    caminho = tmp_path / "outro.dat"
+    caminho.write_bytes(b"X" * 64)
+    with pytest.raises(ValueError):
+        ArmazemSaldos(str(caminho))
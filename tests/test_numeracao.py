@@ -0,0 +1,62 @@
+import threading
+
+from sistema_bancario.interface import InterfaceBancaria
+from sistema_bancario.journal import abrir_banco
+from sistema_bancario.mapeado import BancoMapeado
+from sistema_bancario.numeracao import AlocadorNumeros
+from sistema_bancario.sqlite import BancoSQLite
+
+from .test_pix import criar_banco
+
+
+def test_numeros_sao_unicos_entre_threads():
+    alocador = AlocadorNumeros(tamanho_bloco=7)
+    numeros = [[] for _ in range(8)]
+
+    def alocar(lista):
+        lista.extend(alocador.proximo("0001") for _ in range(500))
+
+    threads = [threading.Thread(target=alocar, args=(lista,)) for lista in numeros]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    todos = [numero for lista in numeros for numero in lista]
+    assert len(set(todos)) == len(todos) == 4_000
+    assert alocador.proximo("0002") == 1
+
+
+def test_arquivo_mantem_numeros_unicos_entre_reinicios(tmp_path):
+    arquivo = str(tmp_path / "numeracao.json")
+    anteriores = [AlocadorNumeros(arquivo, tamanho_bloco=10).proximo("0001") for _ in range(3)]
+    assert anteriores == [1, 11, 21]
+    assert AlocadorNumeros(arquivo, tamanho_bloco=10).proximo("0001") == 31
+
+
+def test_interface_continua_a_numeracao_depois_das_contas_restauradas(tmp_path):
+    banco, journal = abrir_banco(str(tmp_path / "journal"))
+    banco.adicionar_cliente("00000000001", "Cliente 1", "01/01/1990", "Rua Teste, 1")
+    for numero, agencia in ((1, "0001"), (2, "0001"), (5, "0002")):
+        banco.criar_conta("00000000001", numero, agencia)
+    journal.fechar()
+
+    reaberto, journal = abrir_banco(str(tmp_path / "journal"))
+    alocador = AlocadorNumeros()
+    InterfaceBancaria(alocador, reaberto)
+    assert (alocador.proximo("0001"), alocador.proximo("0002"), alocador.proximo("0003")) == (3, 6, 1)
+    journal.fechar()
+
+
+def test_contas_gravadas_e_nao_carregadas_tambem_contam(tmp_path):
+    caminho = str(tmp_path / "banco.db")
+    criar_banco(lambda **opcoes: BancoSQLite(caminho, **opcoes)).fechar()
+    reaberto = BancoSQLite(caminho)
+    assert not reaberto.contas and reaberto.ultimos_numeros() == {"0001": 2}
+    reaberto.fechar()
+
+    mapeado = criar_banco(lambda **opcoes: BancoMapeado(str(tmp_path / "saldos.dat"), **opcoes))
+    mapeado.fechar()
+    reaberto = BancoMapeado(str(tmp_path / "saldos.dat"))
+    assert reaberto.ultimos_numeros() == {"0001": 2}
+    reaberto.fechar()
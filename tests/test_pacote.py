@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+import sistema_bancario
+
+
+def executar(codigo):
+    return subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout.split()
+
+
+def submodulos_carregados(codigo):
+    return executar(f"import sys, sistema_bancario\n{codigo}\n"
+                    "print(*sorted(nome for nome in sys.modules if nome.startswith('sistema_bancario.')))")
+
+
+def test_importar_o_pacote_nao_carrega_os_submodulos():
+    assert submodulos_carregados("") == []
+    carregados = submodulos_carregados("sistema_bancario.Banco")
+    assert "sistema_bancario.nucleo" in carregados
+    assert not {"sistema_bancario.interface", "sistema_bancario.journal", "sistema_bancario.sqlite"} & set(carregados)
+
+
+def test_nomes_exportados_vem_dos_submodulos():
+    from sistema_bancario.nucleo import Banco
+    from sistema_bancario.validadores import validar_cpf
+
+    assert sistema_bancario.Banco is Banco and sistema_bancario.validar_cpf is validar_cpf
+    assert all(hasattr(sistema_bancario, nome) for nome in sistema_bancario.__all__)
+    assert set(sistema_bancario.__all__) <= set(dir(sistema_bancario))
+
+
+def test_nome_desconhecido_levanta_attribute_error():
+    with pytest.raises(AttributeError):
+        sistema_bancario.NaoExiste
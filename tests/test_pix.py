@@ -0,0 +1,97 @@
+import math
+
+import pytest
+
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.nucleo import Banco, ContaCorrente
+
+
+class Ouvinte:
+    def __init__(self):
+        self.transacoes = []
+
+    def cliente_adicionado(self, cliente):
+        pass
+
+    def conta_criada(self, conta):
+        pass
+
+    def chave_pix_registrada(self, conta, tipo, chave):
+        pass
+
+    def transacao_registrada(self, conta, transacao, indice):
+        self.transacoes.append((conta.numero, type(transacao).__name__, transacao.valor))
+
+
+def criar_banco(classe=Banco, saldo=1_000.0):
+    banco = classe(sink=SinkNulo())
+    for numero in (1, 2):
+        cpf = f"{numero:011d}"
+        banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(cpf, numero, "0001")
+    banco.registrar_chaves_pix(((numero, "0001", "email", f"cliente{numero}@banco.com") for numero in (1, 2)), validar=False)
+    banco.registrar_deposito(1, "0001", saldo)
+    return banco
+
+
+def saldos(banco):
+    return [conta.saldo for conta in banco.contas]
+
+
+def test_pix_transfere_o_valor_e_conserva_o_total():
+    banco = criar_banco()
+    assert banco.realizar_pix(1, "0001", 250.0, "cliente2@banco.com", "email")
+    assert saldos(banco) == [750.0, 250.0]
+    assert [len(conta.historico) for conta in banco.contas] == [2, 1]
+
+
+@pytest.mark.parametrize("valor", [-100.0, 0.0, math.nan, math.inf, -math.inf])
+def test_pix_com_valor_invalido_e_recusado_sem_alterar_saldos(valor):
+    banco = criar_banco(saldo=0.0)
+    banco.contas[0].restaurar(0.0, "ativo")
+    ouvinte = Ouvinte()
+    banco.adicionar_ouvinte(ouvinte)
+
+    assert not banco.realizar_pix(1, "0001", valor, "cliente2@banco.com", "email")
+    assert saldos(banco) == [0.0, 0.0]
+    assert ouvinte.transacoes == []
+
+
+class ContaSemCredito(ContaCorrente):
+    __slots__ = ()
+
+    def receber_pix(self, valor):
+        return False
+
+
+class BancoSemCredito(Banco):
+    def _nova_conta(self, cliente, numero, agencia):
+        return (ContaSemCredito if numero == 2 else ContaCorrente)(cliente, numero, agencia)
+
+
+def test_pix_cujo_credito_falha_desfaz_o_debito():
+    banco = criar_banco(BancoSemCredito)
+    origem = banco.contas[0]
+    ouvinte = Ouvinte()
+    banco.adicionar_ouvinte(ouvinte)
+
+    assert not banco.realizar_pix(1, "0001", 250.0, "cliente2@banco.com", "email")
+    assert saldos(banco) == [1_000.0, 0.0]
+    assert len(origem.historico) == 1
+    assert origem.contadores.contagem("Transferencia_Origem") == 0
+    assert ouvinte.transacoes == []
+
+
+def test_pix_para_a_propria_conta_notifica_cada_registro_do_historico():
+    banco = criar_banco()
+    registros = []
+
+    class OuvinteIndices(Ouvinte):
+        def transacao_registrada(self, conta, transacao, indice):
+            registros.append((type(transacao).__name__, conta.historico.transacao(indice)["tipo"]))
+
+    banco.adicionar_ouvinte(OuvinteIndices())
+    assert banco.realizar_pix(1, "0001", 10.0, "cliente1@banco.com", "email")
+    assert registros == [("Transferencia_Origem", "Transferencia_Origem"),
+                         ("Transferencia_Destino", "Transferencia_Destino")]
+    assert saldos(banco) == [1_000.0, 0.0]
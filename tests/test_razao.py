@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from sistema_bancario import razao
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.nucleo import Historico
+from sistema_bancario.razao import EVENTO, BancoRazao, caminho_particao
+
+
+@pytest.fixture(params=["numpy", "python"])
+def implementacao(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(razao, "np", None)
+    elif razao.np is None:
+        pytest.skip("numpy não instalado")
+    return request.param
+
+
+def abrir(diretorio):
+    return BancoRazao(str(diretorio), processos=1, sink=SinkNulo())
+
+
+def criar_conta(banco, numero):
+    cpf = f"{numero:011d}"
+    banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+    banco.criar_conta(cpf, numero, "0001")
+
+
+def test_eventos_orfaos_nao_passam_para_a_proxima_conta(tmp_path, implementacao):
+    banco = abrir(tmp_path)
+    criar_conta(banco, 1)
+    banco.registrar_deposito(1, "0001", 10.0)
+    banco.fechar()
+
+    # Evento da conta de número 1, cujo cadastro se perdeu em uma queda
+    with open(caminho_particao(str(tmp_path), 1), "ab") as particao:
+        particao.write(EVENTO.pack(1, Historico.CODIGOS["Deposito"], 99_900, time.time()))
+
+    banco = abrir(tmp_path)
+    criar_conta(banco, 2)
+    assert banco.filtrar_conta(2, "0001").saldo == 0.0
+    banco.fechar()
+
+    banco = abrir(tmp_path)
+    assert [conta.saldo for conta in banco.contas] == [10.0, 0.0]
+    assert len(banco.filtrar_conta(2, "0001").historico) == 0
+    banco.fechar()
+
+
+def estado(banco):
+    return [(conta.numero, conta.saldo, conta.contadores.estado(), [bytes(coluna) for coluna in conta.historico.colunas()])
+            for conta in banco.contas]
+
+
+@pytest.mark.parametrize("processos", [1, 3])
+def test_estado_sobrevive_a_reabertura(tmp_path, implementacao, processos):
+    banco = abrir(tmp_path)
+    for numero in range(1, 11):
+        criar_conta(banco, numero)
+    banco.registrar_chaves_pix(((numero, "0001", "email", f"cliente{numero}@banco.com") for numero in range(1, 11)),
+                               validar=False)
+    for numero in range(1, 11):
+        banco.registrar_deposito(numero, "0001", 100.0 * numero)
+        banco.registrar_saque(numero, "0001", 10.0)
+        banco.realizar_pix(numero, "0001", 5.0, f"cliente{numero % 10 + 1}@banco.com", "email")
+    antes = estado(banco)
+    total = sum(conta.saldo for conta in banco.contas)
+    banco.fechar()
+
+    reaberto = BancoRazao(str(tmp_path), processos=processos, sink=SinkNulo())
+    assert estado(reaberto) == antes
+    assert reaberto.projecoes(processos).posicoes["00000000003"] == round(antes[2][1] * 100)
+    assert sum(conta.saldo for conta in reaberto.contas) == pytest.approx(total)
+    reaberto.fechar()
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from sistema_bancario.servidor import ConexaoBancaria, ServidorBancario
+
+from .test_pix import criar_banco
+
+
+class Transporte:
+    def __init__(self):
+        self.escrito = b""
+        self.fechado = False
+
+    def write(self, dados):
+        self.escrito += dados
+
+    def close(self):
+        self.fechado = True
+
+
+@pytest.mark.parametrize("requisicao", [
+    '{"operacao": "extrato", "numero": 1e400, "agencia": "0001"}',
+    '{"operacao": "extrato", "numero": 1, "agencia": "0001", "limite": 1e400}',
+    '{"operacao": "extrato", "numero": 1, "agencia": "0001", "cursor": -1e400}',
+    '{"operacao": "deposito", "numero": 1e400, "agencia": "0001", "valor": 10}',
+])
+def test_numero_nao_finito_e_recusado(requisicao):
+    resposta = json.loads(ServidorBancario(criar_banco()).responder(requisicao))
+    assert resposta["sucesso"] is False and "inválid" in resposta["erro"]
+
+
+def test_requisicao_invalida_nao_descarta_as_demais_respostas_do_bloco():
+    servidor = ServidorBancario(criar_banco())
+    conexao, transporte = ConexaoBancaria(servidor), Transporte()
+    conexao.connection_made(transporte)
+
+    conexao.data_received(
+        b'{"id": 1, "operacao": "deposito", "numero": 1, "agencia": "0001", "valor": 10}\n'
+        b'{"id": 2, "operacao": "extrato", "numero": 1e400, "agencia": "0001"}\n'
+        b'{"id": 3, "operacao": "extrato", "numero": 1, "agencia": "0001", "limite": 1}\n'
+    )
+    respostas = [json.loads(linha) for linha in transporte.escrito.decode().splitlines()]
+    assert [(resposta["id"], resposta["sucesso"]) for resposta in respostas] == [(1, True), (2, False), (3, True)]
+    assert respostas[2]["saldo"] == 1_010.0 and not transporte.fechado
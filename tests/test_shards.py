@@ -0,0 +1,42 @@
+import math
+
+import pytest
+
+from sistema_bancario.shards import BancoParticionado
+
+
+@pytest.fixture(params=[3, 2], ids=["um_shard_por_agencia", "agencias_compartilhadas"])
+def banco(request):
+    with BancoParticionado(shards=request.param) as banco:
+        operacoes = []
+        for numero, agencia in enumerate(("0001", "0002", "0003"), start=1):
+            cpf = f"{numero:011d}"
+            operacoes += [
+                ("adicionar_cliente", (cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")),
+                ("criar_conta", (cpf, numero, agencia)),
+                ("registrar_chave_pix", (numero, agencia, "email", f"cliente{numero}@banco.com")),
+                ("registrar_deposito", (numero, agencia, 1_000.0)),
+            ]
+        assert all(banco.executar(operacoes))
+        yield banco
+
+
+def test_pix_entre_shards_conserva_o_total(banco):
+    resultados = banco.executar([
+        ("realizar_pix", (1, "0001", 300.0, "cliente2@banco.com")),
+        ("realizar_pix", (2, "0002", 900.0, "cliente3@banco.com")),
+        ("realizar_pix", (3, "0003", 100.0, "cliente1@banco.com")),
+        ("registrar_saque", (3, "0003", 50.0)),
+    ])
+
+    assert resultados == [True, True, True, True]
+    assert [banco.consultar_saldo(numero, agencia) for numero, agencia in ((1, "0001"), (2, "0002"), (3, "0003"))] == [800.0, 400.0, 1_750.0]
+    assert banco.saldo_total() == 2_950.0
+
+
+@pytest.mark.parametrize("valor", [5_000.0, -100.0, 0.0, math.nan, math.inf])
+def test_pix_recusado_entre_shards_nao_altera_saldos(banco, valor):
+    assert not banco.realizar_pix(1, "0001", valor, "cliente2@banco.com")
+    assert not banco.realizar_pix(1, "0001", valor, "cliente3@banco.com")
+    assert [banco.consultar_saldo(numero, agencia) for numero, agencia in ((1, "0001"), (2, "0002"), (3, "0003"))] == [1_000.0] * 3
+    assert banco.saldo_total() == 3_000.0
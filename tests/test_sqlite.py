@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+
+from sistema_bancario.sqlite import BancoSQLite, PersistenciaSQLite
+
+from .test_journal import estado, movimentar
+from .test_pix import criar_banco
+
+
+def test_sqlite_recupera_o_estado_depois_de_reiniciar(tmp_path):
+    caminho = str(tmp_path / "banco.db")
+    banco = criar_banco(lambda **opcoes: BancoSQLite(caminho, **opcoes))
+    movimentar(banco)
+    esperado = estado(banco)
+    banco.fechar()
+
+    reaberto = BancoSQLite(caminho)
+    contas = [reaberto.filtrar_conta(numero, "0001") for numero in (1, 2)]
+    assert [(conta.saldo, len(conta.historico)) for conta in contas] == [(750.0, 2), (200.0, 2)]
+    assert estado(reaberto) == esperado
+    assert reaberto.realizar_pix(2, "0001", 200.0, "cliente1@banco.com", "email")
+    reaberto.fechar()
+
+
+def test_conta_gravada_nao_pode_ser_recriada_depois_de_reiniciar(tmp_path):
+    caminho = str(tmp_path / "banco.db")
+    banco = criar_banco(lambda **opcoes: BancoSQLite(caminho, **opcoes), saldo=500.0)
+    banco.fechar()
+
+    reaberto = BancoSQLite(caminho)
+    assert reaberto.criar_conta("00000000001", 1, "0001") is None
+    assert reaberto.registrar_deposito(1, "0001", 10.0)
+    reaberto.fechar()
+
+    reaberto = BancoSQLite(caminho)
+    conta = reaberto.filtrar_conta(1, "0001")
+    assert (conta.saldo, [transacao["valor"] for transacao in conta.historico.transacoes]) == (510.0, [500.0, 10.0])
+    assert reaberto.criar_conta("00000000001", 3, "0001") is not None
+    reaberto.fechar()
+
+
+def test_colisao_de_indice_de_transacao_falha_o_lote(tmp_path):
+    persistencia = PersistenciaSQLite(str(tmp_path / "banco.db"), intervalo_sincronizacao=60)
+    linha = ("0001", 1, 0, 0, 1_000, 0.0)
+    persistencia._transacoes += [linha, linha]
+    with pytest.raises(sqlite3.IntegrityError):
+        persistencia.sincronizar()
+    persistencia.fechar()
@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.nucleo import Banco, Historico, VALOR_MAXIMO
+
+
+def criar_banco():
+    banco = Banco(sink=SinkNulo())
+    banco.adicionar_cliente("00000000001", "Cliente 1", "01/01/1990", "Rua Teste, 1")
+    banco.criar_conta("00000000001", 1, "0001")
+    return banco, banco.contas[0]
+
+
+def colunas_alinhadas(historico):
+    return len({len(coluna) for coluna in historico.colunas()}) == 1
+
+
+@pytest.mark.parametrize("valor", [1e17, math.inf, math.nan, -1.0, 0.0, VALOR_MAXIMO * 10])
+def test_deposito_fora_do_intervalo_e_recusado_sem_alterar_a_conta(valor):
+    banco, conta = criar_banco()
+    assert not banco.registrar_deposito(1, "0001", valor)
+    assert conta.saldo == 0.0
+    assert len(conta.historico) == 0 and colunas_alinhadas(conta.historico)
+
+
+@pytest.mark.parametrize("valor", [1e17, math.inf, math.nan])
+def test_saque_fora_do_intervalo_e_recusado_sem_alterar_a_conta(valor):
+    banco, conta = criar_banco()
+    banco.registrar_deposito(1, "0001", 100.0)
+    assert not banco.registrar_saque(1, "0001", valor)
+    assert conta.saldo == 100.0
+    assert len(conta.historico) == 1 and colunas_alinhadas(conta.historico)
+
+
+def test_deposito_do_valor_maximo_e_aceito():
+    banco, conta = criar_banco()
+    assert banco.registrar_deposito(1, "0001", float(VALOR_MAXIMO))
+    assert conta.historico.registro(0)[1] == VALOR_MAXIMO * 100
+
+
+def test_registro_fora_do_intervalo_nao_altera_nenhuma_coluna():
+    historico = Historico()
+    with pytest.raises(OverflowError):
+        historico.adicionar_registro(Historico.CODIGOS["Deposito"], 10 ** 19, 0.0)
+    assert len(historico) == 0 and colunas_alinhadas(historico)
@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+from sistema_bancario.eventos import SinkNulo
+from sistema_bancario.nucleo import Banco
+from sistema_bancario.velocidade import MotorVelocidade, RegraVelocidade
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def criar_banco(*regras):
+    relogio = Relogio()
+    banco = Banco(sink=SinkNulo(), velocidade=MotorVelocidade(regras, relogio=relogio))
+    for numero in (1, 2):
+        cpf = f"{numero:011d}"
+        banco.adicionar_cliente(cpf, f"Cliente {numero}", "01/01/1990", "Rua Teste, 1")
+        banco.criar_conta(cpf, numero, "0001")
+    banco.registrar_chaves_pix(((numero, "0001", "email", f"cliente{numero}@banco.com") for numero in (1, 2)), validar=False)
+    return banco, relogio
+
+
+def test_regra_por_conta_limita_quantidade_e_valor_na_janela():
+    banco, relogio = criar_banco(
+        RegraVelocidade("deposito_conta", ("deposito",), "conta", 60, max_quantidade=3, max_valor=500),
+    )
+    assert [banco.registrar_deposito(1, "0001", valor) for valor in (100.0, 300.0, 150.0)] == [True, True, False]
+    assert banco.registrar_deposito(1, "0001", 100.0)
+    assert not banco.registrar_deposito(1, "0001", 1.0)
+    assert banco.registrar_deposito(2, "0001", 100.0)
+
+    relogio.agora = 61.0
+    assert banco.registrar_deposito(1, "0001", 500.0)
+    assert banco.filtrar_conta(1, "0001").saldo == 1_000.0
+
+
+def test_regra_por_chave_de_destino_e_compartilhada_entre_contas():
+    banco, _ = criar_banco(RegraVelocidade("pix_destino", ("pix",), "chave_destino", 60, max_quantidade=1))
+    banco.registrar_deposito(1, "0001", 100.0)
+    assert banco.realizar_pix(1, "0001", 10.0, "cliente2@banco.com", "email")
+    assert not banco.realizar_pix(1, "0001", 10.0, "cliente2@banco.com", "email")
+    assert banco.realizar_pix(2, "0001", 10.0, "cliente1@banco.com", "email")
+
+
+def test_operacao_recusada_pela_conta_nao_consome_a_janela():
+    banco, _ = criar_banco(RegraVelocidade("saque_conta", ("saque",), "conta", 60, max_quantidade=1))
+    assert not banco.registrar_saque(1, "0001", 10.0)
+    banco.registrar_deposito(1, "0001", 10.0)
+    assert banco.registrar_saque(1, "0001", 10.0)
+
+
+@pytest.mark.parametrize("valor", [math.nan, math.inf, -math.inf, 1e300])
+def test_valor_invalido_com_regra_ativa_e_recusado_sem_excecao(valor):
+    banco, _ = criar_banco(
+        RegraVelocidade("saque_deposito", ("saque", "deposito"), "conta", 60, max_quantidade=2, max_valor=1_000),
+    )
+    assert not banco.registrar_deposito(1, "0001", valor)
+    assert not banco.registrar_saque(1, "0001", valor)
+    assert [banco.registrar_deposito(1, "0001", 100.0) for _ in range(3)] == [True, True, False]